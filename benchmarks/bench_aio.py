@@ -0,0 +1,90 @@
+"""
+    Latency benchmark of `stringhelpers.aio`.
+
+    Processes a large payload inside an event loop, calling the plain helpers
+    directly and awaiting their versions in `stringhelpers.aio`, while a
+    heartbeat task measures how long the event loop is stalled, as the
+    longest delay of a 1 ms sleep.
+
+    Run with: python benchmarks/bench_aio.py
+"""
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import stringhelpers  # noqa: E402
+from stringhelpers import aio  # noqa: E402
+
+LINE = 'GET /index.html 200 - Mozilla/5.0 (X11; Linux) summer_08 ERROR ok\n'
+SIZE = 4 * 1024 * 1024
+CHUNK_SIZE = 256 * 1024
+
+
+def nested(text):
+    return [[line, [line]] for line in text.split('\n')]
+
+
+async def heartbeat(stalls):
+    while True:
+        start = time.perf_counter()
+        await asyncio.sleep(0.001)
+        stalls.append(time.perf_counter() - start - 0.001)
+
+
+async def source(text):
+    for i in range(0, len(text), CHUNK_SIZE):
+        await asyncio.sleep(0)
+        yield text[i:i + CHUNK_SIZE]
+
+
+async def replace(text):
+    return ''.join([piece async for piece in
+                    aio.ireplace('error', 'warning', source(text))])
+
+
+async def measure(name, coroutine_function, text):
+    stalls = [0.0]
+    beat = asyncio.ensure_future(heartbeat(stalls))
+    await asyncio.sleep(0.01)
+    start = time.perf_counter()
+    await coroutine_function(text)
+    elapsed = time.perf_counter() - start
+    # Let the heartbeat record the last stall.
+    await asyncio.sleep(0.01)
+    beat.cancel()
+    print('  {0:<28} {1:7.3f}s  longest stall {2:8.2f} ms'.format(
+        name, elapsed, max(stalls) * 1e3))
+
+
+async def main():
+    text = LINE * (SIZE // len(LINE))
+
+    async def direct_count(text):
+        return stringhelpers.count('error', text, literal=True)
+
+    async def direct_replace(text):
+        return stringhelpers.ireplace('error', 'warning', text)
+
+    async def direct_flatten(text):
+        return stringhelpers.flatten(nested(text))
+
+    async def aio_count(text):
+        return await aio.count('error', source(text))
+
+    async def aio_flatten(text):
+        return await aio.flatten(nested(text), threshold=1)
+
+    print('{0} MiB payload'.format(SIZE // (1024 * 1024)))
+    await measure('count (direct)', direct_count, text)
+    await measure('count (aio)', aio_count, text)
+    await measure('ireplace (direct)', direct_replace, text)
+    await measure('ireplace (aio)', replace, text)
+    await measure('flatten (direct)', direct_flatten, text)
+    await measure('flatten (aio)', aio_flatten, text)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,50 @@
+"""
+    Benchmark of `stringhelpers.batch`.
+
+    Compares a Python loop over the single string helpers against the batch
+    helpers, on both lists and (if NumPy is installed) NumPy string arrays.
+
+    Run with: python benchmarks/bench_batch.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import stringhelpers  # noqa: E402
+from stringhelpers import batch  # noqa: E402
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+HELPERS = ['upcase', 'downcase', 'dasherize', 'strip_slashes', 'truncate']
+
+
+def best(func, repeat=3):
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main():
+    size = 1000000
+    strings = ['/summer_%d pictures of the year/' % i for i in range(size)]
+    array = numpy.array(strings) if numpy is not None else None
+    print('{0} strings'.format(size))
+    for name in HELPERS:
+        helper = getattr(stringhelpers, name)
+        batch_helper = getattr(batch, name)
+        loop = best(lambda: [helper(string) for string in strings])
+        listed = best(lambda: batch_helper(strings))
+        line = '  {0:<14} loop {1:7.3f}s  list {2:7.3f}s  ({3:5.0f} M/s)'\
+            .format(name, loop, listed, size / listed / 1e6)
+        if array is not None:
+            vectorized = best(lambda: batch_helper(array))
+            line += '  array {0:7.3f}s  ({1:5.0f} M/s)'.format(
+                vectorized, size / vectorized / 1e6)
+        print(line)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""
+    Benchmark of the helpers on ASCII bytes.
+
+    Compares decoding a buffer, calling the helper and encoding the result
+    again, against passing the `bytes`, or a `memoryview` of them, to the
+    helper directly, and against writing the result into a reused
+    `bytearray` with `out`.
+
+    Writing into `out` keeps a long-lived buffer instead of allocating a new
+    result every time, but is not faster in itself, as the translated bytes
+    are still copied into it.
+
+    Run with: python benchmarks/bench_bytes.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stringhelpers import (count, dasherize, downcase, reverse,  # noqa: E402
+                           strip_slashes, upcase)
+
+LINE = b'/GET /index.html 200 - Mozilla/5.0 (X11; Linux) summer_08 ERROR ok/'
+
+
+def best(func):
+    timer = timeit.Timer(func)
+    number = timer.autorange()[0]
+    return min(timer.repeat(repeat=3, number=number)) / number
+
+
+def main():
+    for size in (64, 4096, 1024 * 1024):
+        data = (LINE * (size // len(LINE) + 1))[:size]
+        view = memoryview(data)
+        out = bytearray(size)
+        print('{0} bytes'.format(size))
+        cases = [
+            ('upcase', lambda: upcase(data.decode('ascii')).encode('ascii'),
+             lambda: upcase(data), lambda: upcase(view, out=out)),
+            ('downcase',
+             lambda: downcase(data.decode('ascii')).encode('ascii'),
+             lambda: downcase(data), lambda: downcase(view, out=out)),
+            ('dasherize',
+             lambda: dasherize(data.decode('ascii')).encode('ascii'),
+             lambda: dasherize(data), lambda: dasherize(data, out=out)),
+            ('strip_slashes',
+             lambda: strip_slashes(data.decode('ascii')).encode('ascii'),
+             lambda: strip_slashes(data), lambda: strip_slashes(view)),
+            ('reverse',
+             lambda: reverse(data.decode('ascii')).encode('ascii'),
+             lambda: reverse(data), lambda: reverse(view)),
+            ('count', lambda: count('error', data.decode('ascii')),
+             lambda: count('error', data), lambda: count('error', view)),
+        ]
+        for name, decoded, native, zero_copy in cases:
+            before, after, view_time = best(decoded), best(native), \
+                best(zero_copy)
+            print('  {0:<14} decode/encode {1:10.2f} us  bytes {2:10.2f} us'
+                  '  ({3:5.1f}x)  view/out {4:10.2f} us  ({5:5.1f}x)'.format(
+                      name, before * 1e6, after * 1e6, before / after,
+                      view_time * 1e6, before / view_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""
+    Benchmark of the memoized helpers in `stringhelpers.cached`.
+
+    Runs `humanize()` and `camelize()` uncached, and memoized with the LRU and
+    TinyLFU policies, over three traces of strings:
+
+    * hit-heavy: a few popular strings, drawn from a Zipf-like distribution,
+    * miss-heavy: strings which are all different,
+    * scan: popular strings mixed with long runs of strings seen only once,
+      which push the popular ones out of an LRU cache.
+
+    On short strings the bookkeeping of the cache costs about as much as the
+    cheaper helpers themselves, so it is the slower helpers, and the longer
+    strings, which gain from being memoized.
+
+    Run with: python benchmarks/bench_cached.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stringhelpers import camelize, humanize  # noqa: E402
+from stringhelpers.cached import memoize  # noqa: E402
+
+CALLS = 200000
+MAXSIZE = 1000
+
+
+def hit_heavy():
+    names = ['summer_%d-pictures.tar.gz' % i for i in range(5000)]
+    weights = [1.0 / (i + 1) for i in range(len(names))]
+    return random.Random(1).choices(names, weights, k=CALLS)
+
+
+def miss_heavy():
+    return ['summer_%d-pictures.tar.gz' % i for i in range(CALLS)]
+
+
+def scan():
+    generator = random.Random(2)
+    popular = ['popular_%d-title.txt' % i for i in range(MAXSIZE // 2)]
+    trace = []
+    while len(trace) < CALLS:
+        trace.extend(generator.choice(popular) for i in range(2000))
+        trace.extend('once_%d_%d.txt' % (len(trace), i) for i in range(2000))
+    return trace[:CALLS]
+
+
+def run(function, trace):
+    start = time.perf_counter()
+    for string in trace:
+        function(string)
+    return time.perf_counter() - start
+
+
+def main():
+    for trace_name, trace in [('hit-heavy', hit_heavy()),
+                              ('miss-heavy', miss_heavy()),
+                              ('scan', scan())]:
+        print(trace_name)
+        for helper in (humanize, camelize):
+            baseline = run(helper, trace)
+            print('  {0:<10} {1:<8} {2:6.0f} ns/call'.format(
+                helper.__name__, 'uncached', baseline / CALLS * 1e9))
+            for policy in ('lru', 'tinylfu'):
+                memoized = memoize(helper, maxsize=MAXSIZE, policy=policy)
+                seconds = run(memoized, trace)
+                info = memoized.cache_info()
+                print('  {0:<10} {1:<8} {2:6.0f} ns/call  {3:5.1f}x  '
+                      'hit ratio {4:5.1%}  {5:7d} evictions  {6:8d} bytes'
+                      .format(helper.__name__, policy,
+                              seconds / CALLS * 1e9, baseline / seconds,
+                              info.hits / float(CALLS), info.evictions,
+                              info.currbytes))
+
+
+if __name__ == '__main__':
+    main()
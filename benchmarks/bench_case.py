@@ -0,0 +1,75 @@
+"""
+    Benchmark of the case conversion helpers.
+
+    Compares `camelize()` and `upcase_first_letter()` against their previous
+    versions, the `to_snake()` family against the usual two regular
+    expression substitutions, and the `stringhelpers.batch` versions against
+    calling the helpers in a loop, on short and long strings.
+
+    Run with: python benchmarks/bench_case.py
+"""
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stringhelpers import (batch, camelize, to_camel, to_kebab,  # noqa: E402
+                           to_snake, to_title, upcase_first_letter)
+
+WORDS = ['getHTTPResponse', 'summer_08', 'a lizard', 'that-slithers', 'Straße']
+
+
+def old_camelize(string):
+    return ' '.join(s[0].upper() + s[1:] for s in string.split())
+
+
+def old_upcase_first_letter(string):
+    alpha = re.compile(r"[^\W\s\d]", re.UNICODE)
+    letter = alpha.search(string).group()
+    return string.replace(letter, letter.upper(), 1)
+
+
+def regex_snake(string):
+    string = re.sub(r'([A-Z]+)([A-Z][a-z])', r'\1_\2', string)
+    string = re.sub(r'([a-z0-9])([A-Z])', r'\1_\2', string)
+    return re.sub(r'[\W_]+', '_', string).strip('_').lower()
+
+
+def best(func):
+    timer = timeit.Timer(func)
+    number = timer.autorange()[0]
+    return min(timer.repeat(repeat=3, number=number)) / number
+
+
+def main():
+    for size in (20, 2000, 200000):
+        string = ' '.join(WORDS * (size // 60 + 1))[:size]
+        strings = [' '.join(WORDS[i % 5:i % 5 + 2]) for i in range(size)]
+        print('{0} characters'.format(size))
+        cases = [
+            ('camelize', lambda: old_camelize(string),
+             lambda: camelize(string)),
+            ('upcase_first_letter',
+             lambda: old_upcase_first_letter('  ' + string),
+             lambda: upcase_first_letter('  ' + string)),
+            ('to_snake', lambda: regex_snake(string),
+             lambda: to_snake(string)),
+            ('batch.to_snake', lambda: [to_snake(s) for s in strings],
+             lambda: batch.to_snake(strings)),
+            ('batch.to_kebab', lambda: [to_kebab(s) for s in strings],
+             lambda: batch.to_kebab(strings)),
+            ('batch.to_camel', lambda: [to_camel(s) for s in strings],
+             lambda: batch.to_camel(strings)),
+            ('batch.to_title', lambda: [to_title(s) for s in strings],
+             lambda: batch.to_title(strings)),
+        ]
+        for name, before, after in cases:
+            old, new = best(before), best(after)
+            print('  {0:<20} before {1:10.2f} us  after {2:10.2f} us  '
+                  '({3:4.1f}x)'.format(name, old * 1e6, new * 1e6, old / new))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""
+    Benchmark of `python -m stringhelpers` against `sed`, `awk` and `grep`.
+
+    Writes a file of `--size` MiB of log lines (multi-GB inputs need
+    `--size 4096` or more, and as much free space in the temporary
+    directory), and times filtering it with the command line interface,
+    with one and several processes, against the equivalent `sed`, `awk` and
+    `grep` commands, writing to /dev/null.
+
+    Run with: python benchmarks/bench_cli.py [--size MIB] [--jobs N]
+"""
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LINES = [
+    'GET /static/Summer_08 Pictures.tar.gz 200 - Mozilla/5.0 (X11; Linux)\n',
+    'POST /api/singing_in_the rain 500 ERROR upstream timed out\n',
+    'GET /index.html 304 - curl/7.68.0 no error here\n',
+]
+
+CASES = [
+    ('downcase + dasherize', ['-e', 'downcase', '-e', 'dasherize'],
+     ['sed', 's/[_ ]/-/g; s/.*/\\L&/']),
+    ('humanize + truncate',
+     ['-e', 'humanize:remove_file_extension=False', '-e', 'truncate:40'],
+     ['awk', '{ gsub(/[-_]/, " "); $0 = toupper(substr($0, 1, 1)) '
+             'substr($0, 2); if (length($0) > 40) $0 = substr($0, 1, 37) '
+             '"..."; print }']),
+    ('count error', ['-e', 'count:error', '--total'],
+     ['sh', '-c', 'grep -oi error "$0" | wc -l']),
+]
+
+
+def run(command, path):
+    start = time.perf_counter()
+    with open(path, 'rb') as input, open(os.devnull, 'wb') as output:
+        if command[0] == 'sh':
+            subprocess.check_call(command + [path], stdout=output)
+        else:
+            subprocess.check_call(command, stdin=input, stdout=output)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--size', type=int, default=256,
+                        help='MiB of input to generate (default: 256)')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1)
+    options = parser.parse_args()
+    os.environ['PYTHONPATH'] = ROOT
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'input.log')
+        block = ''.join(LINES * 4096).encode('utf-8')
+        with open(path, 'wb') as file:
+            for _ in range(options.size * 1048576 // len(block) + 1):
+                file.write(block)
+        size = os.path.getsize(path) / 1048576.0
+        print('{0:.0f} MiB of input, {1} jobs'.format(size, options.jobs))
+        for name, arguments, equivalent in CASES:
+            helpers = [sys.executable, '-m', 'stringhelpers'] + arguments
+            timings = [('stringhelpers', run(helpers, path))]
+            if options.jobs > 1:
+                timings.append(('-j {0}'.format(options.jobs), run(
+                    helpers + ['-j', str(options.jobs)], path)))
+            if shutil.which(equivalent[0]):
+                timings.append((equivalent[0] if equivalent[0] != 'sh'
+                                else 'grep', run(equivalent, path)))
+            print('  ' + name)
+            for label, seconds in timings:
+                print('    {0:<14} {1:8.2f}s  {2:8.1f} MiB/s'.format(
+                    label, seconds, size / seconds))
+
+
+if __name__ == '__main__':
+    main()
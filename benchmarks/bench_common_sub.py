@@ -0,0 +1,62 @@
+"""
+    Benchmark of `common_sub()`.
+
+    Compares the previous list based implementation against the hash based
+    one, and times the `substring` and `subsequence` modes, on growing lists
+    of words.
+
+    Run with: python benchmarks/bench_common_sub.py
+"""
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stringhelpers import common_sub  # noqa: E402
+
+
+def list_common_sub(object1, object2):
+    return [item for item in object1 if item in object2] or None
+
+
+def words(size, vocabulary=5000):
+    return ['word%d' % random.randrange(vocabulary) for i in range(size)]
+
+
+def best(func, repeat=3):
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main():
+    random.seed(0)
+    print('default mode')
+    for size in (1000, 2000, 4000, 8000):
+        object1, object2 = words(size), words(size)
+        print('  {0:>7} words  list {1:8.4f}s  hash {2:8.4f}s  '
+              'longest {3:8.4f}s'.format(
+                  size, best(lambda: list_common_sub(object1, object2)),
+                  best(lambda: common_sub(object1, object2)),
+                  best(lambda: common_sub(object1, object2, "longest"))))
+    for size in (100000, 200000, 400000):
+        object1, object2 = words(size), words(size)
+        print('  {0:>7} words  hash {1:8.4f}s'.format(
+            size, best(lambda: common_sub(object1, object2))))
+
+    print('substring and subsequence modes')
+    for size in (1000, 2000, 4000, 8000):
+        object1, object2 = words(size, 50), words(size, 50)
+        print('  {0:>7} words  substring {1:8.4f}s  subsequence {2:8.4f}s'
+              .format(size,
+                      best(lambda: common_sub(object1, object2, "substring")),
+                      best(lambda: common_sub(object1, object2,
+                                              "subsequence"))))
+    for size in (100000, 200000, 400000):
+        object1, object2 = words(size), words(size)
+        print('  {0:>7} words  substring {1:8.4f}s'.format(
+            size, best(lambda: common_sub(object1, object2, "substring"))))
+
+
+if __name__ == '__main__':
+    main()
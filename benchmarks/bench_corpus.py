@@ -0,0 +1,79 @@
+"""
+    Benchmark of finding the documents of a corpus sharing the most, and the
+    longest, words with a text.
+
+    Compares calling `common_sub()` against every document against querying
+    a `CorpusIndex`, and reports the time to build, save and load the index,
+    and the size of the saved index against the size of the documents.
+
+    Run with: python benchmarks/bench_corpus.py
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stringhelpers import CorpusIndex, common_sub  # noqa: E402
+
+VOCABULARY = ['word{0}'.format(i) + 'x' * (i % 9) for i in range(20000)]
+
+
+def best(func):
+    timer = timeit.Timer(func)
+    number = timer.autorange()[0]
+    return min(timer.repeat(repeat=3, number=number)) / number
+
+
+def scan_most_common(text, documents, top_k):
+    counts = [(len(common_sub(text, document) or ()), key)
+              for key, document in enumerate(documents)]
+    return sorted(counts, reverse=True)[:top_k]
+
+
+def scan_longest(text, documents, top_k):
+    found = [(len(token), key) for key, token in
+             ((key, common_sub(text, document, sequence='longest'))
+              for key, document in enumerate(documents)) if token]
+    return sorted(found, reverse=True)[:top_k]
+
+
+def main():
+    generator = random.Random(8)
+    for size in (1000, 10000, 100000):
+        documents = [' '.join(generator.choice(VOCABULARY)
+                              for _ in range(50)) for _ in range(size)]
+        text = ' '.join(generator.choice(VOCABULARY) for _ in range(50))
+        start = time.perf_counter()
+        index = CorpusIndex(documents)
+        built = time.perf_counter() - start
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'corpus.idx')
+            start = time.perf_counter()
+            index.save(path)
+            saved = time.perf_counter() - start
+            start = time.perf_counter()
+            CorpusIndex.load(path)
+            loaded = time.perf_counter() - start
+            stored = os.path.getsize(path)
+        print('{0} documents: built in {1:.2f}s, saved in {2:.2f}s, loaded '
+              'in {3:.2f}s, {4:.1f} KiB on disk for {5:.1f} KiB of '
+              'text'.format(size, built, saved, loaded, stored / 1024.0,
+                            sum(map(len, documents)) / 1024.0))
+        cases = [
+            ('most common', lambda: scan_most_common(text, documents, 10),
+             lambda: index.most_common(text, top_k=10)),
+            ('longest shared', lambda: scan_longest(text, documents, 10),
+             lambda: index.longest_shared(text, top_k=10)),
+        ]
+        for name, before, after in cases:
+            old, new = best(before), best(after)
+            print('  {0:<16} common_sub {1:10.2f} ms  index {2:10.3f} ms  '
+                  '({3:7.1f}x)'.format(name, old * 1e3, new * 1e3, old / new))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+"""
+    Benchmark of `count()` and `count_many()`.
+
+    Compares counting a list of keywords with one `count()` call per keyword,
+    in both regex and literal mode, against a single `count_many()` pass.
+
+    Run with: python benchmarks/bench_count.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stringhelpers import count, count_many, pattern_cache_info  # noqa: E402
+
+WORDS = ['Lorem', 'ipsum', 'DOLOR', 'sit', 'Amet', 'consectetur', 'elit']
+
+
+def best(func, repeat=3):
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main():
+    string = ' '.join(WORDS * 20000)
+    for keywords in (10, 50, 100, 200):
+        items = ['word%d' % i for i in range(keywords - 2)] + ['dolor', 'sit']
+        regex = best(lambda: [count(item, string) for item in items])
+        literal = best(lambda: [count(item, string, literal=True)
+                                for item in items])
+        single = best(lambda: count_many(items, string))
+        print('{0:>4} keywords  regex {1:8.4f}s  literal {2:8.4f}s  '
+              'count_many {3:8.4f}s'.format(keywords, regex, literal, single))
+    print(pattern_cache_info())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""
+    Benchmark of `flatten()` and `iflatten()`.
+
+    Compares them against the previous recursive implementation of
+    `flatten()`, on both deeply and widely nested lists.
+
+    Run with: python benchmarks/bench_flatten.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stringhelpers import flatten, iflatten  # noqa: E402
+
+
+def recursive_flatten(list_to_flatten):
+    result = []
+    for item in list_to_flatten:
+        if hasattr(item, '__iter__') and not isinstance(item, str):
+            result.extend(recursive_flatten(item))
+        else:
+            result.append(item)
+    return result
+
+
+def deep(depth):
+    nested = ['leaf']
+    for i in range(depth):
+        nested = [nested, 'item%d' % (i % 100)]
+    return nested
+
+
+def wide(width):
+    return [['item%d' % (i % 100), ['item', i]] for i in range(width)]
+
+
+def best(func, repeat=3):
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def report(name, nested):
+    try:
+        recursive = '{0:8.4f}s'.format(
+            best(lambda: recursive_flatten(nested)))
+    except RuntimeError:  # RecursionError
+        recursive = ' too deep'
+    print('  {0:<16} recursive {1}  flatten {2:8.4f}s  '
+          'unique {3:8.4f}s  first item {4:.6f}s'.format(
+              name, recursive, best(lambda: flatten(nested)),
+              best(lambda: flatten(nested, remove_duplicates=True)),
+              best(lambda: next(iflatten(nested)))))
+
+
+def main():
+    print('deep nesting')
+    for depth in (100, 500, 900, 10000, 100000):
+        report('depth %d' % depth, deep(depth))
+    print('wide nesting')
+    for width in (10000, 100000, 1000000):
+        report('width %d' % width, wide(width))
+
+
+if __name__ == '__main__':
+    main()
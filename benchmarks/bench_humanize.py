@@ -0,0 +1,47 @@
+"""
+    Regression benchmark of `humanize()`.
+
+    Calls `humanize()` a million times, in ten rounds, and fails if the time
+    or memory used per call grows from the first round to the last one.
+
+    Run with: python benchmarks/bench_humanize.py
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stringhelpers import humanize  # noqa: E402
+
+CALLS = 1000000
+ROUNDS = 10
+
+
+def main():
+    strings = ['summer_%d-pictures.tar.gz' % i for i in range(100)]
+    per_round = CALLS // ROUNDS
+    timings = []
+    tracemalloc.start()
+    for i in range(ROUNDS):
+        start = time.perf_counter()
+        for j in range(per_round):
+            humanize(strings[j % 100])
+        timings.append(time.perf_counter() - start)
+        if i == 0:
+            baseline = tracemalloc.get_traced_memory()[0]
+    growth = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+
+    for i, seconds in enumerate(timings):
+        print('  round {0:>2}  {1:6.3f}s  {2:6.0f} ns/call'.format(
+            i + 1, seconds, seconds / per_round * 1e9))
+    print('  memory growth after the first round: {0} bytes'.format(growth))
+    assert min(timings[-3:]) < min(timings[:3]) * 1.5, \
+        'humanize() gets slower per call'
+    assert growth < 64 * 1024, 'humanize() leaks memory'
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""
+    Regression benchmark of the time it takes to import `stringhelpers`.
+
+    Imports `stringhelpers` in fresh interpreters with `-X importtime`, and
+    fails if importing it loads any of its submodules or the heavier standard
+    library modules they depend on, or if it takes longer than
+    `MAX_MICROSECONDS`.
+
+    Run with: python benchmarks/bench_import.py
+"""
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ROUNDS = 10
+MAX_MICROSECONDS = 2000
+
+# Modules which should only be imported once a helper needing them is used.
+LAZY = ['stringhelpers.case', 'stringhelpers.paths', 'stringhelpers.random',
+        'stringhelpers.search', 'stringhelpers.sequences', 'heapq', 'numpy',
+        'pickle', 'random', 're', 'tempfile']
+
+CODE = ('import sys, stringhelpers\n'
+        'print(" ".join(sorted(sys.modules)))\n')
+
+
+def import_time():
+    """Return the cumulative microseconds it took to import `stringhelpers`,
+    and the names of the modules loaded afterwards."""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', CODE],
+                            cwd=ROOT, capture_output=True, text=True,
+                            check=True)
+    for line in result.stderr.splitlines():
+        fields = [field.strip() for field in line.split('|')]
+        if len(fields) == 3 and fields[2] == 'stringhelpers':
+            return int(fields[1]), result.stdout.split()
+    raise RuntimeError('stringhelpers was not imported')
+
+
+def main():
+    timings = []
+    for i in range(ROUNDS):
+        microseconds, modules = import_time()
+        timings.append(microseconds)
+    best = min(timings)
+    loaded = [name for name in LAZY if name in modules]
+    print('  import stringhelpers  {0:6d} us (best of {1})'.format(
+        best, ROUNDS))
+    print('  lazy modules loaded: {0}'.format(', '.join(loaded) or 'none'))
+    assert not loaded, 'importing stringhelpers loads ' + ', '.join(loaded)
+    assert best < MAX_MICROSECONDS, 'importing stringhelpers is too slow'
+
+
+if __name__ == '__main__':
+    main()
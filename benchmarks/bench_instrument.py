@@ -0,0 +1,42 @@
+"""
+    Benchmark of the overhead of `stringhelpers.instrument`.
+
+    Times calls to some cheap helpers before the instrumentation is switched
+    on, while it is on, and after it is switched off again, where the first
+    and last should be the same.
+
+    Run with: python benchmarks/bench_instrument.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import stringhelpers  # noqa: E402
+from stringhelpers import instrument  # noqa: E402
+
+CALLS = 1000000
+
+
+def per_call(name, argument):
+    timer = timeit.Timer('helper(argument)', globals={
+        'helper': getattr(stringhelpers, name), 'argument': argument})
+    return min(timer.repeat(repeat=5, number=CALLS)) / CALLS * 1e9
+
+
+def main():
+    for name, argument in (('upcase', 'down here'), ('odd', 11),
+                           ('truncate', 'A Lizard That Slithers')):
+        before = per_call(name, argument)
+        instrument.enable([name])
+        enabled = per_call(name, argument)
+        instrument.disable()
+        after = per_call(name, argument)
+        print('{0:<10} before {1:6.1f} ns  enabled {2:6.1f} ns  '
+              'disabled {3:6.1f} ns  ({4:+.1%})'.format(
+                  name, before, enabled, after, after / before - 1))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""
+    Benchmark of `ireplace()` and `ireplace_many()`.
+
+    Both the input size and the number of patterns are doubled, where the
+    time per character should stay roughly flat if the replacing is linear.
+
+    Run with: python benchmarks/bench_ireplace.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stringhelpers import IReplacer, ireplace, ireplace_many  # noqa: E402
+
+WORDS = ['Lorem', 'ipsum', 'DOLOR', 'sit', 'Amet', 'consectetur', 'elit']
+
+
+def text(size):
+    words = (WORDS * (size // 40 + 1))
+    return ' '.join(words)[:size]
+
+
+def best(func, repeat=3):
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main():
+    print('input size scaling (one pattern)')
+    for size in (10000, 20000, 40000, 80000, 160000):
+        string = text(size)
+        seconds = best(lambda: ireplace('dolor', 'X', string))
+        print('  {0:>8} chars  {1:8.4f}s  {2:6.1f} ns/char'.format(
+            size, seconds, seconds / size * 1e9))
+
+    print('pattern count scaling (100000 chars)')
+    string = text(100000)
+    for patterns in (8, 16, 32, 64, 128, 256):
+        table = dict(('word%d' % i, str(i)) for i in range(patterns))
+        table.update({'dolor': 'X', 'amet': 'Y'})
+        replacer = IReplacer(table)
+        seconds = best(lambda: replacer.replace(string))
+        build = best(lambda: IReplacer(table))
+        print('  {0:>8} patterns  {1:8.4f}s  (build {2:.4f}s)'.format(
+            patterns, seconds, build))
+
+    print('repeated ireplace() calls vs one ireplace_many() pass')
+    table = dict((word, word.upper()) for word in WORDS)
+    string = text(100000)
+
+    def chained():
+        result = string
+        for old, new in table.items():
+            result = ireplace(old, new, result)
+        return result
+
+    print('  chained  {0:8.4f}s'.format(best(chained)))
+    print('  single   {0:8.4f}s'.format(
+        best(lambda: ireplace_many(table, string))))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""
+    Scaling benchmark of `stringhelpers.parallel.pmap()`.
+
+    Applies some of the CPU bound helpers to many items with 1 up to the
+    number of CPUs workers, and reports the speedup against a plain `map()`.
+
+    Run with: python benchmarks/bench_parallel.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stringhelpers import camelize, common_sub, humanize  # noqa: E402
+from stringhelpers.parallel import pmap  # noqa: E402
+
+
+def common_words(pair):
+    return common_sub(pair[0], pair[1])
+
+
+def longest_run(pair):
+    return common_sub(pair[0], pair[1], "substring")
+
+
+CASES = [
+    ('camelize', camelize,
+     ['a lizard that slithers %d times' % i for i in range(1000000)]),
+    ('humanize', humanize,
+     ['summer_%d-pictures.tar.gz' % i for i in range(1000000)]),
+    ('common_sub', common_words,
+     [('the quick brown fox %d jumps' % i, 'a quick dog jumps %d' % i)
+      for i in range(200000)]),
+    ('common_sub substring', longest_run,
+     [('the quick brown fox %d jumps' % i, 'a quick brown dog jumps %d' % i)
+      for i in range(50000)]),
+]
+
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    cpus = os.cpu_count() or 1
+    workers = sorted(set([1, 2, 4, 8, 16, cpus]) & set(range(1, cpus + 1)))
+    for name, func, items in CASES:
+        serial = timed(lambda: list(map(func, items)))
+        line = '{0:<22} map {1:6.2f}s'.format(name, serial)
+        for count in workers:
+            seconds = timed(lambda: list(pmap(func, items, workers=count)))
+            line += '  {0}w {1:4.2f}x'.format(count, serial / seconds)
+        print(line)
+
+
+if __name__ == '__main__':
+    main()
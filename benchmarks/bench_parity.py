@@ -0,0 +1,66 @@
+"""
+    Benchmark of `odd()`, `even()` and `partition_parity()` on many numbers.
+
+    Compares calling `odd()` on every number in a Python loop, like it used to
+    be done, against passing the whole list, `array.array` or NumPy array to
+    it at once, and splitting the numbers into odd and even ones in a loop
+    against `partition_parity()`.
+
+    Run with: python benchmarks/bench_parity.py
+"""
+import array
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stringhelpers import odd, partition_parity  # noqa: E402
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def best(func):
+    timer = timeit.Timer(func)
+    number = timer.autorange()[0]
+    return min(timer.repeat(repeat=3, number=number)) / number
+
+
+def loop_partition(numbers):
+    odds, evens = [], []
+    for number in numbers:
+        (odds if odd(number) else evens).append(number)
+    return odds, evens
+
+
+def main():
+    for size in (100, 10 ** 4, 10 ** 6):
+        numbers = list(range(-size // 2, size // 2))
+        ints = array.array('q', numbers)
+        print('{0} numbers'.format(size))
+        cases = [
+            ('odd(list)', lambda: odd(numbers)),
+            ('odd(array)', lambda: odd(ints)),
+            ('odd(array, filtered)', lambda: odd(ints, filtered=True)),
+            ('partition_parity', lambda: partition_parity(numbers)),
+        ]
+        if numpy is not None:
+            ndarray = numpy.array(numbers)
+            cases.append(('odd(ndarray)', lambda: odd(ndarray)))
+        loop = best(lambda: [odd(number) for number in numbers])
+        split = best(lambda: loop_partition(numbers))
+        print('  {0:<22} {1:10.2f} us'.format('loop of odd()', loop * 1e6))
+        print('  {0:<22} {1:10.2f} us'.format('loop partition',
+                                              split * 1e6))
+        for name, func in cases:
+            elapsed = best(func)
+            baseline = split if name == 'partition_parity' else loop
+            print('  {0:<22} {1:10.2f} us  ({2:6.1f}x)'.format(
+                name, elapsed * 1e6, baseline / elapsed))
+
+
+if __name__ == '__main__':
+    main()
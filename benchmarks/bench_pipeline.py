@@ -0,0 +1,51 @@
+"""
+    Benchmark of `Pipeline`.
+
+    Compares chaining the helpers by hand against the same chain as a
+    `Pipeline`, where the adjacent character mapping helpers are fused.
+
+    Run with: python benchmarks/bench_pipeline.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stringhelpers import (Pipeline, dasherize, downcase, humanize,  # noqa
+                           truncate, upcase)
+
+CHAINS = [
+    ('humanize > downcase > dasherize > truncate',
+     [humanize, downcase, dasherize, (truncate, {'length': 20})]),
+    ('upcase > dasherize > humanize(no ext) > downcase',
+     [upcase, dasherize, (humanize, {'remove_file_extension': False}),
+      downcase]),
+]
+
+
+def unfused(steps, string):
+    for step in steps:
+        if isinstance(step, tuple):
+            string = step[0](string, **step[1])
+        else:
+            string = step(string)
+    return string
+
+
+def best(func, repeat=3):
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main():
+    strings = ['Summer_%d-Pictures of the year.tar.gz' % i
+               for i in range(300000)]
+    for name, steps in CHAINS:
+        pipeline = Pipeline(*steps)
+        print('{0}\n  unfused {1:7.3f}s  pipeline {2:7.3f}s'.format(
+            name, best(lambda: [unfused(steps, string) for string in strings]),
+            best(lambda: list(pipeline.map(strings)))))
+
+
+if __name__ == '__main__':
+    main()
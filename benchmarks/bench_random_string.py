@@ -0,0 +1,41 @@
+"""
+    Benchmark of `random_string()` and `random_strings()`.
+
+    Compares generating tokens one at a time, with the previous
+    `random.choice()` loop and with `random_string()`, against generating them
+    in bulk with `random_strings()`.
+
+    Run with: python benchmarks/bench_random_string.py
+"""
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stringhelpers import CHOICES, random_string, random_strings  # noqa: E402
+
+
+def choice_string(length):
+    return ''.join(random.choice(CHOICES) for i in range(length))
+
+
+def best(func, repeat=3):
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main():
+    for n in (10000, 100000, 1000000):
+        print('{0:>8} tokens of 16  choice loop {1:7.3f}s  '
+              'random_string {2:7.3f}s  random_strings {3:7.3f}s  '
+              'not secure {4:7.3f}s  unique {5:7.3f}s'.format(
+                  n, best(lambda: [choice_string(16) for i in range(n)], 1),
+                  best(lambda: [random_string(16) for i in range(n)], 1),
+                  best(lambda: random_strings(n, 16)),
+                  best(lambda: random_strings(n, 16, secure=False)),
+                  best(lambda: random_strings(n, 16, unique=True))))
+
+
+if __name__ == '__main__':
+    main()
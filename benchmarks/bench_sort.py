@@ -0,0 +1,57 @@
+"""
+    Benchmark of `sort()` with and without `max_memory`.
+
+    Sorts growing numbers of random words, both in memory and in chunks
+    spilled to temporary files, where each case runs in its own process to
+    report its peak resident memory.
+
+    Run with: python benchmarks/bench_sort.py
+"""
+import os
+import random
+import resource
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from stringhelpers import sort  # noqa: E402
+
+
+def words(size):
+    generator = random.Random(size)
+    for i in range(size):
+        yield 'word%d' % generator.randrange(size)
+
+
+def child(mode, size):
+    start = time.perf_counter()
+    if mode == 'memory':
+        for word in sort(list(words(size))):
+            pass
+    else:
+        for word in sort(words(size), max_memory=16 * 1024 * 1024):
+            pass
+    seconds = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+    print('{0:.3f} {1:.0f}'.format(seconds, peak))
+
+
+def main():
+    for size in (1000000, 2000000, 4000000, 8000000):
+        for mode in ('memory', 'external'):
+            output = subprocess.check_output(
+                [sys.executable, __file__, mode, str(size)]).split()
+            seconds, peak = float(output[0]), float(output[1])
+            print('{0:>9} words  {1:<8}  {2:7.2f}s  {3:8.0f} words/s  '
+                  'peak RSS {4:6.0f} MB'.format(size, mode, seconds,
+                                                size / seconds, peak))
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 3:
+        child(sys.argv[1], int(sys.argv[2]))
+    else:
+        main()
@@ -0,0 +1,88 @@
+"""
+    Benchmark of sorting file names and version strings with `sort()`.
+
+    Compares the `natural`, `casefold` and `locale` keys of `sort()`, on the
+    first call and on later calls sorting the same names again, where the
+    natural keys are cached, against `sorted()` with the same key computed on
+    every call. Also compares sorting a mixed list of strings and numbers
+    against sorting it twice, like `sort()` used to, the second time by the
+    string values after the first attempt failed.
+
+    Run with: python benchmarks/bench_sort_keys.py
+"""
+import locale
+import os
+import random
+import re
+import sys
+import time
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stringhelpers import sort  # noqa: E402
+from stringhelpers import sequences  # noqa: E402
+
+
+def natural_key(string):
+    return [int(part) if part.isdigit() else part
+            for part in re.split(r'(\d+)', string)]
+
+
+def sort_twice(items):
+    try:
+        return sorted(items)
+    except TypeError:
+        return sorted(items, key=lambda x: str(x))
+
+
+def names(size):
+    generator = random.Random(size)
+    return ['{0}{1}-{2}.{3}.{4}.tar.gz'.format(
+        generator.choice(['File', 'file', 'IMG_', 'release']),
+        generator.randrange(1000), generator.randrange(20),
+        generator.randrange(100), generator.randrange(10))
+        for _ in range(size)]
+
+
+def best(func):
+    timer = timeit.Timer(func)
+    number = timer.autorange()[0]
+    return min(timer.repeat(repeat=3, number=number)) / number
+
+
+def cold(func):
+    sequences._natural_keys.clear()
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    locale.setlocale(locale.LC_COLLATE, '')
+    for size in (1000, 10000, 60000):
+        items = names(size)
+        mixed = items[:size // 2] + list(range(size // 2))
+        print('{0} names'.format(size))
+        cases = [
+            ('natural', natural_key),
+            ('casefold', str.casefold),
+            ('locale', locale.strxfrm),
+        ]
+        for name, function in cases:
+            baseline = best(lambda: sorted(items, key=function))
+            first = cold(lambda: sort(items, key=name))
+            again = best(lambda: sort(items, key=name))
+            print('  {0:<10} sorted() {1:8.2f} ms  first {2:8.2f} ms  '
+                  'again {3:8.2f} ms  ({4:4.1f}x)'.format(
+                      name, baseline * 1e3, first * 1e3, again * 1e3,
+                      baseline / again))
+        before, after = best(lambda: sort_twice(mixed)), best(
+            lambda: sort(mixed))
+        print('  {0:<10} twice    {1:8.2f} ms  once  {2:8.2f} ms  '
+              '({3:4.1f}x)'.format('mixed', before * 1e3, after * 1e3,
+                                   before / after))
+
+
+if __name__ == '__main__':
+    main()
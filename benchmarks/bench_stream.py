@@ -0,0 +1,77 @@
+"""
+    Benchmark of `stringhelpers.stream`.
+
+    Compares reading a whole file and calling `count()`, `count_items()` and
+    `ireplace()` on it, against the streaming versions, reporting the time
+    and peak memory allocated (through `tracemalloc`) for growing files.
+
+    Run with: python benchmarks/bench_stream.py
+"""
+import io
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import stringhelpers  # noqa: E402
+from stringhelpers import stream  # noqa: E402
+
+LINE = 'GET /index.html 200 - Mozilla/5.0 (X11; Linux) summer_08 ERROR ok\n'
+
+
+class Null(object):
+    def write(self, string):
+        pass
+
+
+def measure(func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak / 1024.0 ** 2
+
+
+def whole(path, helper):
+    with io.open(path) as file:
+        return helper(file.read())
+
+
+def streamed(path, helper):
+    with io.open(path) as file:
+        return helper(file)
+
+
+def main():
+    cases = [
+        ('count', lambda string: stringhelpers.count(
+            'error', string, literal=True),
+         lambda file: stream.count('error', file)),
+        ('count_items', stringhelpers.count_items, stream.count_items),
+        ('ireplace', lambda string: stringhelpers.ireplace(
+            'error', 'WARNING', string),
+         lambda file: stream.ireplace('error', 'WARNING', file, Null())),
+    ]
+    for megabytes in (8, 32, 128):
+        with tempfile.NamedTemporaryFile('w', delete=False) as file:
+            file.write(LINE * (megabytes * 1024 ** 2 // len(LINE)))
+        try:
+            for name, helper, stream_helper in cases:
+                seconds, peak = measure(lambda: whole(file.name, helper))
+                stream_seconds, stream_peak = measure(
+                    lambda: streamed(file.name, stream_helper))
+                print('{0:>4} MB  {1:<12} whole {2:6.2f}s {3:7.1f} MB peak  '
+                      'stream {4:6.2f}s {5:7.1f} MB peak'.format(
+                          megabytes, name, seconds, peak, stream_seconds,
+                          stream_peak))
+        finally:
+            os.remove(file.name)
+
+
+if __name__ == '__main__':
+    main()
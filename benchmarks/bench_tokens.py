@@ -0,0 +1,56 @@
+"""
+    Benchmark of counting the words of a text.
+
+    Compares the time and peak memory allocated (through `tracemalloc`) by
+    `count_items()` and `word_frequencies()` against splitting the whole text
+    into a list of words first, like `count_items()` used to.
+
+    Run with: python benchmarks/bench_tokens.py
+"""
+import collections
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stringhelpers import count_items, word_frequencies  # noqa: E402
+
+WORDS = ['Lorem', 'ipsum', 'dolor', 'sit', 'amet', 'consectetur', 'adipiscing',
+         'elit', 'sed', 'do', 'eiusmod', 'tempor']
+
+
+def measure(func):
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    for size in (10 ** 5, 10 ** 6, 10 ** 7):
+        text = ' '.join(WORDS[i * 7 % len(WORDS)] + str(i % 1000)
+                        for i in range(size // 8))[:size]
+        print('{0} characters ({1:.1f} MiB as text)'.format(
+            size, sys.getsizeof(text) / 1048576.0))
+        cases = [
+            ('len(split())', lambda: len(text.split())),
+            ('count_items()', lambda: count_items(text)),
+            ('Counter(split())',
+             lambda: collections.Counter(text.lower().split()).most_common(
+                 10)),
+            ('word_frequencies()', lambda: word_frequencies(text, top_k=10)),
+        ]
+        for name, func in cases:
+            elapsed, peak = measure(func)
+            print('  {0:<20} {1:8.2f} ms  peak {2:10.1f} KiB'.format(
+                name, elapsed * 1e3, peak / 1024.0))
+
+
+if __name__ == '__main__':
+    main()
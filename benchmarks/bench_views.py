@@ -0,0 +1,67 @@
+"""
+    Benchmark of the views returned by `reverse()`, `reverse_order()` and
+    `substr()` with `view=True`.
+
+    Compares the time and peak memory allocated (through `tracemalloc`) by
+    copying a large list or string and iterating over the start of the copy,
+    against doing the same through a view, and reports the time of reversing
+    strings by the old list of characters against the slice used now.
+
+    Run with: python benchmarks/bench_views.py
+"""
+import itertools
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stringhelpers import reverse, reverse_order, substr  # noqa: E402
+
+
+def measure(func):
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def head(iterable):
+    return list(itertools.islice(iterable, 1000))
+
+
+def old_reverse(string):
+    return ''.join([string[i] for i in range(len(string) - 1, -1, -1)])
+
+
+def main():
+    for size in (10 ** 5, 10 ** 6, 10 ** 7):
+        items = list(range(size))
+        string = 'abcdefghij' * (size // 10)
+        print('{0} items'.format(size))
+        cases = [
+            ('reverse_order', lambda: head(reverse_order(items)),
+             lambda: head(reverse_order(items, view=True))),
+            ('substr', lambda: head(substr(items, 1, -2)),
+             lambda: head(substr(items, 1, -2, view=True))),
+            ('reverse', lambda: head(reverse(string)),
+             lambda: head(reverse(string, view=True))),
+            ('reverse (old)', lambda: old_reverse(string),
+             lambda: reverse(string)),
+        ]
+        for name, copy, view in cases:
+            (copy_time, copy_peak), (view_time, view_peak) = \
+                measure(copy), measure(view)
+            print('  {0:<14} before {1:9.3f} ms {2:10.1f} KiB  after '
+                  '{3:9.3f} ms {4:10.1f} KiB'.format(
+                      name, copy_time * 1e3, copy_peak / 1024.0,
+                      view_time * 1e3, view_peak / 1024.0))
+
+
+if __name__ == '__main__':
+    main()
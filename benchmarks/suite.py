@@ -0,0 +1,267 @@
+"""
+    Benchmark suite of all the public helpers in `stringhelpers`.
+
+    Every helper is timed at geometrically increasing input sizes, where the
+    empirical complexity exponent is the slope of the time against the size
+    on a log-log scale (1.0 is linear, 2.0 quadratic), and the peak memory
+    allocated by one call is measured with `tracemalloc`.
+
+    Run the suite, and save the results as JSON, with:
+
+        python benchmarks/suite.py run --output results.json
+
+    Compare two results, failing if any helper got slower than the threshold
+    allows, with:
+
+        python benchmarks/suite.py compare baseline.json results.json
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import stringhelpers  # noqa: E402
+from stringhelpers import *  # noqa: E402,F401,F403
+
+DEFAULT_SIZES = [1000, 2000, 4000, 8000, 16000, 32000]
+
+# Public names which are not helpers taking an input of some size.
+NOT_BENCHMARKED = set(['CacheInfo', 'CHOICES', 'PASSWORD_SAFE_CHOICES',
+                       'DOUBLE_EXTENSIONS', 'pattern_cache_info',
+                       'clear_pattern_cache'])
+
+VOCABULARY = ['Lorem', 'ipsum', 'DOLOR', 'sit', 'amet', 'consectetur',
+              'adipiscing', 'elit', 'sed_do', 'eiusmod-tempor', '1234', 'BUT']
+
+
+def words(size):
+    """Return a list of `size` words."""
+    return [VOCABULARY[i * 7 % len(VOCABULARY)] + str(i % 97)
+            for i in range(size)]
+
+
+def text(size):
+    """Return a string of about `size` characters."""
+    return ' '.join(words(size // 8 + 1))[:size]
+
+
+def documents(size):
+    """Return a list of `size` strings of eight words each."""
+    items = words(8 * size)
+    return [' '.join(items[i:i + 8]) for i in range(0, 8 * size, 8)]
+
+
+def nested(size):
+    """Return a nested list of `size` words."""
+    items = words(size)
+    return [[items[i], [items[i + 1:i + 4]]] for i in range(0, size, 4)]
+
+
+# Each case returns a function calling the helper with an input of `size`.
+CASES = {
+    'upcase': lambda size: lambda string=text(size): upcase(string),
+    'downcase': lambda size: lambda string=text(size): downcase(string),
+    'upcase_first_letter': lambda size: (
+        lambda string='1 ' + text(size): upcase_first_letter(string)),
+    'reverse': lambda size: lambda string=text(size): reverse(string),
+    'reverse_order': lambda size: (
+        lambda string=text(size): reverse_order(string)),
+    'count_items': lambda size: (
+        lambda string=text(size): count_items(string)),
+    'camelize': lambda size: lambda string=text(size): camelize(string),
+    'list_to_string': lambda size: (
+        lambda items=words(size): list_to_string(items)),
+    'truncate': lambda size: (
+        lambda string=text(size): truncate(string, size // 2)),
+    'random_string': lambda size: lambda: random_string(size),
+    'random_strings': lambda size: lambda: random_strings(size, 8),
+    'dasherize': lambda size: lambda string=text(size): dasherize(string),
+    'humanize': lambda size: (
+        lambda string=text(size) + '.tar.gz': humanize(string)),
+    'iflatten': lambda size: (
+        lambda items=nested(size): list(iflatten(items, unique=True))),
+    'flatten': lambda size: lambda items=nested(size): flatten(items),
+    'ListIndex': lambda size: (
+        lambda items=nested(size): ListIndex(items).find('dolor2')),
+    'in_list': lambda size: (
+        lambda items=nested(size): in_list('dolor2', items)),
+    'IReplacer': lambda size: (
+        lambda string=text(size),
+        replacer=IReplacer({'dolor': 'X', 'but': 'Y'}): replacer(string)),
+    'ireplace_many': lambda size: (
+        lambda string=text(size): ireplace_many(
+            {'dolor': 'X', 'but': 'Y', 'elit': 'Z'}, string)),
+    'ireplace': lambda size: (
+        lambda string=text(size): ireplace('dolor', 'X', string)),
+    'count': lambda size: lambda string=text(size): count('but', string),
+    'count_many': lambda size: (
+        lambda string=text(size): count_many(['but', 'sit', 'elit'], string)),
+    'odd': lambda size: lambda numbers=range(size): [odd(i) for i in numbers],
+    'even': lambda size: (
+        lambda numbers=range(size): [even(i) for i in numbers]),
+    'partition_parity': lambda size: (
+        lambda numbers=list(range(size)): partition_parity(numbers)),
+    'strip_slashes': lambda size: (
+        lambda string='/' * size + text(size) + '/' * size:
+        strip_slashes(string)),
+    'sort': lambda size: lambda items=words(size): sort(items),
+    'common_sub': lambda size: (
+        lambda object1=text(size), object2=text(size // 2):
+        common_sub(object1, object2)),
+    'CorpusIndex': lambda size: (
+        lambda index=CorpusIndex(documents(size)):
+        index.most_common(text(64), top_k=10)),
+    'is_iterable': lambda size: (
+        lambda items=words(size): [is_iterable(item) for item in items]),
+    'substr': lambda size: (
+        lambda string=text(size): substr(string, 1, size // 2)),
+    'Pipeline': lambda size: (
+        lambda string=text(size),
+        pipeline=Pipeline(downcase, dasherize, (truncate, {'length': 10})):
+        pipeline(string)),
+    'word_spans': lambda size: (
+        lambda string=text(size): sum(1 for span in word_spans(string))),
+    'word_frequencies': lambda size: (
+        lambda string=text(size): word_frequencies(string, top_k=10)),
+    'to_snake': lambda size: lambda string=text(size): to_snake(string),
+    'to_kebab': lambda size: lambda string=text(size): to_kebab(string),
+    'to_camel': lambda size: lambda string=text(size): to_camel(string),
+    'to_title': lambda size: lambda string=text(size): to_title(string),
+    'SliceView': lambda size: (
+        lambda items=words(size): sum(1 for item in SliceView(items, 1, -1,
+                                                               2))),
+    'ReversedView': lambda size: (
+        lambda items=words(size): sum(1 for item in ReversedView(items))),
+    'ExtensionRegistry': lambda size: (
+        lambda items=words(size): ExtensionRegistry(items).matches('Lorem1')),
+}
+
+
+def public_names():
+    return sorted(stringhelpers.__all__)
+
+
+def measure(func):
+    """Return the best time of one call to `func`, and its peak memory."""
+    timer = timeit.Timer(func)
+    number, elapsed = timer.autorange()
+    if elapsed < 0.05:
+        number *= int(math.ceil(0.05 / max(elapsed, 1e-9)))
+    seconds = min(timer.repeat(repeat=3, number=number)) / number
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def exponent(sizes, seconds):
+    """Return the slope of `seconds` against `sizes` on a log-log scale."""
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(max(second, 1e-12)) for second in seconds]
+    mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    if not variance:
+        return 0.0
+    return sum((x - mean_x) * (y - mean_y)
+               for x, y in zip(xs, ys)) / variance
+
+
+def run(args):
+    missing = [name for name in public_names()
+               if name not in CASES and name not in NOT_BENCHMARKED]
+    if missing:
+        print('no benchmark case for: ' + ', '.join(missing))
+        return 1
+
+    names = args.helpers or sorted(CASES)
+    results = {}
+    for name in names:
+        seconds, peaks = [], []
+        for size in args.sizes:
+            time, peak = measure(CASES[name](size))
+            seconds.append(time)
+            peaks.append(peak)
+        results[name] = {'seconds': seconds, 'peak_bytes': peaks,
+                         'exponent': exponent(args.sizes, seconds)}
+        print('{0:<20} {1:10.2f} us at {2:>6}  exponent {3:5.2f}  '
+              'peak {4:9.1f} KiB'.format(
+                  name, seconds[-1] * 1e6, args.sizes[-1],
+                  results[name]['exponent'], peaks[-1] / 1024.0))
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump({'python': platform.python_version(),
+                       'version': stringhelpers.__version__,
+                       'sizes': args.sizes, 'results': results},
+                      file, indent=2, sort_keys=True)
+    return 0
+
+
+def compare(args):
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+    with open(args.current) as file:
+        current = json.load(file)
+    if baseline['sizes'] != current['sizes']:
+        print('the results are measured at different sizes')
+        return 1
+
+    regressions = []
+    for name in sorted(set(baseline['results']) & set(current['results'])):
+        before, after = baseline['results'][name], current['results'][name]
+        ratio = after['seconds'][-1] / before['seconds'][-1]
+        growth = after['exponent'] - before['exponent']
+        memory = after['peak_bytes'][-1] / float(
+            max(before['peak_bytes'][-1], 1))
+        regressed = ratio > args.threshold or \
+            growth > args.exponent_threshold
+        if regressed:
+            regressions.append(name)
+        print('{0:<20} time {1:5.2f}x  exponent {2:+5.2f}  memory {3:5.2f}x'
+              '{4}'.format(name, ratio, growth, memory,
+                           '  REGRESSION' if regressed else ''))
+
+    if regressions:
+        print('regressed: ' + ', '.join(regressions))
+        return 1
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    commands = parser.add_subparsers(dest='command')
+    commands.required = True
+
+    run_parser = commands.add_parser('run', help='run the benchmarks')
+    run_parser.add_argument('--output', help='file to save the results to')
+    run_parser.add_argument('--sizes', type=int, nargs='+',
+                            default=DEFAULT_SIZES)
+    run_parser.add_argument('helpers', nargs='*',
+                            help='helpers to benchmark (default all)')
+    run_parser.set_defaults(func=run)
+
+    compare_parser = commands.add_parser(
+        'compare', help='compare two results, failing on regressions')
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument(
+        '--threshold', type=float, default=1.25,
+        help='slowdown ratio at the largest size to fail at (default 1.25)')
+    compare_parser.add_argument(
+        '--exponent-threshold', type=float, default=0.25,
+        help='growth of the complexity exponent to fail at (default 0.25)')
+    compare_parser.set_defaults(func=compare)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -12,13 +12,15 @@ setup(
     url='https://github.com/thomskaf/stringhelpers',
     packages=['stringhelpers'],
     zip_safe=False,
+    python_requires='>=3.7',
+    extras_require={'numpy': ['numpy']},
     classifiers=[
         'Topic :: Utilities',
         'Topic :: Text Processing',
         'Intended Audience :: Developers',
         'Operating System :: OS Independent',
-        'Programming Language :: Python :: 2',
         'Programming Language :: Python :: 3',
+        'Programming Language :: Python :: 3 :: Only',
         'License :: OSI Approved :: MIT License',
     ]
 )
@@ -0,0 +1,283 @@
+"""
+    stringhelpers.__main__
+    ~~~~~~~~~~~~~~~~~~~~~~
+
+    Applying a chain of string helpers to every line, or record, of standard
+    input or files, with::
+
+        $ python -m stringhelpers -e humanize -e dasherize -e truncate:20 FILE
+
+    Each helper is given as `NAME[:ARGUMENTS]`, where `ARGUMENTS` are written
+    like the arguments of a call to the helper, leaving out the string it is
+    applied to, as in `truncate:length=20` or `count:error`. Bare words are
+    taken as strings.
+
+    The input is read in large blocks, and the records of each block are
+    processed together, optionally in several processes.
+
+    :copyright: (c) 2013 by Thomas Skaflem.
+    :license: MIT, see LICENSE for more details.
+"""
+
+import argparse
+import ast
+import functools
+import inspect
+import numbers
+import re
+import sys
+import time
+
+import stringhelpers
+from stringhelpers import case, search
+from stringhelpers.parallel import pmap
+
+DEFAULT_BATCH_SIZE = 1024 * 1024
+
+# The compiled pipelines of every chain of helpers, by their specification.
+_pipelines = {}
+
+
+def _parse_arguments(arguments):
+    """Return a tuple of the positional arguments, and a dictionary of the
+    keyword arguments, written in the string `arguments`."""
+    try:
+        call = ast.parse('f(%s)' % arguments, mode='eval').body
+        if not isinstance(call, ast.Call):
+            raise SyntaxError(arguments)
+
+        def value(node):
+            if isinstance(node, ast.Name):
+                return node.id
+            return ast.literal_eval(node)
+        return (tuple(value(node) for node in call.args),
+                dict((keyword.arg, value(keyword.value))
+                     for keyword in call.keywords))
+    except (SyntaxError, ValueError, TypeError):
+        return (arguments,), {}
+
+
+def _keyword_call(function, name, kwargs, string):
+    kwargs = dict(kwargs)
+    kwargs[name] = string
+    return function(**kwargs)
+
+
+def _step(specification):
+    """Return a step of a `Pipeline` for the helper written as
+    `NAME[:ARGUMENTS]` in `specification`."""
+    name, _, arguments = specification.partition(':')
+    if name not in stringhelpers.__all__:
+        raise ValueError('unknown helper %r' % name)
+    function = getattr(stringhelpers, name)
+    if not inspect.isfunction(function):
+        raise ValueError('%r is not a helper function' % name)
+    args, kwargs = _parse_arguments(arguments) if arguments else ((), {})
+    parameters = list(inspect.signature(function).parameters)
+    string = 'string' if 'string' in parameters else parameters[0]
+    others = [parameter for parameter in parameters if parameter != string]
+    if len(args) > len(others):
+        raise ValueError('too many arguments for %r' % name)
+    kwargs.update(zip(others, args))
+    if parameters[0] != string:
+        return functools.partial(_keyword_call, function, string, kwargs)
+    return function, kwargs
+
+
+def _whole(step, delimiter):
+    """Return `True` if summing the results of `step` for every record gives
+    the same as applying it once to all of them, with their delimiters."""
+    if not isinstance(step, functools.partial) or \
+            step.func is not _keyword_call:
+        return False
+    function, _, kwargs = step.args
+    if function is search.count:
+        item = str(kwargs.get('item', ''))
+        plain = kwargs.get('literal') or re.escape(item) == item
+        return bool(item) and plain and delimiter not in item
+    return function is search.count_items and delimiter == '\n'
+
+
+def _pipeline(specifications, delimiter):
+    """Return a tuple of the `Pipeline` of the helpers in `specifications`,
+    whether or not all of them only map characters, and whether or not a
+    single helper adds up over the records, so the pipeline can be applied
+    to many records at once."""
+    key = (specifications, delimiter)
+    pipeline = _pipelines.get(key)
+    if pipeline is None:
+        steps = [_step(specification) for specification in specifications]
+        mapping = all(isinstance(step, tuple) and
+                      case._character_mapping(*step) is not None
+                      for step in steps)
+        whole = len(steps) == 1 and _whole(steps[0], delimiter)
+        pipeline = _pipelines[key] = (case.Pipeline(*steps), mapping, whole)
+    return pipeline
+
+
+def _returns_number(pipeline):
+    """Return `True` if `pipeline` returns a number for an empty record, or
+    if that can not be told."""
+    try:
+        result = pipeline('')
+    except Exception:
+        return True
+    return isinstance(result, numbers.Number)
+
+
+def _process(specifications, encoding, delimiter, total, data):
+    """Return a tuple of the bytes of the records in `data` with the helpers
+    applied, and the number of records. With `total`, the sum of the results
+    is returned instead of the bytes."""
+    pipeline, mapping, whole = _pipeline(specifications, delimiter)
+    text = data.decode(encoding, 'surrogateescape')
+    terminated = text.endswith(delimiter)
+    if terminated:
+        text = text[:-len(delimiter)]
+    records = text.count(delimiter) + 1
+    if total and whole:
+        return pipeline(text), records
+    if mapping and not total:
+        # The characters of all the records are mapped in one go, which
+        # leaves the delimiters as they are.
+        result = pipeline(text)
+    else:
+        results = pipeline.map(text.split(delimiter))
+        if total:
+            return sum(results), records
+        result = delimiter.join(
+            item if isinstance(item, str) else str(item) for item in results)
+    if terminated:
+        result += delimiter
+    return result.encode(encoding, 'surrogateescape'), records
+
+
+def _blocks(files, batch_size, delimiter):
+    """Yield the contents of `files` in blocks of about `batch_size` bytes,
+    each ending with a whole record. The last record of a file is never
+    joined with the first one of the next file."""
+    for file in files:
+        rest = b''
+        while True:
+            block = file.read(batch_size)
+            if not block:
+                break
+            end = block.rfind(delimiter) + len(delimiter)
+            if end < len(delimiter):
+                rest += block
+                continue
+            yield rest + block[:end]
+            rest = block[end:]
+        if rest:
+            yield rest
+
+
+def _open(paths, batch_size):
+    for path in paths:
+        if path == '-':
+            yield sys.stdin.buffer
+        else:
+            with open(path, 'rb', buffering=batch_size) as file:
+                yield file
+
+
+def _parser():
+    parser = argparse.ArgumentParser(
+        prog='python -m stringhelpers',
+        description='Apply a chain of string helpers to every line of the '
+                    'files, or of standard input.')
+    parser.add_argument('files', nargs='*', default=['-'], metavar='FILE',
+                        help='files to read, where - is standard input '
+                             '(default)')
+    parser.add_argument('-e', '--apply', action='append', required=True,
+                        metavar='HELPER[:ARGUMENTS]', dest='helpers',
+                        help='helper to apply, like truncate:length=20, in '
+                             'the order given')
+    parser.add_argument('-o', '--output', metavar='FILE',
+                        help='file to write to instead of standard output')
+    parser.add_argument('-z', '--null', action='store_true',
+                        help='records end with NUL instead of newline')
+    parser.add_argument('--encoding', default='utf-8',
+                        help='encoding of the input and output, which must '
+                             'be ASCII compatible (default: utf-8)')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='number of processes to use (default: 1)')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                        metavar='BYTES',
+                        help='bytes of records to process at the time '
+                             '(default: %d)' % DEFAULT_BATCH_SIZE)
+    parser.add_argument('--total', action='store_true',
+                        help='write the sum of the results, like the counts '
+                             'of count, instead of every result')
+    parser.add_argument('--stats', action='store_true',
+                        help='report the throughput on standard error')
+    return parser
+
+
+def main(args=None):
+    """Run the command line interface with the arguments in `args`, by
+    default those of the command line, and return the exit status."""
+    parser = _parser()
+    options = parser.parse_args(args)
+    specifications = tuple(options.helpers)
+    delimiter = '\0' if options.null else '\n'
+    try:
+        pipeline = _pipeline(specifications, delimiter)[0]
+    except ValueError as error:
+        parser.error(str(error))
+    if options.total and not _returns_number(pipeline):
+        parser.error('--total needs helpers returning numbers, like count')
+    process = functools.partial(_process, specifications, options.encoding,
+                                delimiter, options.total)
+    output = open(options.output, 'wb') if options.output else \
+        sys.stdout.buffer
+    start = time.time()
+    bytes_in = bytes_out = records = 0
+    total = 0
+    separator = delimiter.encode('ascii')
+
+    def blocks():
+        nonlocal bytes_in
+        for block in _blocks(_open(options.files, options.batch_size),
+                             options.batch_size, separator):
+            bytes_in += len(block)
+            yield block
+
+    unterminated = False
+    try:
+        for result, count in pmap(process, blocks(), workers=options.jobs,
+                                  chunksize=1):
+            records += count
+            if options.total:
+                total += result
+                continue
+            if unterminated:
+                # The last record of the previous file had no delimiter.
+                result = separator + result
+            output.write(result)
+            bytes_out += len(result)
+            unterminated = not result.endswith(separator)
+        if options.total:
+            result = ('%s\n' % total).encode('ascii')
+            output.write(result)
+            bytes_out += len(result)
+        output.flush()
+    except BrokenPipeError:
+        # The reader went away, like `head` does.
+        sys.stderr.close()
+        return 1
+    finally:
+        if options.output:
+            output.close()
+    if options.stats:
+        seconds = max(time.time() - start, 1e-9)
+        sys.stderr.write(
+            '%d records, %.1f MiB in, %.1f MiB out in %.2fs '
+            '(%.1f MiB/s, %d records/s)\n' % (
+                records, bytes_in / 1048576.0, bytes_out / 1048576.0,
+                seconds, bytes_in / 1048576.0 / seconds, records / seconds))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
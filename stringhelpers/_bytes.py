@@ -0,0 +1,45 @@
+"""
+    stringhelpers._bytes
+    ~~~~~~~~~~~~~~~~~~~~
+
+    Translation tables, and helpers, for the string helpers working on ASCII
+    `bytes`, `bytearray` and `memoryview` objects.
+
+    :copyright: (c) 2013 by Thomas Skaflem.
+    :license: MIT, see LICENSE for more details.
+"""
+
+import string as _string
+
+BYTES_TYPES = (bytes, bytearray, memoryview)
+
+UPPER = bytes.maketrans(_string.ascii_lowercase.encode(),
+                        _string.ascii_uppercase.encode())
+LOWER = bytes.maketrans(_string.ascii_uppercase.encode(),
+                        _string.ascii_lowercase.encode())
+DASHES = bytes.maketrans(b'_ ', b'--')
+
+
+def translate(data, table, out=None):
+    """Return a copy of the bytes-like `data` where every byte is mapped
+    through `table`. Bytes and bytearrays are translated directly, while a
+    memoryview is copied once first.
+
+    :param data: `bytes`, `bytearray` or `memoryview` to translate.
+    :param table: translation table, as made by `bytes.maketrans()`.
+    :param out: `bytearray` to write the result to, instead of returning a
+                new object. It is resized to fit the result, and returned.
+    """
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    elif not isinstance(data, (bytes, bytearray)):
+        if out is None or not isinstance(data, str):
+            raise TypeError('expected a string or bytes-like object, not %s'
+                            % type(data).__name__)
+        raise TypeError('out is only supported for bytes-like objects, not '
+                        '%s' % type(data).__name__)
+    result = data.translate(table)
+    if out is None:
+        return result
+    out[:] = result
+    return out
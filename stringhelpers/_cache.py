@@ -0,0 +1,53 @@
+"""
+    stringhelpers._cache
+    ~~~~~~~~~~~~~~~~~~~~
+
+    The bounded cache shared by the helpers compiling patterns.
+
+    :copyright: (c) 2013 by Thomas Skaflem.
+    :license: MIT, see LICENSE for more details.
+"""
+
+import collections
+
+
+CacheInfo = collections.namedtuple('CacheInfo',
+                                   ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class _PatternCache(object):
+    """A bounded least recently used cache of compiled patterns, which keeps
+    track of the number of hits and misses.
+
+    :param maxsize: maximum number of compiled patterns to keep.
+    """
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.hits = self.misses = 0
+        self._entries = collections.OrderedDict()
+
+    def get(self, key, compile):
+        """Return the compiled pattern cached under `key`, calling `compile`
+        to create it if it is not cached.
+        """
+        try:
+            value = self._entries.pop(key)
+        except KeyError:
+            self.misses += 1
+            value = compile()
+            while self._entries and len(self._entries) >= self.maxsize:
+                self._entries.popitem(last=False)
+        else:
+            self.hits += 1
+        if self.maxsize > 0:
+            self._entries[key] = value
+        return value
+
+    def info(self):
+        return CacheInfo(self.hits, self.misses, self.maxsize,
+                         len(self._entries))
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = self.misses = 0
@@ -0,0 +1,74 @@
+"""
+    stringhelpers._tokens
+    ~~~~~~~~~~~~~~~~~~~~~
+
+    The tokenizer shared by the helpers working on the words of a text, where
+    a word is any run of non-whitespace characters, like for `str.split()`.
+
+    :copyright: (c) 2013 by Thomas Skaflem.
+    :license: MIT, see LICENSE for more details.
+"""
+
+import re
+
+WORD = re.compile(r'\S+')
+SPACE = re.compile(r'\s')
+SPACE_BYTES = re.compile(br'\s')
+
+# Number of characters of a text which are split into words at the time.
+WINDOW = 64 * 1024
+
+
+def spans(string):
+    """Return an iterator over the `(start, end)` positions of the words in
+    `string`, without copying out the words."""
+    return (match.span() for match in WORD.finditer(string))
+
+
+def windows(string, size=WINDOW):
+    """Return an iterator over slices of about `size` characters of `string`,
+    which are cut at whitespace, so no word is split between two of them."""
+    space = SPACE if isinstance(string, str) else SPACE_BYTES
+    start, length = 0, len(string)
+    while start < length:
+        end = start + size
+        if end < length:
+            match = space.search(string, end)
+            end = match.start() if match else length
+        yield string[start:end]
+        start = end
+
+
+def count(string, limit=None):
+    """Return the number of words in `string`, only splitting a window of it
+    at the time.
+
+    :param string: string to count the words in.
+    :param limit: stop counting at `limit` words.
+    """
+    if limit is not None:
+        result = 0
+        for match in WORD.finditer(string):
+            result += 1
+            if result == limit:
+                break
+        return result
+    return sum(len(window.split()) for window in windows(string))
+
+
+class WordCounter(object):
+    """Counts the words in text which is fed to it in chunks, which may split
+    words in two."""
+
+    def __init__(self):
+        self.result = 0
+        self.in_word = False
+
+    def feed(self, chunk):
+        if not chunk:
+            return
+        self.result += len(chunk.split())
+        if self.in_word and not chunk[:1].isspace():
+            # The first word continues the last one of the previous chunk.
+            self.result -= 1
+        self.in_word = not chunk[-1:].isspace()
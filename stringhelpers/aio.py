@@ -0,0 +1,233 @@
+"""
+    stringhelpers.aio
+    ~~~~~~~~~~~~~~~~~
+
+    Versions of the streaming helpers for asyncio, working on async iterables
+    of strings, like text read from sockets or queues, which are consumed in
+    chunks the same way as the files in `stringhelpers.stream`.
+
+    Chunks of at least `threshold` characters are processed in an executor,
+    so a large payload does not stall the event loop, while smaller ones are
+    processed in the event loop itself, where it costs less than handing them
+    over. The source is read ahead into a queue of at most `max_pending`
+    chunks, which in turn stops reading from the source while it is full.
+
+    :copyright: (c) 2013 by Thomas Skaflem.
+    :license: MIT, see LICENSE for more details.
+"""
+
+import asyncio
+import functools
+
+from ._tokens import WordCounter
+from .search import IReplacer, _feed
+from .sequences import flatten as _flatten
+from .stream import _Counter
+
+DEFAULT_THRESHOLD = 64 * 1024
+DEFAULT_MAX_PENDING = 8
+
+_END = object()
+
+
+class _Failure(object):
+    def __init__(self, error):
+        self.error = error
+
+
+async def _aiter(chunks):
+    if isinstance(chunks, str):
+        yield chunks
+    elif hasattr(chunks, '__aiter__'):
+        async for chunk in chunks:
+            yield chunk
+    else:
+        for chunk in chunks:
+            yield chunk
+
+
+async def _prefetch(chunks, max_pending):
+    """Return an async iterator over `chunks`, which are read ahead by a task
+    into a queue of at most `max_pending` chunks."""
+    if not max_pending:
+        async for chunk in _aiter(chunks):
+            yield chunk
+        return
+
+    queue = asyncio.Queue(max_pending)
+
+    async def produce():
+        try:
+            async for chunk in _aiter(chunks):
+                await queue.put(chunk)
+        except Exception as error:
+            await queue.put(_Failure(error))
+        else:
+            await queue.put(_END)
+
+    producer = asyncio.ensure_future(produce())
+    try:
+        while True:
+            chunk = await queue.get()
+            if chunk is _END:
+                return
+            if isinstance(chunk, _Failure):
+                raise chunk.error
+            yield chunk
+    finally:
+        producer.cancel()
+
+
+def _size(args):
+    return sum(len(arg) for arg in args
+               if isinstance(arg, (str, bytes, list, tuple)))
+
+
+async def _call(function, args, threshold, executor):
+    if threshold is not None and _size(args) >= threshold:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, function, *args)
+    return function(*args)
+
+
+async def apply(function, *args, **kwargs):
+    """Return the result of `function(*args)`, which is called in an executor
+    if the strings, lists and tuples in `args` are at least `threshold` items
+    long in total.
+
+    :param function: function to call, like any of the string helpers.
+    :param threshold: size of `args` from which `function` is called in
+                      `executor`. Defaults to `DEFAULT_THRESHOLD`.
+    :param executor: executor to call `function` in. If set to `None`
+                     (default), the default executor of the event loop is
+                     used.
+    """
+    threshold = kwargs.pop('threshold', DEFAULT_THRESHOLD)
+    executor = kwargs.pop('executor', None)
+    if kwargs:
+        function = functools.partial(function, **kwargs)
+    return await _call(function, args, threshold, executor)
+
+
+async def flatten(list_to_flatten, remove_duplicates=False,
+                  threshold=DEFAULT_THRESHOLD, executor=None):
+    """Return the same as `stringhelpers.flatten()`, which is called in an
+    executor for lists of at least `threshold` items.
+
+    :param list_to_flatten: list to flatten.
+    :param remove_duplicates: if set to `True`, remove duplicates.
+    :param threshold: number of items from which the list is flattened in
+                      `executor`.
+    :param executor: executor to flatten large lists in. If set to `None`
+                     (default), the default executor of the event loop is
+                     used.
+    """
+    return await _call(functools.partial(_flatten,
+                                         remove_duplicates=remove_duplicates),
+                       (list_to_flatten,), threshold, executor)
+
+
+async def count(item, chunks, case_sensitive=False,
+                threshold=DEFAULT_THRESHOLD, max_pending=DEFAULT_MAX_PENDING,
+                executor=None):
+    """Return the exact number of how many times `item` is found in the text
+    in `chunks`, searched after as plain text.
+
+    :param item: item to count the occurrences of.
+    :param chunks: async iterable, or iterable, of strings to count the
+                   occurrences of `item` in.
+    :param case_sensitive: if set to `True`, the search after `item` is
+                           case-sensetive.
+    :param threshold: number of characters from which a chunk is processed in
+                      `executor`.
+    :param max_pending: maximum number of chunks read ahead from `chunks`.
+    :param executor: executor to process large chunks in. If set to `None`
+                     (default), the default executor of the event loop is
+                     used.
+    """
+    counter = _Counter(item, case_sensitive)
+    async for chunk in _prefetch(chunks, max_pending):
+        await _call(counter.feed, (chunk,), threshold, executor)
+    return counter.result
+
+
+async def count_items(chunks, threshold=DEFAULT_THRESHOLD,
+                      max_pending=DEFAULT_MAX_PENDING, executor=None):
+    """Return the number of items in the text in `chunks`.
+
+    :param chunks: async iterable, or iterable, of strings to count for items.
+    :param threshold: number of characters from which a chunk is processed in
+                      `executor`.
+    :param max_pending: maximum number of chunks read ahead from `chunks`.
+    :param executor: executor to process large chunks in. If set to `None`
+                     (default), the default executor of the event loop is
+                     used.
+    """
+    counter = WordCounter()
+    async for chunk in _prefetch(chunks, max_pending):
+        await _call(counter.feed, (chunk,), threshold, executor)
+    return counter.result
+
+
+async def ireplace_many(replacements, chunks, threshold=DEFAULT_THRESHOLD,
+                        max_pending=DEFAULT_MAX_PENDING, executor=None):
+    """Return an async iterator over the pieces of a copy of the text in
+    `chunks`, where all the occurrences of a case-insensitive search after
+    each key in `replacements` is replaced with its value.
+
+    :param replacements: dictionary mapping the items to search after to their
+                         replacements, or an already built `IReplacer`.
+    :param chunks: async iterable, or iterable, of strings to
+                   search-and-replace in.
+    :param threshold: number of characters from which a chunk is processed in
+                      `executor`.
+    :param max_pending: maximum number of chunks read ahead from `chunks`.
+    :param executor: executor to process large chunks in. If set to `None`
+                     (default), the default executor of the event loop is
+                     used.
+    """
+    if not isinstance(replacements, IReplacer):
+        replacements = IReplacer(replacements)
+    feeder = replacements.feeder()
+    next(feeder)
+    async for chunk in _prefetch(chunks, max_pending):
+        for piece in await _call(functools.partial(_feed, feeder), (chunk,),
+                                 threshold, executor):
+            yield piece
+    for piece in _feed(feeder, None):
+        yield piece
+
+
+def ireplace(old, new, chunks, threshold=DEFAULT_THRESHOLD,
+             max_pending=DEFAULT_MAX_PENDING, executor=None):
+    """Return an async iterator over the pieces of a copy of the text in
+    `chunks`, where all the occurrences of a case-insensitive search after
+    `old` is replaced with `new`.
+
+    :param old: the item to do a case-insensitive search after.
+    :param new: new item to replace `old` with.
+    :param chunks: async iterable, or iterable, of strings to
+                   search-and-replace in.
+    :param threshold: number of characters from which a chunk is processed in
+                      `executor`.
+    :param max_pending: maximum number of chunks read ahead from `chunks`.
+    :param executor: executor to process large chunks in. If set to `None`
+                     (default), the default executor of the event loop is
+                     used.
+    """
+    return ireplace_many(((old, new),), chunks, threshold, max_pending,
+                         executor)
+
+
+async def from_queue(queue, sentinel=None):
+    """Return an async iterator over the items put in the asyncio `queue`,
+    until `sentinel` is put in it.
+
+    :param queue: `asyncio.Queue` to get the items from.
+    :param sentinel: item marking the end of the items.
+    """
+    while True:
+        item = await queue.get()
+        if item is sentinel:
+            return
+        yield item
@@ -0,0 +1,165 @@
+"""
+    stringhelpers.batch
+    ~~~~~~~~~~~~~~~~~~~
+
+    Batch versions of some of the string helpers, applying the same transform
+    to every string in a sequence at once.
+
+    NumPy string arrays are transformed vectorized with `numpy.strings` (or
+    `numpy.char` on NumPy < 2.0), and a new array is returned. Any other
+    sequence of strings, or any input when NumPy is not installed, is
+    transformed in a plain Python loop, and a new list is returned. The case
+    conversions have no vectorized NumPy equivalent, and always loop. Either
+    way the results are equal to those of the single string helpers.
+
+    :copyright: (c) 2013 by Thomas Skaflem.
+    :license: MIT, see LICENSE for more details.
+"""
+
+import functools
+
+from . import case
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+if numpy is not None:
+    _strings = getattr(numpy, 'strings', None) or numpy.char
+
+
+def _is_string_array(strings):
+    return numpy is not None and isinstance(strings, numpy.ndarray) and \
+        strings.dtype.kind == 'U'
+
+
+def _change_case(change, strings):
+    """Return the NumPy string array `strings` with the case of every string
+    changed by the `numpy.strings` function `change`. Changing the case of
+    non-ASCII characters can make a string longer, up to three times as long
+    when the ligature "ffi" becomes "FFI", which would be cut off at the width
+    of `strings`, so such arrays are widened first and narrowed again after.
+    """
+    width = strings.dtype.itemsize // 4
+    if not strings.size or not width or \
+            numpy.ascontiguousarray(strings).view(numpy.uint32).max() < 128:
+        return change(strings)
+    changed = change(strings.astype('U%d' % (3 * width)))
+    return changed.astype('U%d' % max(_strings.str_len(changed).max(), 1))
+
+
+def upcase(strings):
+    """Return a copy of `strings` where all the alphabetic characters in
+    every string is converted to uppercase.
+
+    :param strings: sequence or NumPy array of strings to uppercase.
+    """
+    if _is_string_array(strings):
+        return _change_case(_strings.upper, strings)
+    return [string.upper() for string in strings]
+
+
+def downcase(strings):
+    """Return a copy of `strings` where all the alphabetic characters in
+    every string is converted to lowercase.
+
+    :param strings: sequence or NumPy array of strings to downcase.
+    """
+    if _is_string_array(strings):
+        return _change_case(_strings.lower, strings)
+    return [string.lower() for string in strings]
+
+
+def dasherize(strings):
+    """Return a copy of `strings` where all occurrences of underscores and
+    spaces in every string are replaced by dashes.
+
+    :param strings: sequence or NumPy array of strings to dasherize.
+    """
+    if _is_string_array(strings):
+        return _strings.replace(_strings.replace(strings, '_', '-'), ' ', '-')
+    return [string.replace('_', '-').replace(' ', '-') for string in strings]
+
+
+def strip_slashes(strings):
+    """Return a copy of `strings` where any leading and trailing slashes is
+    removed from every string.
+
+    :param strings: sequence or NumPy array of strings to remove leading and
+                    trailing slashes from.
+    """
+    if _is_string_array(strings):
+        return _strings.strip(strings, '/')
+    return [string.strip('/') for string in strings]
+
+
+def truncate(strings, length=15, suffix="..."):
+    """Return a copy of `strings` where every string is truncated down to
+    `length`.
+
+    :param strings: sequence or NumPy array of strings to cut off at given
+                    `length`.
+    :param length: position in each string where the truncating will occur.
+    :param suffix: suffix to add after the truncated strings.
+    """
+    if _is_string_array(strings) and length >= 0:
+        if not suffix:
+            return strings.copy()
+        if length:
+            # Casting to a shorter string type cuts off the strings.
+            cut = _strings.add(strings.astype('U%d' % length), suffix)
+        else:
+            cut = numpy.full(strings.shape, suffix)
+        return numpy.where(_strings.str_len(strings) > length, cut, strings)
+    if not suffix:
+        return list(strings)
+    return [string[:length] + suffix if len(string) > length else string
+            for string in strings]
+
+
+def _convert(function, strings):
+    if _is_string_array(strings):
+        return numpy.array([function(string) for string in strings.tolist()],
+                           dtype=str)
+    return [function(string) for string in strings]
+
+
+def to_snake(strings):
+    """Return a copy of `strings` where every string is converted to snake
+    case, like by `stringhelpers.to_snake()`.
+
+    :param strings: sequence or NumPy array of strings to convert.
+    """
+    return _convert(case.to_snake, strings)
+
+
+def to_kebab(strings):
+    """Return a copy of `strings` where every string is converted to kebab
+    case, like by `stringhelpers.to_kebab()`.
+
+    :param strings: sequence or NumPy array of strings to convert.
+    """
+    return _convert(case.to_kebab, strings)
+
+
+def to_camel(strings, upper_first=False):
+    """Return a copy of `strings` where every string is converted to camel
+    case, like by `stringhelpers.to_camel()`.
+
+    :param strings: sequence or NumPy array of strings to convert.
+    :param upper_first: set to `True` to capitalize the first word as well.
+    """
+    if upper_first:
+        return _convert(functools.partial(case.to_camel, upper_first=True),
+                        strings)
+    return _convert(case.to_camel, strings)
+
+
+def to_title(strings):
+    """Return a copy of `strings` where every string is converted to title
+    case, like by `stringhelpers.to_title()`.
+
+    :param strings: sequence or NumPy array of strings to convert.
+    """
+    return _convert(case.to_title, strings)
@@ -0,0 +1,220 @@
+"""
+    stringhelpers.cached
+    ~~~~~~~~~~~~~~~~~~~~
+
+    Memoized versions of the pure string helpers, for workloads where the same
+    strings pass through them over and over again, and `memoize()` to cache
+    any other function the same way.
+
+    Every cache is bounded both by its number of entries and by the total size
+    of the strings in it. With the `'lru'` policy the least recently used
+    entries are evicted to make room for new ones. With the `'tinylfu'` policy
+    a new entry is only let in if it is estimated to have been used more often
+    than the entry it would evict, which keeps strings seen only once from
+    pushing out the frequently used ones.
+
+    Calls with arguments which can not be hashed, like a list of
+    `double_extensions` for `humanize()`, are passed through uncached.
+
+    :copyright: (c) 2013 by Thomas Skaflem.
+    :license: MIT, see LICENSE for more details.
+"""
+
+import collections
+import functools
+import sys
+import threading
+
+from . import case, paths
+
+MemoInfo = collections.namedtuple('MemoInfo', [
+    'hits', 'misses', 'evictions', 'maxsize', 'currsize', 'max_bytes',
+    'currbytes'])
+
+DEFAULT_MAXSIZE = 4096
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+POLICIES = ('lru', 'tinylfu')
+
+# Separates the positional arguments from the keyword arguments in the keys.
+_KWARGS = object()
+
+# Maps every counter value to the half of it.
+_HALVE = bytes(bytearray(i >> 1 for i in range(256)))
+
+
+class _FrequencySketch(object):
+    """A count-min sketch estimating how often each key has been used
+    recently, with four rows of counters indexed by different bits of the
+    hash of the key. The counters stop at 15, and are all halved after every
+    ten times as many uses as there are counters in a row, so the estimates
+    follow any changes in the workload.
+
+    :param size: number of keys to keep track of.
+    """
+
+    def __init__(self, size):
+        width = 16
+        while width < size:
+            width <<= 1
+        self._mask = width - 1
+        self._offsets = (0, width, 2 * width, 3 * width)
+        self._counters = bytearray(4 * width)
+        self._additions = 0
+        self._sample_size = 10 * width
+
+    def _indexes(self, key):
+        h = hash(key)
+        mask = self._mask
+        a, b, c, d = self._offsets
+        return (a + (h & mask), b + (h >> 16 & mask), c + (h >> 32 & mask),
+                d + (h >> 48 & mask))
+
+    def increment(self, key):
+        counters = self._counters
+        for index in self._indexes(key):
+            if counters[index] < 15:
+                counters[index] += 1
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            self._counters = bytearray(counters.translate(_HALVE))
+            self._additions //= 2
+
+    def estimate(self, key):
+        counters = self._counters
+        a, b, c, d = self._indexes(key)
+        return min(counters[a], counters[b], counters[c], counters[d])
+
+
+def _size(args, result):
+    """Return the number of bytes taken up by the strings in `args` and
+    `result`."""
+    size = sys.getsizeof(result) if isinstance(result, (str, bytes)) else 0
+    for arg in args:
+        if isinstance(arg, (str, bytes)):
+            size += sys.getsizeof(arg)
+    return size
+
+
+class _Cache(object):
+    """The entries, and statistics, of the cache of a memoized function.
+
+    :param maxsize: maximum number of results to keep.
+    :param max_bytes: maximum number of bytes taken up by the string arguments
+                      and results kept, or `None`.
+    :param policy: `'lru'` or `'tinylfu'`, the policy deciding which results
+                   to evict.
+    """
+
+    def __init__(self, maxsize, max_bytes, policy):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self.lock = threading.Lock()
+        self.clear()
+
+    def store(self, key, result, size):
+        max_bytes = self.max_bytes
+        if self.maxsize <= 0 or max_bytes is not None and size > max_bytes:
+            return
+        with self.lock:
+            entries = self.entries
+            if key in entries:
+                # Stored by another thread in the meantime.
+                return
+            while len(entries) >= self.maxsize or max_bytes is not None and \
+                    self.currbytes + size > max_bytes:
+                victim = next(iter(entries))
+                if self.sketch is not None and \
+                        self.sketch.estimate(key) <= \
+                        self.sketch.estimate(victim):
+                    return
+                self.currbytes -= entries.pop(victim)[1]
+                self.evictions += 1
+            entries[key] = (result, size)
+            self.currbytes += size
+
+    def info(self):
+        with self.lock:
+            return MemoInfo(self.hits, self.misses, self.evictions,
+                            self.maxsize, len(self.entries), self.max_bytes,
+                            self.currbytes)
+
+    def clear(self):
+        with self.lock:
+            self.entries = collections.OrderedDict()
+            self.sketch = _FrequencySketch(self.maxsize) \
+                if self.policy == 'tinylfu' else None
+            self.hits = self.misses = self.evictions = self.currbytes = 0
+
+
+def memoize(function=None, maxsize=DEFAULT_MAXSIZE,
+            max_bytes=DEFAULT_MAX_BYTES, policy='lru'):
+    """Return a version of `function` caching its results, or, without
+    `function`, a decorator doing the same. Like with `functools.lru_cache()`,
+    the statistics of the cache are returned by its `cache_info()`, as a
+    `MemoInfo(hits, misses, evictions, maxsize, currsize, max_bytes,
+    currbytes)` tuple, and the cache is cleared by its `cache_clear()`.
+
+    :param function: function to cache the results of.
+    :param maxsize: maximum number of results to keep.
+    :param max_bytes: maximum number of bytes taken up by the string arguments
+                      and results kept. If set to `None`, only `maxsize` bounds
+                      the cache.
+    :param policy: `'lru'` (default) to evict the least recently used results,
+                   or `'tinylfu'` to only keep new results estimated to be
+                   used more often than those they would evict.
+    """
+    if function is None:
+        return functools.partial(memoize, maxsize=maxsize,
+                                 max_bytes=max_bytes, policy=policy)
+    if policy not in POLICIES:
+        raise ValueError('unknown eviction policy %r' % (policy,))
+    cache = _Cache(maxsize, max_bytes, policy)
+    lock = cache.lock
+    store = cache.store
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        key = args
+        if kwargs:
+            key += (_KWARGS,) + tuple(sorted(kwargs.items()))
+        with lock:
+            entries = cache.entries
+            try:
+                entry = entries.get(key)
+            except TypeError:
+                # Unhashable arguments are passed through uncached.
+                key = None
+            else:
+                if cache.sketch is not None:
+                    cache.sketch.increment(key)
+                if entry is not None:
+                    entries.move_to_end(key)
+                    cache.hits += 1
+                    return entry[0]
+                cache.misses += 1
+
+        result = function(*args, **kwargs)
+        if key is not None:
+            store(key, result, _size(args, result))
+        return result
+
+    wrapper.cache_info = cache.info
+    wrapper.cache_clear = cache.clear
+    wrapper._cache = cache
+    return wrapper
+
+
+upcase_first_letter = memoize(case.upcase_first_letter)
+camelize = memoize(case.camelize)
+truncate = memoize(case.truncate)
+dasherize = memoize(case.dasherize)
+humanize = memoize(paths.humanize)
+
+HELPERS = (upcase_first_letter, camelize, truncate, dasherize, humanize)
+
+
+def clear_caches():
+    """Clear the caches of all the memoized helpers in this module."""
+    for helper in HELPERS:
+        helper.cache_clear()
@@ -0,0 +1,275 @@
+"""
+    stringhelpers.case
+    ~~~~~~~~~~~~~~~~~~
+
+    Helpers changing the case and the characters of strings, and chaining
+    helpers into pipelines.
+
+    :copyright: (c) 2013 by Thomas Skaflem.
+    :license: MIT, see LICENSE for more details.
+"""
+
+import functools
+import re
+
+from . import _bytes
+from ._cache import _PatternCache
+from .paths import humanize
+
+_FIRST_LETTER = re.compile(r"[^\W\s\d]")
+
+# A word is a run of letters and digits, which also ends where an ASCII
+# uppercase letter follows a lowercase one or a digit ("getName", "2Go"), or
+# starts a capitalized word after an acronym ("HTTPServer").
+_WORD = re.compile(r"[^\W_](?:[^\W_A-Z]|(?<![a-z0-9])[A-Z](?![a-z]))*")
+
+
+def upcase(string, out=None):
+    """Return a copy of `string` where all the alphabetic characters is
+    converted to uppercase.
+
+    :param string: string, or ASCII `bytes`, `bytearray` or `memoryview`, to
+                   uppercase.
+    :param out: `bytearray` to write the result to, when `string` is
+                bytes-like. It is resized to fit the result, and returned.
+    """
+    if out is None and not isinstance(string, memoryview):
+        return string.upper()
+    return _bytes.translate(string, _bytes.UPPER, out)
+
+
+def downcase(string, out=None):
+    """Return a copy of `string` where all the alphabetic characters is
+    converted to lowercase.
+
+    :param string: string, or ASCII `bytes`, `bytearray` or `memoryview`, to
+                   downcase.
+    :param out: `bytearray` to write the result to, when `string` is
+                bytes-like. It is resized to fit the result, and returned.
+    """
+    if out is None and not isinstance(string, memoryview):
+        return string.lower()
+    return _bytes.translate(string, _bytes.LOWER, out)
+
+
+def upcase_first_letter(string):
+    """Return a copy of `string` where only the first letter in `string` is
+    capitalized, leaving the rest unchanged.
+
+    :param string: string to capitalize the first letter of.
+    """
+    match = _FIRST_LETTER.search(string)
+    if match is None:
+        return string
+    # The first occurrence of the letter is the one found.
+    letter = match.group()
+    return string.replace(letter, letter.upper(), 1)
+
+
+def camelize(string):
+    """Return a copy of `string` where the first letter of each word, starting
+    with a letter, are capitalized and leaves the rest unchanged.
+
+    :param string: string to camelize.
+    """
+    return ' '.join([s[0].upper() + s[1:] for s in string.split()])
+
+
+def to_snake(string):
+    """Return a copy of `string` in snake case, where the words are lowercased
+    and joined by underscores. Words are separated by any characters which
+    are not letters or digits, and by changes in case, so "getHTTPResponse"
+    is made up of "get", "HTTP" and "Response". Changes in case are only
+    noticed between ASCII letters.
+
+    :param string: string to convert.
+    """
+    return '_'.join(_WORD.findall(string)).lower()
+
+
+def to_kebab(string):
+    """Return a copy of `string` in kebab case, where the words are
+    lowercased and joined by dashes, with the words found like by
+    `to_snake()`.
+
+    :param string: string to convert.
+    """
+    return '-'.join(_WORD.findall(string)).lower()
+
+
+def to_camel(string, upper_first=False):
+    """Return a copy of `string` in camel case, where the words are
+    capitalized and joined together, except the first one, which is
+    lowercased. The words are found like by `to_snake()`.
+
+    :param string: string to convert.
+    :param upper_first: set to `True` to capitalize the first word as well.
+    """
+    found = _WORD.findall(string)
+    if not found:
+        return ''
+    first = found[0].capitalize() if upper_first else found[0].lower()
+    return first + ''.join(map(str.capitalize, found[1:]))
+
+
+def to_title(string):
+    """Return a copy of `string` in title case, where the words are
+    capitalized and joined by spaces, with the words found like by
+    `to_snake()`.
+
+    :param string: string to convert.
+    """
+    return ' '.join(map(str.capitalize, _WORD.findall(string)))
+
+
+def truncate(string, length=15, suffix="..."):
+    """Return a copy of `string` truncated down to `length`.
+
+    :param string: string to cut off at given `length`.
+    :param length: position in the `string` where the truncating will occur.
+    :param suffix: suffix to add after the truncated string.
+    """
+    if suffix and len(string) > length:
+        return string[:length] + suffix
+    else:
+        return string
+
+
+def dasherize(string, out=None):
+    """Return a copy of `string` where all occurrences of underscores and
+    spaces are replaced by dashes.
+
+    :param string: string, or ASCII `bytes`, `bytearray` or `memoryview`,
+    where any underscores and spaces is being replaced by dashes.
+    :param out: `bytearray` to write the result to, when `string` is
+                bytes-like. It is resized to fit the result, and returned.
+    """
+    if out is None and isinstance(string, str):
+        return string.replace('_', '-').replace(' ', '-')
+    return _bytes.translate(string, _bytes.DASHES, out)
+
+
+_pipeline_cache = _PatternCache(maxsize=128)
+
+
+def _character_mapping(function, kwargs):
+    """Return a `(case, mapping)` tuple if calling `function` with `kwargs`
+    only changes the case of the characters and / or replaces characters with
+    others, where `case` is the name of the string method to change the case
+    with (or `None`) and `mapping` a dictionary of replaced characters. The
+    replaced characters are never affected by the case. `None` is returned
+    for any other function.
+    """
+    if function in (upcase, downcase) and not kwargs:
+        return ('upper' if function is upcase else 'lower'), {}
+    elif function is dasherize and not kwargs:
+        return None, {'_': '-', ' ': '-'}
+    elif function is humanize and \
+            list(kwargs.items()) == [('remove_file_extension', False)]:
+        return None, {'-': ' ', '_': ' '}
+    return None
+
+
+def _fuse(cases, mapping):
+    """Return a single function changing the case with all the string methods
+    named in `cases`, and then replacing the characters in `mapping`.
+    """
+    methods = [getattr(u''.__class__, case) for case in cases]
+    mapping = dict((old, new) for old, new in mapping.items() if old != new)
+    if any(new in mapping for new in mapping.values()):
+        # The characters can only be replaced all at once.
+        table = dict((ord(old), new) for old, new in mapping.items())
+        replacements = []
+    else:
+        table = None
+        replacements = sorted(mapping.items())
+
+    def fused(string):
+        for method in methods:
+            string = method(string)
+        if table is not None:
+            string = string.translate(table)
+        for old, new in replacements:
+            string = string.replace(old, new)
+        return string
+    return fused
+
+
+def _compile_pipeline(signature):
+    functions = []
+    cases, mapping = [], None
+    for function, kwargs in signature:
+        kwargs = dict(kwargs)
+        character_mapping = _character_mapping(function, kwargs)
+        if character_mapping is not None:
+            case, step_mapping = character_mapping
+            if case and (not cases or cases[-1] != case):
+                cases.append(case)
+            if mapping is None:
+                mapping = {}
+            for old in set(mapping) | set(step_mapping):
+                new = mapping.get(old, old)
+                mapping[old] = step_mapping.get(new, new)
+            continue
+        if mapping is not None:
+            functions.append(_fuse(cases, mapping))
+            cases, mapping = [], None
+        if kwargs:
+            functions.append(functools.partial(function, **kwargs))
+        else:
+            functions.append(function)
+    if mapping is not None:
+        functions.append(_fuse(cases, mapping))
+
+    def pipeline(string):
+        for function in functions:
+            string = function(string)
+        return string
+    return pipeline
+
+
+class Pipeline(object):
+    """A chain of string helpers, applied one after another. Any adjacent
+    helpers which only changes the case of, or replaces, single characters
+    (`upcase()`, `downcase()`, `dasherize()` and `humanize()` without file
+    extension removal) are fused into a single step. Compiled pipelines are
+    cached by their helpers and arguments.
+
+    :param steps: the helpers to apply, in order. Each step is either a
+                  function taking a string, or a `(function, kwargs)` tuple
+                  where `kwargs` is a dictionary of keyword arguments to call
+                  the function with.
+    """
+
+    def __init__(self, *steps):
+        signature = []
+        for step in steps:
+            if isinstance(step, tuple):
+                function, kwargs = step
+            else:
+                function, kwargs = step, {}
+            signature.append((function, tuple(sorted(kwargs.items()))))
+        self.signature = tuple(signature)
+        try:
+            hash(self.signature)
+        except TypeError:
+            # Steps with unhashable arguments, like lists, are not cached.
+            self._pipeline = _compile_pipeline(self.signature)
+        else:
+            self._pipeline = _pipeline_cache.get(
+                self.signature, lambda: _compile_pipeline(self.signature))
+
+    def __call__(self, string):
+        """Return a copy of `string` with all the steps applied.
+
+        :param string: string to apply the steps to.
+        """
+        return self._pipeline(string)
+
+    def map(self, strings):
+        """Return an iterator applying all the steps to each string in
+        `strings`.
+
+        :param strings: iterable of strings to apply the steps to.
+        """
+        return map(self._pipeline, strings)
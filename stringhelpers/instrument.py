@@ -0,0 +1,179 @@
+"""
+    stringhelpers.instrument
+    ~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Opt-in instrumentation of the string helpers, recording for each helper
+    the number of calls, a histogram of their latencies, and a histogram of
+    the lengths of their first argument.
+
+    The instrumentation is switched on by `enable()`, or by setting the
+    `STRINGHELPERS_INSTRUMENT` environment variable before `stringhelpers` is
+    imported. It then replaces the helpers in the `stringhelpers` module by
+    instrumented wrappers, which `disable()` puts back again, so the helpers
+    cost nothing extra while it is switched off. Note that helpers imported
+    by name (`from stringhelpers import upcase`) before `enable()` is called
+    are not instrumented, and neither are calls the helpers make to each
+    other inside their submodules.
+
+    Every thread records its statistics on its own, without locking, and
+    they are added together by `snapshot()`. The statistics of threads which
+    have ended are added to a shared total.
+
+    :copyright: (c) 2013 by Thomas Skaflem.
+    :license: MIT, see LICENSE for more details.
+"""
+
+import functools
+import json
+import threading
+import time
+import types
+import weakref
+
+import stringhelpers
+
+_originals = {}
+_local = threading.local()
+# The statistics of the threads which have ended, added together.
+_retired = {}
+_thread_stats = [_retired]
+# Reentrant, as a thread might end, and have its statistics retired, during
+# garbage collection while the lock is held.
+_lock = threading.RLock()
+
+
+def _stats():
+    """Return the statistics recorded by the current thread."""
+    stats = getattr(_local, 'stats', None)
+    if stats is None:
+        stats = _local.stats = {}
+        with _lock:
+            _thread_stats.append(stats)
+        weakref.finalize(threading.current_thread(), _retire, stats)
+    return stats
+
+
+def _retire(stats):
+    """Add the statistics `stats` of a thread which has ended to those in
+    `_retired`, so they are not kept around for every thread."""
+    with _lock:
+        for name, (calls, elapsed, latencies, lengths) in stats.items():
+            record = _retired.get(name)
+            if record is None:
+                record = _retired[name] = [0, 0, {}, {}]
+            record[0] += calls
+            record[1] += elapsed
+            for histogram, buckets in ((record[2], latencies),
+                                       (record[3], lengths)):
+                for bucket, number in buckets.items():
+                    histogram[bucket] = histogram.get(bucket, 0) + number
+        _thread_stats[:] = [other for other in _thread_stats
+                            if other is not stats]
+
+
+def _wrap(name, function):
+    clock = time.perf_counter_ns
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        start = clock()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            elapsed = clock() - start
+            stats = getattr(_local, 'stats', None) or _stats()
+            record = stats.get(name)
+            if record is None:
+                record = stats[name] = [0, 0, {}, {}]
+            record[0] += 1
+            record[1] += elapsed
+            latencies = record[2]
+            bucket = elapsed.bit_length()
+            latencies[bucket] = latencies.get(bucket, 0) + 1
+            if args:
+                try:
+                    bucket = len(args[0]).bit_length()
+                except TypeError:
+                    pass
+                else:
+                    lengths = record[3]
+                    lengths[bucket] = lengths.get(bucket, 0) + 1
+    return wrapper
+
+
+def helpers():
+    """Return the names of all the helpers which can be instrumented."""
+    return sorted(name for name in stringhelpers.__all__
+                  if isinstance(getattr(stringhelpers, name),
+                                types.FunctionType))
+
+
+def enable(names=None):
+    """Switch on the instrumentation of the helpers.
+
+    :param names: list of names of the helpers to instrument. If set to `None`
+                  (default), all the helpers are instrumented.
+    """
+    with _lock:
+        for name in names or helpers():
+            if name not in _originals:
+                function = getattr(stringhelpers, name)
+                _originals[name] = function
+                setattr(stringhelpers, name, _wrap(name, function))
+
+
+def disable():
+    """Switch off the instrumentation, putting back the original helpers.
+    The statistics recorded so far are kept.
+    """
+    with _lock:
+        for name, function in _originals.items():
+            setattr(stringhelpers, name, function)
+        _originals.clear()
+
+
+def is_enabled():
+    """Return `True` if any of the helpers are instrumented."""
+    return bool(_originals)
+
+
+def reset():
+    """Clear all the statistics recorded so far."""
+    with _lock:
+        for stats in list(_thread_stats):
+            stats.clear()
+
+
+def snapshot():
+    """Return a dictionary of the statistics recorded so far for each helper,
+    with the number of `calls`, their `total_seconds`, and histograms of the
+    `latency_ns` and `input_length`. The histograms map the (exclusive) upper
+    bounds of their buckets, which are powers of two, to the number of calls
+    in each.
+    """
+    merged = {}
+    with _lock:
+        thread_stats = list(_thread_stats)
+    for stats in thread_stats:
+        for name, record in list(stats.items()):
+            calls, elapsed, latencies, lengths = record
+            result = merged.setdefault(name, {
+                'calls': 0, 'total_seconds': 0.0, 'latency_ns': {},
+                'input_length': {}})
+            result['calls'] += calls
+            result['total_seconds'] += elapsed / 1e9
+            for histogram, buckets in (('latency_ns', latencies),
+                                       ('input_length', lengths)):
+                for bucket, number in list(buckets.items()):
+                    bound = 1 << bucket
+                    result[histogram][bound] = \
+                        result[histogram].get(bound, 0) + number
+    return merged
+
+
+def export(file):
+    """Write the statistics recorded so far to `file`, as JSON.
+
+    :param file: text file to write to.
+    """
+    json.dump(snapshot(), file, indent=2, sort_keys=True)
@@ -0,0 +1,84 @@
+"""
+    stringhelpers.parallel
+    ~~~~~~~~~~~~~~~~~~~~~~
+
+    Applying the string helpers to many items at once, spread out on several
+    processes (or threads, on Python builds without the GIL).
+
+    :copyright: (c) 2013 by Thomas Skaflem.
+    :license: MIT, see LICENSE for more details.
+"""
+
+import collections
+import itertools
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+# How long each chunk should take to process, when the chunk size is adapted.
+TARGET_CHUNK_SECONDS = 0.05
+MAX_CHUNKSIZE = 65536
+
+
+def _apply(func, chunk):
+    start = time.time()
+    results = [func(item) for item in chunk]
+    return results, time.time() - start
+
+
+def _executor(workers):
+    if not getattr(sys, '_is_gil_enabled', lambda: True)():
+        return ThreadPoolExecutor(workers)
+    return ProcessPoolExecutor(workers)
+
+
+def pmap(func, iterable, workers=None, chunksize=None):
+    """Return an iterator applying `func` to every item in `iterable`, like
+    `map()`, where the items are sent in chunks to be processed in parallel
+    by `workers` processes. The results are produced in order, as soon as
+    they are ready, while only a few chunks are read ahead of them. Closing
+    the iterator, or leaving it to be garbage collected, cancels any chunks
+    not yet processed.
+
+    As the items and results are sent between processes, `func`, the items
+    and the results must all be picklable, so `func` can not be a lambda.
+
+    :param func: function to apply, like any of the string helpers.
+    :param iterable: iterable of items to apply `func` to.
+    :param workers: number of processes to use. Defaults to the number of
+                    CPUs. With `1`, `func` is applied in this process.
+    :param chunksize: number of items to send at the time. If set to `None`
+                      (default), the chunk size is adapted so each chunk takes
+                      about `TARGET_CHUNK_SECONDS` to process.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        return map(func, iterable)
+    return _pmap(func, iter(iterable), workers, chunksize)
+
+
+def _pmap(func, iterator, workers, chunksize):
+    executor = _executor(workers)
+    pending = collections.deque()
+    size = chunksize or 1
+    try:
+        while True:
+            while len(pending) < workers * 2:
+                chunk = list(itertools.islice(iterator, size))
+                if not chunk:
+                    break
+                pending.append(executor.submit(_apply, func, chunk))
+            if not pending:
+                return
+            results, seconds = pending.popleft().result()
+            if chunksize is None:
+                target = size * TARGET_CHUNK_SECONDS / max(seconds, 1e-6)
+                size = int(max(1, size // 2, min(target, size * 2,
+                                                 MAX_CHUNKSIZE)))
+            for result in results:
+                yield result
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
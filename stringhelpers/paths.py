@@ -0,0 +1,135 @@
+"""
+    stringhelpers.paths
+    ~~~~~~~~~~~~~~~~~~~
+
+    Helpers for file names and paths.
+
+    :copyright: (c) 2013 by Thomas Skaflem.
+    :license: MIT, see LICENSE for more details.
+"""
+
+import os
+
+
+class ExtensionRegistry(object):
+    """A registry of file extensions, kept in a trie of their reversed
+    characters, so telling whether or not a string ends with any of them only
+    takes as long as the longest matching extension.
+
+    :param extensions: list of extensions to register, like `'tar.gz'`.
+    """
+
+    def __init__(self, extensions=()):
+        self._trie = {}
+        for extension in extensions:
+            self.add(extension)
+
+    def add(self, extension):
+        """Register `extension`.
+
+        :param extension: extension to register.
+        """
+        node = self._trie
+        for char in reversed(extension):
+            node = node.setdefault(char, {})
+        node[None] = True
+
+    def remove(self, extension):
+        """Unregister `extension`. If `extension` is not registered
+        `ValueError` is raised.
+
+        :param extension: extension to unregister.
+        """
+        chars = extension[::-1]
+        path = [self._trie]
+        for char in chars:
+            if char not in path[-1]:
+                raise ValueError('%r is not registered' % (extension,))
+            path.append(path[-1][char])
+        if None not in path[-1]:
+            raise ValueError('%r is not registered' % (extension,))
+        del path[-1][None]
+        # Prune the branches which no longer lead to any extension.
+        for i in range(len(chars) - 1, -1, -1):
+            if path[i + 1]:
+                break
+            del path[i][chars[i]]
+
+    def matches(self, string):
+        """Return `True` if `string` ends with any of the registered
+        extensions. `False` otherwise.
+
+        :param string: string to check the ending of.
+        """
+        node = self._trie
+        for i in range(len(string) - 1, -1, -1):
+            node = node.get(string[i])
+            if node is None:
+                return False
+            if None in node:
+                return True
+        return False
+
+    def __contains__(self, extension):
+        node = self._trie
+        for char in reversed(extension):
+            node = node.get(char)
+            if node is None:
+                return False
+        return None in node
+
+
+# The double file extensions always removed by `humanize()`. Any others are
+# given with its `double_extensions` argument.
+DOUBLE_EXTENSIONS = frozenset(['tar.gz', 'tar.bz2'])
+
+_DOUBLE_EXTENSIONS = ExtensionRegistry(DOUBLE_EXTENSIONS)
+
+
+def humanize(string, remove_file_extension=True, double_extensions=None):
+    """Return a copy of `string` where all the occurrences of underscores and
+    dashes are replaced with spaces. If `remove_file_extension` is to `True`,
+    any optional file extension is removed from `string`.
+
+    :param string: string where underscores and dashes will be replaced with
+                   spaces.
+    :pram remove_file_extension: set to `True` to remove any file extension
+                                 from `string`.
+    :pram double_extension: double file extension, or list or
+                            `ExtensionRegistry` of them, to remove in
+                            addition to those in `DOUBLE_EXTENSIONS`, if
+                            `remove_file_extension` is set to `True`.
+    """
+    if isinstance(double_extensions, str):
+        double_extensions = (double_extensions,)
+    if remove_file_extension:
+        root, ext = os.path.splitext(string)
+        if _DOUBLE_EXTENSIONS.matches(string):
+            root, first_ext = os.path.splitext(root)
+        elif isinstance(double_extensions, ExtensionRegistry):
+            if double_extensions.matches(string):
+                root, first_ext = os.path.splitext(root)
+        elif double_extensions and string.endswith(tuple(double_extensions)):
+            root, first_ext = os.path.splitext(root)
+        string = root
+    return string.replace('-', ' ').replace('_', ' ')
+
+
+def strip_slashes(string):
+    """Return a copy of `string` where any leading and trailing slashes is
+    removed.
+
+    :param string: string, or ASCII `bytes`, `bytearray` or `memoryview`, to
+                   remove leading and trailing slashes from. A memoryview is
+                   sliced, without copying it.
+    """
+    if isinstance(string, str):
+        return string.strip('/')
+    if isinstance(string, memoryview):
+        start, end = 0, len(string)
+        while start < end and string[start] == 47:
+            start += 1
+        while end > start and string[end - 1] == 47:
+            end -= 1
+        return string[start:end]
+    return string.strip(b'/')
@@ -0,0 +1,111 @@
+"""
+    stringhelpers.random
+    ~~~~~~~~~~~~~~~~~~~~
+
+    Helpers generating random strings.
+
+    :copyright: (c) 2013 by Thomas Skaflem.
+    :license: MIT, see LICENSE for more details.
+"""
+
+import os
+import random
+
+
+CHOICES = '0aA1bB2cC3dD4eE5fF6gG7hH8iI9jJkKlLmMnNoOpPqQrRsStTuUvVwWxXyYzZ'
+PASSWORD_SAFE_CHOICES = \
+    'aA1bB2cC3dD4eE5fF6gG7hH8iI9jJkKlLmMnNpPqQrRsStTuUvVwWxXyYzZ'
+
+_alphabet_tables = {}
+
+
+def _random_bytes(size, secure):
+    if secure:
+        return os.urandom(size)
+    randbytes = getattr(random, 'randbytes', None)
+    if randbytes is not None:
+        return randbytes(size)
+    return bytes(bytearray(random.getrandbits(8) for i in range(size)))
+
+
+def _random_chars(count, alphabet, secure):
+    """Return a string of `count` characters picked at random from
+    `alphabet`. Random bytes are drawn in bulk and mapped to the characters
+    with `bytes.translate()`, where the bytes that would make some characters
+    more likely than others are rejected.
+    """
+    if alphabet not in _alphabet_tables:
+        size = len(alphabet)
+        if 0 < size <= 256 and all(ord(char) < 128 for char in alphabet):
+            limit = 256 - 256 % size
+            table = bytes(bytearray(ord(alphabet[byte % size])
+                                    for byte in range(256)))
+            rejected = bytes(bytearray(range(limit, 256)))
+            _alphabet_tables[alphabet] = (table, rejected, limit)
+        else:
+            _alphabet_tables[alphabet] = None
+
+    if _alphabet_tables[alphabet] is None:
+        choice = random.SystemRandom().choice if secure else random.choice
+        return ''.join(choice(alphabet) for i in range(count))
+
+    table, rejected, limit = _alphabet_tables[alphabet]
+    chunks = []
+    missing = count
+    while missing > 0:
+        data = _random_bytes(missing * 256 // limit + 16, secure)
+        data = data.translate(table, rejected)[:missing]
+        chunks.append(data)
+        missing -= len(data)
+    return b''.join(chunks).decode('ascii')
+
+
+def random_string(length=6, password_safe=False):
+    """Return a random string of `length` characters generated by the
+    alphanumeric characters, a-z, A-Z and 0-9.
+
+    :param length: number of characters to generate (default 6 characters).
+    :param password_safe: if set to `True` o, O and 0 is excluded.
+    """
+    choices = PASSWORD_SAFE_CHOICES if password_safe else CHOICES
+    return _random_chars(length, choices, secure=False)
+
+
+def _iter_random_strings(n, length, alphabet, secure, unique):
+    seen = set()
+    while n > 0:
+        batch = min(n, 4096)
+        chars = _random_chars(batch * length, alphabet, secure)
+        for i in range(0, batch * length or batch, length or 1):
+            token = chars[i:i + length]
+            if unique:
+                if token in seen:
+                    continue
+                seen.add(token)
+            n -= 1
+            yield token
+
+
+def random_strings(n, length=6, alphabet=CHOICES, secure=True, unique=False,
+                   lazy=False):
+    """Return a list of `n` random strings of `length` characters each,
+    generated by the characters in `alphabet`. The random characters are drawn
+    in bulk, which is a lot faster than calling `random_string()` `n` times.
+
+    :param n: number of strings to generate.
+    :param length: number of characters in each string (default 6).
+    :param alphabet: characters to generate the strings by. Defaults to
+                     `CHOICES`, while `PASSWORD_SAFE_CHOICES` leaves out o, O
+                     and 0.
+    :param secure: if set to `True` (default), the strings are generated from
+                   `os.urandom()`, and are suitable for passwords and tokens.
+                   If set to `False` the `random` module is used instead.
+    :param unique: set to `True` to guarantee that no strings repeats.
+    :param lazy: set to `True` to return an iterator producing the strings,
+                 instead of a list.
+    """
+    if unique and len(set(alphabet)) ** length < n:
+        raise ValueError('cannot generate %d unique strings of length %d'
+                         % (n, length))
+    strings = _iter_random_strings(n, length, alphabet, secure, unique)
+    return strings if lazy else list(strings)
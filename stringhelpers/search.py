@@ -0,0 +1,516 @@
+"""
+    stringhelpers.search
+    ~~~~~~~~~~~~~~~~~~~~
+
+    Helpers searching after, counting and replacing items in strings and
+    lists.
+
+    :copyright: (c) 2013 by Thomas Skaflem.
+    :license: MIT, see LICENSE for more details.
+"""
+
+import collections
+import re
+
+from . import _tokens
+from ._bytes import BYTES_TYPES
+from ._cache import _PatternCache
+from .sequences import flatten
+
+
+_pattern_cache = _PatternCache()
+
+
+def pattern_cache_info():
+    """Return the statistics of the cache of compiled patterns used by
+    `count()` and `count_many()`, as a `CacheInfo(hits, misses, maxsize,
+    currsize)` tuple.
+    """
+    return _pattern_cache.info()
+
+
+def clear_pattern_cache():
+    """Clear the cache of compiled patterns, and its statistics."""
+    _pattern_cache.clear()
+
+
+def count_items(string):
+    """Return the number of items in `string`, without making a list of them.
+
+    :param string: string to count for items.
+    """
+    return _tokens.count(string)
+
+
+def word_spans(string):
+    """Return an iterator over the `(start, end)` positions of the words in
+    `string`, which are found lazily, without copying them out.
+
+    :param string: string to find the words in.
+    """
+    return _tokens.spans(string)
+
+
+def word_frequencies(text, top_k=None, case_sensitive=False):
+    """Return a list of `(word, count)` pairs with the number of times each
+    word is found in `text`, the most frequent first. The words are counted
+    in a single pass over `text`, and the `top_k` most frequent are picked
+    out through a heap.
+
+    :param text: string to count the words in.
+    :param top_k: number of words to return. If set to `None` (default), all
+                  the words are returned.
+    :param case_sensitive: if set to `True`, words differing in case are
+                           counted apart. Otherwise they are counted
+                           lowercased.
+    """
+    counts = collections.Counter()
+    for window in _tokens.windows(text):
+        counts.update((window if case_sensitive else window.lower()).split())
+    return counts.most_common(top_k)
+
+
+class ListIndex(object):
+    """A reusable index of the items in a nested list, to do the same
+    case-insensitive searches as `in_list()` without going through the whole
+    list on every search. Items can be added and removed afterwards, without
+    having to rebuild the index.
+
+    :param list_to_index: list, optionally nested, of items to index.
+    """
+
+    def __init__(self, list_to_index=()):
+        self._strings = {}
+        self._numbers = {}
+        self._size = 0
+        self._position = 0
+        self.add(list_to_index)
+
+    def _table_of(self, item):
+        """Return a tuple of the table the occurrences of `item` are kept in,
+        and their key in it."""
+        if isinstance(item, str):
+            return self._strings, item.lower()
+        return self._numbers, item
+
+    def add(self, item):
+        """Add `item` to the index. If `item` is a list, all of its items are
+        added, as flattened by `flatten()`.
+
+        :param item: item, or list of items, to add.
+        """
+        items = [item] if not hasattr(item, '__iter__') or \
+            isinstance(item, str) else flatten(item)
+        for item in items:
+            if isinstance(item, (str, int, float)):
+                table, key = self._table_of(item)
+                table.setdefault(key, []).append((self._position, item))
+                self._size += 1
+            self._position += 1
+
+    def remove(self, item):
+        """Remove the first added occurrence of `item` from the index. If
+        `item` is not found `ValueError` is raised.
+
+        :param item: item to remove.
+        """
+        if isinstance(item, (str, int, float)):
+            table, key = self._table_of(item)
+            occurrences = table.get(key, ())
+            for i, (position, value) in enumerate(occurrences):
+                if value == item and type(value) is type(item):
+                    del occurrences[i]
+                    if not occurrences:
+                        del table[key]
+                    self._size -= 1
+                    return
+        raise ValueError('%r is not in the index' % (item,))
+
+    def _search(self, search_after):
+        found = self._strings.get(str(search_after).lower(), [])
+        try:
+            numbers = self._numbers.get(search_after)
+        except TypeError:
+            numbers = None
+        if numbers:
+            found = sorted(found + numbers) if found else numbers
+        return found
+
+    def find(self, search_after, frequency_count=False):
+        """Return the same as `in_list()` would when searching after
+        `search_after` in the indexed items.
+
+        :param search_after: the item to search after.
+        :param frequency_count: if set to `True` only the frequency count of
+                                `search_after` is returned.
+        """
+        found = self._search(search_after)
+        if frequency_count:
+            return len(found)
+        if len(found) == 1:
+            return found[0][1]
+        elif len(found) > 1:
+            return [item for position, item in found]
+        else:
+            return False
+
+    def frequency_count(self, search_after):
+        """Return the frequency count of `search_after` in the indexed items.
+
+        :param search_after: the item to search after.
+        """
+        return len(self._search(search_after))
+
+    def __contains__(self, search_after):
+        return bool(self._search(search_after))
+
+    def __len__(self):
+        return self._size
+
+
+def in_list(search_after, list_to_search_in, frequency_count=False):
+    """Doing a recursively case-insensitive search for `search_after` in
+    `list`. If `search_after` is found only once the first occurrence is
+    returned. If `search_after` is found several times a new list with all the
+    occurrences are returned. If `search_after` not is found in `list` `False`
+    is returned.
+
+    :param search_after: the item to search after.
+    :param list: list, or `ListIndex`, to search after `search_after` in.
+    :param frequency_count: if set to `True` only the frequency count of
+                            `search_after` in `list` is returned.
+    """
+    if isinstance(list_to_search_in, ListIndex):
+        return list_to_search_in.find(search_after, frequency_count)
+
+    result = []
+    for item in flatten(list_to_search_in):
+        if isinstance(item, str) and item.lower() == str(search_after).lower():
+            result.append(item)
+        elif isinstance(item, (int, float)) and item == search_after:
+            result.append(item)
+
+    if frequency_count:
+        return len(result)
+    else:
+        if len(result) == 1:
+            return result[0]
+        elif len(result) > 1:
+            return result
+        else:
+            return False
+
+
+class _Automaton(object):
+    """An Aho-Corasick automaton over the items in `patterns`, to find all
+    of them in a single left-to-right pass over a string.
+
+    :param patterns: iterable of `(pattern, value)` pairs, where `value` is
+                     reported for every match of `pattern`. Empty patterns are
+                     ignored.
+    :param ignore_case: set to `False` to match the patterns case-sensitively.
+                        Otherwise each character is lowercased on its own.
+    """
+
+    def __init__(self, patterns, ignore_case=True):
+        goto, depth, output = [{}], [0], [None]
+        for pattern, value in patterns:
+            state = 0
+            for char in pattern:
+                symbol = char.lower() if ignore_case else char
+                if symbol not in goto[state]:
+                    goto[state][symbol] = len(goto)
+                    goto.append({})
+                    depth.append(depth[state] + 1)
+                    output.append(None)
+                state = goto[state][symbol]
+            if state:
+                output[state] = value
+
+        # Breadth-first construction of the failure links, and the links to
+        # the nearest state (through the failure links) where a pattern ends.
+        fail, link = [0] * len(goto), [0] * len(goto)
+        queue = list(goto[0].values())
+        for state in queue:
+            for symbol, child in goto[state].items():
+                fallback = fail[state]
+                while fallback and symbol not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[child] = goto[fallback].get(symbol, 0)
+                if fail[child] == child:
+                    fail[child] = 0
+                target = fail[child]
+                link[child] = target if output[target] is not None \
+                    else link[target]
+                queue.append(child)
+
+        self._goto, self._fail, self._link = goto, fail, link
+        self._depth, self._output = depth, output
+        self._ignore_case = ignore_case
+
+        # Used to jump straight to the next possible start of a match while
+        # the automaton is idle, instead of stepping through every character.
+        self._skip = None
+        if goto[0] and all(len(symbol) == 1 for symbol in goto[0]):
+            self._skip = re.compile(
+                '[%s]' % ''.join(re.escape(symbol) for symbol in goto[0]),
+                re.I | re.UNICODE if ignore_case else re.UNICODE)
+
+    def iter_matches(self, string):
+        """Yield a `(start, end, value)` tuple for every match, overlapping
+        ones included, ordered by their end position.
+
+        :param string: string to search in.
+        """
+        goto, fail, link = self._goto, self._fail, self._link
+        depth, output, skip = self._depth, self._output, self._skip
+        ignore_case = self._ignore_case
+        if not goto[0]:
+            return
+
+        state = position = 0
+        length = len(string)
+        while True:
+            if skip is not None and not state:
+                match = skip.search(string, position)
+                if not match:
+                    return
+                position = match.start()
+            elif position >= length:
+                return
+            char = string[position]
+            symbol = char.lower() if ignore_case else char
+            while state and symbol not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(symbol, 0)
+            position += 1
+            node = state if output[state] is not None else link[state]
+            while node:
+                yield position - depth[node], position, output[node]
+                node = link[node]
+
+
+class IReplacer(_Automaton):
+    """A reusable case-insensitive search-and-replace automaton.
+
+    All the keys in `replacements` are lowercased character by character and
+    compiled once into an Aho-Corasick automaton, so every pattern can be
+    replaced in a single left-to-right pass over a string. Where several
+    patterns overlap, the leftmost one wins, and of those starting at the same
+    position the longest one wins. Empty patterns are ignored.
+
+    :param replacements: dictionary, or iterable of `(old, new)` pairs, mapping
+                         each item to search after to its replacement.
+    """
+
+    def __init__(self, replacements):
+        if hasattr(replacements, 'items'):
+            replacements = replacements.items()
+        super(IReplacer, self).__init__(replacements)
+
+    def replace(self, string):
+        """Return a copy of `string` where all the occurrences of the patterns
+        are replaced by their replacements.
+
+        :param string: string to search-and-replace in.
+        """
+        if not self._goto[0]:
+            return string
+        return ''.join(self.replace_chunks((string,)))
+
+    def replace_chunks(self, chunks):
+        """Return an iterator over the pieces of a copy of the text in
+        `chunks`, where all the occurrences of the patterns are replaced by
+        their replacements. Occurrences spanning several chunks are replaced
+        as well, while only the text which might still be part of an
+        occurrence is held back.
+
+        :param chunks: iterable of strings, which is searched as one string.
+        """
+        feeder = self.feeder()
+        next(feeder)
+        for chunk in chunks:
+            for piece in _feed(feeder, chunk):
+                yield piece
+        for piece in _feed(feeder, None):
+            yield piece
+
+    def feeder(self):
+        """Return a generator doing what `replace_chunks()` does, for text
+        which is pushed to it instead. Once started with `next()`, the
+        generator yields `None` whenever it needs the next chunk, which is
+        then sent to it with `send()`, or `None` at the end of the text. Any
+        other time, it yields the next piece of the replaced text.
+        """
+        goto, fail, link = self._goto, self._fail, self._link
+        depth, output, skip = self._depth, self._output, self._skip
+
+        buffer = ''
+        last = 0  # end of the last replaced occurrence
+        pending = None  # (start, end, new) of the best candidate so far
+        state = position = length = 0
+        done = False
+        while True:
+            if skip is not None and not state and pending is None:
+                match = skip.search(buffer, position)
+                position = match.start() if match else length
+            if position < length:
+                symbol = buffer[position].lower()
+                while state and symbol not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(symbol, 0)
+                position += 1
+                if pending is None or position - depth[state] <= pending[0]:
+                    node = state if output[state] is not None else link[state]
+                    while node:
+                        start = position - depth[node]
+                        if pending is None or start < pending[0] or \
+                                start == pending[0] and position > pending[1]:
+                            pending = (start, position, output[node])
+                        node = link[node]
+                    continue
+                # No later match can start at, or before, the pending one.
+            else:
+                if not done:
+                    chunk = yield None
+                    if chunk is not None:
+                        # Produce the text before where any later match can
+                        # start.
+                        hold = position - depth[state]
+                        if pending is not None:
+                            hold = min(hold, pending[0])
+                        if hold > last:
+                            yield buffer[last:hold]
+                        buffer = buffer[hold:] + chunk
+                        length = len(buffer)
+                        position -= hold
+                        if pending is not None:
+                            pending = (pending[0] - hold, pending[1] - hold,
+                                       pending[2])
+                        last = 0
+                        continue
+                    # The end of the text; the rest of the buffer is scanned
+                    # without asking for more.
+                    done = True
+                if pending is None:
+                    if last < length:
+                        yield buffer[last:]
+                    return
+            if pending[0] > last:
+                yield buffer[last:pending[0]]
+            yield pending[2]
+            last = position = pending[1]
+            pending = None
+            state = 0
+
+    __call__ = replace
+
+
+def _feed(feeder, chunk):
+    """Return the list of pieces produced by the `IReplacer.feeder()`
+    `feeder` after sending `chunk` to it."""
+    pieces = []
+    try:
+        piece = feeder.send(chunk)
+        while piece is not None:
+            pieces.append(piece)
+            piece = next(feeder)
+    except StopIteration:
+        pass
+    return pieces
+
+
+def ireplace_many(replacements, string):
+    """Return a copy of `string` where all the occurrences of a
+    case-insensitive search after each key in `replacements` is replaced with
+    its value, in one single pass over `string`.
+
+    :param replacements: dictionary mapping the items to search after to their
+                         replacements, or an already built `IReplacer`.
+    :param string: string to search-and-replace in.
+    """
+    if not isinstance(replacements, IReplacer):
+        replacements = IReplacer(replacements)
+    return replacements.replace(string)
+
+
+def ireplace(old, new, string):
+    """Return a copy of `string` where all the occurrences of a
+    case-insensitive search after `old` is replaced with `new`.
+
+    :param old: the item in `string` to do a case-insensitive search after.
+    :param new: new item to replace `old` with.
+    :param string: string to search-and-replace `old` with `new` in.
+    """
+    return ireplace_many(((old, new),), string)
+
+
+def count(item, string, case_sensitive=False, literal=False):
+    """Return the exact number of how many times `item` is found in `string`.
+
+    :param item: item to count the occurrences of in `string`
+    :param string: string to count occurrences of `item` in.
+    :param case_sensitive: if set to `True`, the search after `item` is
+                           case-sensetive.
+    :param literal: if set to `True`, `item` is searched after as plain text,
+                    instead of as a regular expression.
+    """
+    if isinstance(string, BYTES_TYPES):
+        return _count_bytes(item, string, case_sensitive, literal)
+    item = str(item)
+    if literal:
+        if case_sensitive:
+            return string.count(item)
+        return string.lower().count(item.lower())
+    flags = 0 if case_sensitive else re.I
+    pattern = _pattern_cache.get(('re', item, flags),
+                                 lambda: re.compile(item, flags))
+    return len(pattern.findall(string))
+
+
+def _count_bytes(item, string, case_sensitive, literal):
+    """Return the same as `count()`, for `string` being bytes-like, which is
+    searched without being decoded or copied."""
+    if not isinstance(item, bytes):
+        item = str(item).encode('utf-8')
+    if literal:
+        if case_sensitive and not isinstance(string, memoryview):
+            return string.count(item)
+        item = re.escape(item)
+    flags = 0 if case_sensitive else re.I
+    pattern = _pattern_cache.get(('re', item, flags),
+                                 lambda: re.compile(item, flags))
+    return len(pattern.findall(string))
+
+
+def count_many(items, string, case_sensitive=False):
+    """Return a dictionary with the exact number of how many times each of
+    the `items` is found in `string`, all counted in a single pass over
+    `string`. The items are searched after as plain text.
+
+    :param items: list of items to count the occurrences of in `string`.
+    :param string: string to count occurrences of `items` in.
+    :param case_sensitive: if set to `True`, the search after `items` is
+                           case-sensetive.
+    """
+    items = list(items)
+    needles = tuple(str(item) for item in items)
+    if case_sensitive:
+        keys = needles
+    else:
+        keys = tuple(''.join(char.lower() for char in needle)
+                     for needle in needles)
+    automaton = _pattern_cache.get(
+        ('ac', needles, case_sensitive),
+        lambda: _Automaton(zip(needles, keys), not case_sensitive))
+
+    counts = dict.fromkeys(keys, 0)
+    ends = {}
+    for start, end, key in automaton.iter_matches(string):
+        # Occurrences of the same item are counted without overlapping.
+        if start >= ends.get(key, 0):
+            counts[key] += 1
+            ends[key] = end
+    if '' in counts:
+        counts[''] = len(string) + 1
+    return dict((item, counts[key]) for item, key in zip(items, keys))
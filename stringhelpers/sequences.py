@@ -0,0 +1,1128 @@
+"""
+    stringhelpers.sequences
+    ~~~~~~~~~~~~~~~~~~~~~~~
+
+    Helpers for lists, tuples and other sequences, and for strings as
+    sequences of characters or words.
+
+    :copyright: (c) 2013 by Thomas Skaflem.
+    :license: MIT, see LICENSE for more details.
+"""
+
+import array
+import collections.abc
+import gzip
+import heapq
+import itertools
+import json
+import locale
+import operator
+import pickle
+import re
+import sys
+import tempfile
+
+from . import _tokens
+
+
+class SliceView(collections.abc.Sequence):
+    """A read-only view of the items of `sequence` picked out by `start`,
+    `stop` and `step`, like by `sequence[start:stop:step]`, but without
+    copying them. The view supports `len()`, indexing, iteration and
+    slicing, where slicing a view returns another view of `sequence`.
+    Changes to `sequence` show through the view, as long as its length
+    stays the same.
+
+    :param sequence: sequence to view, like a list, tuple or string.
+    :param start: index of the first item to view.
+    :param stop: index to stop viewing the items at.
+    :param step: step between the items to view.
+    """
+
+    __slots__ = ('_sequence', '_indices')
+
+    def __init__(self, sequence, start=None, stop=None, step=None):
+        if isinstance(sequence, SliceView):
+            indices = sequence._indices
+            sequence = sequence._sequence
+        else:
+            indices = range(len(sequence))
+        self._sequence = sequence
+        self._indices = indices[start:stop:step]
+
+    def __len__(self):
+        return len(self._indices)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return SliceView(self, index.start, index.stop, index.step)
+        return self._sequence[self._indices[index]]
+
+    def __iter__(self):
+        return map(self._sequence.__getitem__, self._indices)
+
+    def __reversed__(self):
+        return map(self._sequence.__getitem__, reversed(self._indices))
+
+    def __eq__(self, other):
+        if not isinstance(other, collections.abc.Sequence):
+            return NotImplemented
+        return len(self) == len(other) and \
+            all(a == b for a, b in zip(self, other))
+
+    __hash__ = None
+
+    def __repr__(self):
+        return '%s(<%s>, %r)' % (type(self).__name__,
+                                 type(self._sequence).__name__, self._indices)
+
+
+class ReversedView(SliceView):
+    """A read-only view of the items of `sequence` in reverse order, without
+    copying them, like a `SliceView` of `sequence[::-1]`.
+
+    :param sequence: sequence to view, like a list, tuple or string.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, sequence):
+        SliceView.__init__(self, sequence, None, None, -1)
+
+
+def reverse(string, view=False):
+    """Return a copy of `string` reversed.
+
+    :param string: string, or `bytes`, `bytearray` or `memoryview`, to
+                   reverse. A memoryview is reversed without copying it.
+    :param view: set to `True` to return a `ReversedView` of `string` instead
+                 of a copy.
+    """
+    if view:
+        return ReversedView(string)
+    return string[::-1]
+
+
+def reverse_order(item, view=False):
+    """Return a copy of `item` where all the elements are in a reverse order.
+    If `item` is a single string, the words will be separated by whitespaces.
+
+    :param item: string or list where the order of elements should be reversed.
+    :param view: set to `True` to return a `ReversedView` of a list or tuple
+                 `item`, instead of a copy.
+    """
+    if isinstance(item, str):
+        return ' '.join(reversed(item.split()))
+    if isinstance(item, (list, tuple)):
+        return ReversedView(item) if view else item[::-1]
+    else:
+        return item
+
+
+def list_to_string(list, separator=", "):
+    """Return a new string thats created by converting each items in `list` to
+    a new string, where each word is separated by `separator`.
+
+    :param list: list of iterable items to covert to a string.
+    :param separator: character to use as a separator between the list items.
+    """
+    return separator.join(map(str, list))
+
+
+def iflatten(iterable, max_depth=None, unique=False):
+    """Return an iterator over the items in `iterable`, where any nested
+    lists (or other iterables but strings) are flattened out. The items are
+    produced one at a time, so even very large or deeply nested iterables can
+    be flattened without being copied.
+
+    :param iterable: iterable to flatten out.
+    :param max_depth: the maximum number of levels to flatten out. Items nested
+                      deeper are produced as they are. If set to `None`
+                      (default), all levels are flattened out.
+    :param unique: set to `True` to skip any items that has already been
+                   produced, keeping the order of the first occurrences.
+    :raises ValueError: if an iterable contains itself.
+    """
+    stack = [iter(iterable)]
+    # The ids of the iterables being flattened, to catch any that contain
+    # themselves, which would otherwise be flattened out forever.
+    containers = [id(iterable)]
+    active = set(containers)
+    seen = set()
+    seen_unhashable = []
+    while stack:
+        for item in stack[-1]:
+            if hasattr(item, '__iter__') and not isinstance(item, str) and \
+                    (max_depth is None or len(stack) <= max_depth):
+                if id(item) in active:
+                    raise ValueError('cannot flatten an iterable that '
+                                     'contains itself')
+                stack.append(iter(item))
+                containers.append(id(item))
+                active.add(id(item))
+                break
+            if unique:
+                try:
+                    if item in seen:
+                        continue
+                    seen.add(item)
+                except TypeError:
+                    if item in seen_unhashable:
+                        continue
+                    seen_unhashable.append(item)
+            yield item
+        else:
+            stack.pop()
+            active.discard(containers.pop())
+
+
+def flatten(list_to_flatten, remove_duplicates=False):
+    """Return a flattened copy of `list_to_flatten`. If `remove_duplicates`
+    is set to `True`, duplicated item in `list_to_flatten` is removed.
+
+    :param list_to_flatten: list to flatten out.
+    :param remove_duplicates: set to `True` to remove duplicated items in
+                              `list_to_flatten`, keeping the first occurrence
+                              of each item. If set to `False` (default),
+                              duplicates are preserved.
+    """
+    return list(iflatten(list_to_flatten, unique=remove_duplicates))
+
+
+_INT_TYPECODES = 'bBhHiIlLqQ'
+
+# Parity codes of the items in sequences of numbers: 1 for odd numbers, 0 for
+# even numbers and 2 for anything else. `_LOW_BIT` maps the lowest byte of a
+# number to its code, and `_ODD` and `_EVEN` map the codes to masks.
+_LOW_BIT = bytes(bytearray(i & 1 for i in range(256)))
+_ODD = bytes(bytearray([0, 1] + [0] * 254))
+_EVEN = bytes(bytearray([1] + [0] * 255))
+
+
+def _parity(number):
+    try:
+        return int(number) & 1
+    except Exception:
+        return 2
+
+
+def _is_numpy_array(values):
+    return type(values).__module__ == 'numpy' and hasattr(values, 'dtype')
+
+
+def _parity_codes(values):
+    """Return a bytes object with the parity code of every item in `values`.
+    Integers which fit in an `array.array` are all coded at once, by picking
+    out the lowest byte of each of them.
+    """
+    ints = None
+    if isinstance(values, array.array):
+        if values.typecode in _INT_TYPECODES:
+            ints = values
+    else:
+        try:
+            ints = array.array('q', values)
+        except (TypeError, OverflowError):
+            pass
+    if ints is None:
+        return bytes(bytearray(map(_parity, values)))
+    size = ints.itemsize
+    offset = 0 if sys.byteorder == 'little' else size - 1
+    return memoryview(ints).cast('B')[offset::size].tobytes() \
+        .translate(_LOW_BIT)
+
+
+def _numpy_masks(values):
+    """Return the boolean masks of the odd and even numbers in the NumPy
+    array `values`."""
+    numpy = sys.modules['numpy']
+    kind = values.dtype.kind
+    if kind in 'biu':
+        odds = (values & 1).astype(bool)
+        return odds, ~odds
+    if kind == 'f':
+        with numpy.errstate(invalid='ignore'):
+            remainders = numpy.fmod(numpy.trunc(values), 2)
+        finite = numpy.isfinite(values)
+        return finite & (remainders != 0), finite & (remainders == 0)
+    codes = numpy.array([_parity(value) for value in values.ravel().tolist()],
+                        dtype=numpy.uint8).reshape(values.shape)
+    return codes == 1, codes == 0
+
+
+def _is_number(number):
+    return isinstance(number, (str, bytes, bytearray)) or \
+        not hasattr(number, '__iter__')
+
+
+def _select(values, odds, filtered):
+    if _is_numpy_array(values):
+        mask = _numpy_masks(values)[0 if odds else 1]
+        return values[mask] if filtered else mask
+    if not isinstance(values, (list, tuple, range, array.array)):
+        values = list(values)
+    mask = _parity_codes(values).translate(_ODD if odds else _EVEN)
+    if not filtered:
+        return list(map(bool, mask))
+    selected = itertools.compress(values, mask)
+    if isinstance(values, array.array):
+        return array.array(values.typecode, selected)
+    return list(selected)
+
+
+def odd(number, filtered=False):
+    """Return `True` if `number` is odd. `False` otherwise.
+
+    If `number` is a sequence of numbers, like a list, an `array.array` or a
+    NumPy array, a mask telling whether each of them is odd is returned
+    instead, as a list of booleans, or as a boolean NumPy array for NumPy
+    arrays. Integers are checked all at once, by their lowest bits.
+
+    :param number: number, or iterable of numbers, to check if is odd or not.
+    :param filtered: set to `True` to return the odd numbers of the iterable
+                     `number`, instead of a mask, as an `array.array` or NumPy
+                     array for those, and as a list otherwise.
+    """
+    if not _is_number(number):
+        return _select(number, True, filtered)
+    try:
+        return int(number) & 0x1 == 1
+    except:
+        return False
+
+
+def even(number, filtered=False):
+    """Return `True if `number` is even. `False` otherwise.
+
+    If `number` is a sequence of numbers, like a list, an `array.array` or a
+    NumPy array, a mask telling whether each of them is even is returned
+    instead, as a list of booleans, or as a boolean NumPy array for NumPy
+    arrays. Integers are checked all at once, by their lowest bits.
+
+    :param number: number, or iterable of numbers, to check if is even or not.
+    :param filtered: set to `True` to return the even numbers of the iterable
+                     `number`, instead of a mask, as an `array.array` or NumPy
+                     array for those, and as a list otherwise.
+    """
+    if not _is_number(number):
+        return _select(number, False, filtered)
+    try:
+        return int(number) % 2 == 0
+    except:
+        return False
+
+
+def partition_parity(values):
+    """Return a tuple of the odd numbers, and of the even numbers, in
+    `values`, split up in one pass. Items which are not numbers are in
+    neither.
+
+    :param values: iterable of numbers, like a list, an `array.array` or a
+                   NumPy array. The odd and even numbers are returned as the
+                   same type of arrays for those, and as lists otherwise.
+    """
+    if _is_numpy_array(values):
+        odds, evens = _numpy_masks(values)
+        return values[odds], values[evens]
+    if not isinstance(values, (list, tuple, range, array.array)):
+        values = list(values)
+    codes = _parity_codes(values)
+    odds = itertools.compress(values, codes.translate(_ODD))
+    evens = itertools.compress(values, codes.translate(_EVEN))
+    if isinstance(values, array.array):
+        return (array.array(values.typecode, odds),
+                array.array(values.typecode, evens))
+    return list(odds), list(evens)
+
+
+_MAX_RUNS = 64
+
+
+def _write_run(items):
+    """Return a temporary file with all of `items` pickled in batches."""
+    run = tempfile.TemporaryFile()
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == 1024:
+            pickle.dump(batch, run, pickle.HIGHEST_PROTOCOL)
+            batch = []
+    if batch:
+        pickle.dump(batch, run, pickle.HIGHEST_PROTOCOL)
+    run.seek(0)
+    return run
+
+
+def _read_run(run, close=True):
+    """Yield all the items pickled in `run`, and close it, unless `close` is
+    set to `False`."""
+    try:
+        while True:
+            for item in pickle.load(run):
+                yield item
+    except EOFError:
+        pass
+    finally:
+        if close:
+            run.close()
+
+
+def _sort_runs_by_string(runs, reverse, max_memory):
+    """Sort the items in each of the `runs` again, by their string values,
+    streaming each of them through another external sort."""
+    for i, run in enumerate(runs):
+        runs[i] = _write_run(_external_sort(_read_run(run), reverse,
+                                            max_memory, str))
+
+
+def _sort_items(items, key, reverse, runs, max_memory):
+    """Sort `items` in place, and return the key used. If the items are not
+    comparable with each other, they, and all the `runs` already sorted, are
+    sorted by their string values instead.
+    """
+    try:
+        items.sort(key=key, reverse=reverse)
+    except TypeError:
+        # `items` contains not only strings.
+        key = str
+        _sort_runs_by_string(runs, reverse, max_memory)
+        items.sort(key=key, reverse=reverse)
+    return key
+
+
+def _merge_runs(runs, key, reverse, max_memory):
+    """Return a tuple of a run with all the items of `runs` merged, and the
+    key used. If the items turn out not to be comparable with each other
+    while merging, all the runs are sorted and merged by their string values
+    instead.
+    """
+    try:
+        merged = _write_run(heapq.merge(
+            *[_read_run(run, close=False) for run in runs], key=key,
+            reverse=reverse))
+    except TypeError:
+        for run in runs:
+            run.seek(0)
+        key = str
+        _sort_runs_by_string(runs, reverse, max_memory)
+        merged = _write_run(heapq.merge(*[_read_run(run) for run in runs],
+                                        key=key, reverse=reverse))
+    else:
+        for run in runs:
+            run.close()
+    return merged, key
+
+
+# Kinds of items which are always comparable with each other.
+_COMPARABLE_KINDS = (str, bytes, 'number')
+
+
+def _external_sort(iterable, reverse, max_memory, key=None):
+    """Yield the items of `iterable` sorted, keeping about `max_memory` bytes
+    of them in memory at the time. Sorted chunks are written to temporary
+    files, which are merged together at the end.
+    """
+    runs = []
+    chunk = []
+    size = 0
+    kind = None
+    strings = others = False
+    for item in iterable:
+        if key is None:
+            if isinstance(item, str):
+                strings = True
+            else:
+                others = True
+            if strings and others:
+                # Strings can not be compared with anything else, and the
+                # sort order would differ if some chunks only happens to
+                # contain strings, so like by `sort()`, all the items are
+                # sorted by their string values right away.
+                key = str
+                _sort_runs_by_string(runs, reverse, max_memory)
+            elif kind != 'mixed':
+                item_kind = 'number' if isinstance(item, (int, float)) \
+                    else type(item)
+                if kind is None:
+                    kind = item_kind
+                elif item_kind != kind:
+                    kind = 'mixed'
+        chunk.append(item)
+        size += sys.getsizeof(item) + 8
+        if size >= max_memory:
+            key = _sort_items(chunk, key, reverse, runs, max_memory)
+            runs.append(_write_run(chunk))
+            chunk, size = [], 0
+            if len(runs) >= _MAX_RUNS:
+                run, key = _merge_runs(runs, key, reverse, max_memory)
+                runs = [run]
+
+    key = _sort_items(chunk, key, reverse, runs, max_memory)
+    if runs and key is None and kind not in _COMPARABLE_KINDS:
+        # Items like tuples might only fail to compare while merging, so
+        # they are merged before any of them are yielded.
+        runs.append(_write_run(chunk))
+        run, key = _merge_runs(runs, key, reverse, max_memory)
+        runs, chunk = [run], []
+    for item in heapq.merge(*[_read_run(run) for run in runs] + [chunk],
+                            key=key, reverse=reverse):
+        yield item
+
+
+_NATURAL = re.compile(r'(\d+)')
+
+
+def _natural_key(string):
+    """Return the key to sort `string` in natural order by, where runs of
+    digits are compared as numbers."""
+    parts = _NATURAL.split(string)
+    parts[1::2] = map(int, parts[1::2])
+    return tuple(parts)
+
+
+_SORT_KEYS = {
+    'natural': _natural_key,
+    'casefold': str.casefold,
+    'locale': locale.strxfrm,
+}
+
+# The number of natural sort keys to keep cached between calls to `sort()`.
+# The other keys are computed by a single call to a string method or to
+# `locale.strxfrm()`, which is as fast as looking them up.
+_KEY_CACHE_SIZE = 65536
+
+
+class _KeyCache(dict):
+    """The sort keys of strings, where missing keys are computed by
+    `function`."""
+
+    __slots__ = ('function',)
+
+    def __init__(self, function):
+        self.function = function
+
+    def __missing__(self, string):
+        key = self[string] = self.function(string)
+        return key
+
+
+_natural_keys = _KeyCache(_natural_key)
+
+
+def _sort_key(name):
+    """Return the function computing the sort keys named `name`."""
+    try:
+        return _SORT_KEYS[name]
+    except KeyError:
+        raise ValueError('unknown sort key %r' % (name,))
+
+
+def _by_string(function):
+    """Return a sort key function applying `function` to the string value of
+    every item."""
+    def key(item):
+        return function(str(item))
+    return key
+
+
+def _sorted_by(items, name, reverse):
+    """Return a list of `items` sorted by the sort keys named `name` of
+    their string values."""
+    function = _sort_key(name)
+    if function is _natural_key:
+        function = _natural_keys.__getitem__
+    key = function if set(map(type, items)) <= {str} else \
+        _by_string(function)
+    try:
+        return sorted(items, key=key, reverse=reverse)
+    finally:
+        if len(_natural_keys) > _KEY_CACHE_SIZE:
+            _natural_keys.clear()
+
+
+def _mixed(items):
+    """Return `True` if `items` contains both strings and other items, which
+    can not be compared with each other."""
+    strings = [issubclass(kind, str) for kind in set(map(type, items))]
+    return any(strings) and not all(strings)
+
+
+def sort(item, order=None, max_memory=None, key=None):
+    """Sort the given `item` by any order defined in `order` - either
+    "ascending" (default) or "descending". The `item` will be sorted as well as
+    possible, no matter what the type of the given `item` is.
+
+    If `max_memory` is given, and `item` is a list or any other iterable, an
+    iterator over the sorted items is returned instead. Only about
+    `max_memory` bytes of the items are then kept in memory, while the rest
+    are sorted in chunks written to temporary files.
+
+    :param item: item to sort.
+    :param order: the order in which the item should be sorted in.
+    :param max_memory: the number of bytes of items to keep in memory, when
+                       sorting items that might not fit in memory.
+    :param key: if set to "natural", strings are sorted with any runs of
+                digits in them compared as numbers, so "file2" comes before
+                "file10", if set to "casefold", they are sorted regardless of
+                case, and if set to "locale", they are sorted by the rules of
+                the current `LC_COLLATE` locale. Items which are not strings
+                are then sorted by their string values. The natural keys of
+                the strings are cached between calls.
+    """
+    if max_memory is not None and \
+            not isinstance(item, (dict, str, int, float)):
+        sort_key = _by_string(_sort_key(key)) if key is not None else None
+        return _external_sort(iter(item), order not in ("ascending", None),
+                              max_memory, sort_key)
+
+    if order == "ascending":
+        reverse = False
+    elif order == "descending":
+        reverse = True
+    else:
+        reverse = None
+
+    if isinstance(item, (dict)):
+        if key is not None:
+            return [(name, item[name])
+                    for name in _sorted_by(list(item), key, bool(reverse))]
+        ordered_result = sorted(list(item.items()), key=lambda key: key[0],
+                                reverse=bool(reverse))
+        return ordered_result
+    elif isinstance(item, str):
+        if _tokens.count(item, limit=2) == 1:
+            # Seems that `item` not containing any spaces; simply just sort the
+            # order of the characters.
+            if key is not None:
+                return ''.join(_sorted_by(item, key, bool(reverse)))
+            return ''.join(sorted(item, reverse=bool(reverse)))
+        if key is not None:
+            return ' '.join(_sorted_by(item.split(" "), key, bool(reverse)))
+        return ' '.join(sorted(item.split(" "), reverse=bool(reverse)))
+
+    elif isinstance(item, (list, tuple)):
+        if order in ("ascending", None):
+            reverse = False
+        else:
+            reverse = True
+        if key is not None:
+            return _sorted_by(item, key, reverse)
+        if _mixed(item):
+            # `item` contains not only strings.
+            return sorted(item, key=str, reverse=reverse)
+        try:
+            return sorted(item, reverse=reverse)
+        except TypeError:
+            # The items can not be compared with each other.
+            return sorted(item, key=str, reverse=reverse)
+    elif isinstance(item, (int, float)):
+        if isinstance(item, int):
+            return int(''.join(sorted(str(item), reverse=bool(reverse))))
+        elif isinstance(item, float):
+            return float('.'.join(sorted(str(item).split('.'),
+                         reverse=bool(reverse))))
+
+
+def _membership(container):
+    """Return a function telling whether or not an item is found in
+    `container`, doing hash lookups for all the hashable items.
+    """
+    hashable = set()
+    unhashable = []
+    for item in container:
+        try:
+            hashable.add(item)
+        except TypeError:
+            unhashable.append(item)
+
+    def contains(item):
+        try:
+            if item in hashable:
+                return True
+        except TypeError:
+            pass
+        return bool(unhashable) and item in unhashable
+    return contains
+
+
+def _longest_common_substring(sequence1, sequence2):
+    """Return a list of the longest run of consecutive items found in both
+    `sequence1` and `sequence2`, by walking `sequence1` through a suffix
+    automaton of `sequence2`.
+    """
+    transitions, link, length = [{}], [-1], [0]
+    last = 0
+    for item in sequence2:
+        current = len(length)
+        transitions.append({})
+        link.append(0)
+        length.append(length[last] + 1)
+        state = last
+        while state != -1 and item not in transitions[state]:
+            transitions[state][item] = current
+            state = link[state]
+        if state != -1:
+            target = transitions[state][item]
+            if length[state] + 1 == length[target]:
+                link[current] = target
+            else:
+                clone = len(length)
+                transitions.append(dict(transitions[target]))
+                link.append(link[target])
+                length.append(length[state] + 1)
+                while state != -1 and transitions[state].get(item) == target:
+                    transitions[state][item] = clone
+                    state = link[state]
+                link[target] = link[current] = clone
+        last = current
+
+    state = size = best = best_end = 0
+    for end, item in enumerate(sequence1, 1):
+        while state and item not in transitions[state]:
+            state = link[state]
+            size = length[state]
+        if item in transitions[state]:
+            state = transitions[state][item]
+            size += 1
+        if size > best:
+            best, best_end = size, end
+    return sequence1[best_end - best:best_end]
+
+
+# The largest number of bits of the dynamic programming table kept in memory
+# to find a longest common subsequence, with 1 bit per pair of items.
+_LCS_TABLE_BITS = 1 << 23
+
+
+def _lcs_rows(sequence1, sequence2):
+    """Yield the rows of the dynamic programming table of the longest common
+    subsequence of `sequence1` and `sequence2`, by the bit-parallel algorithm
+    of Allison and Dix, where each row is kept as a single integer. The zero
+    bits of a row below column `j` are the length of the longest common
+    subsequence up to that row and column.
+    """
+    size = len(sequence2)
+    found = set(sequence1)
+    positions = {}
+    for j, item in enumerate(sequence2):
+        if item in found:
+            positions.setdefault(item, []).append(j)
+    masks = {}
+    for item, indexes in positions.items():
+        bits = ['0'] * size
+        for j in indexes:
+            bits[size - 1 - j] = '1'
+        masks[item] = int(''.join(bits), 2)
+
+    full = row = (1 << size) - 1
+    yield row
+    for item in sequence1:
+        match = row & masks.get(item, 0)
+        row = ((row + match) | (row - match)) & full
+        yield row
+
+
+def _lcs_lengths(sequence1, sequence2):
+    """Return a list of the lengths of the longest common subsequences of
+    `sequence1` and every prefix of `sequence2`, shortest first."""
+    size = len(sequence2)
+    if not size:
+        return [0]
+    for row in _lcs_rows(sequence1, sequence2):
+        pass
+    zeros = format(~row & ((1 << size) - 1), '0%db' % size)
+    return [0] + list(itertools.accumulate(map(int, reversed(zeros))))
+
+
+def _lcs_traceback(sequence1, sequence2):
+    """Return a list of the longest common subsequence of `sequence1` and
+    `sequence2`, tracing it back through the whole table."""
+    rows = list(_lcs_rows(sequence1, sequence2))
+    result = []
+    i, j = len(sequence1), len(sequence2)
+    while i and j:
+        window = (1 << j) - 1
+        zeros = window & ~rows[i]
+        if bin(zeros).count('1') != bin(window & ~rows[i - 1]).count('1'):
+            j = zeros.bit_length() - 1
+            result.append(sequence2[j])
+        i -= 1
+    result.reverse()
+    return result
+
+
+def _longest_common_subsequence(sequence1, sequence2):
+    """Return a list of the longest common subsequence of `sequence1` and
+    `sequence2`. Tables of more than `_LCS_TABLE_BITS` bits are split in
+    halves, as by Hirschberg, at the item of `sequence2` where a longest
+    common subsequence of the halves of `sequence1` meet, keeping the memory
+    linear in the length of the sequences.
+    """
+    if not sequence1 or not sequence2:
+        return []
+    if len(sequence1) * len(sequence2) <= _LCS_TABLE_BITS or \
+            len(sequence1) == 1:
+        return _lcs_traceback(sequence1, sequence2)
+    middle = len(sequence1) // 2
+    size = len(sequence2)
+    forward = _lcs_lengths(sequence1[:middle], sequence2)
+    backward = _lcs_lengths(sequence1[middle:][::-1], sequence2[::-1])
+    split = max(range(size + 1), key=lambda j: forward[j] + backward[size - j])
+    return (_longest_common_subsequence(sequence1[:middle],
+                                        sequence2[:split]) +
+            _longest_common_subsequence(sequence1[middle:],
+                                        sequence2[split:]))
+
+
+def common_sub(object1, object2, sequence=None):
+    """Return a list of all the common subsequences found in `object1` and
+    `object2`. Hence of lists and / or strings.
+    If only one of the given objects is a dictionary, all the keys of that
+    object will then be treated as a list, while any key-values is ignored,
+    otherwise both the key and value need to match.
+
+    If `sequence` is set to either `shortest` or `longest`, the corresponding
+    shortest or longest common subsequence will be returned.
+    If `sequence` is set to `substring`, a list of the longest run of
+    consecutive items found in both objects is returned, and if set to
+    `subsequence`, a list of their longest common subsequence of items is
+    returned. Both of these need the items to be hashable.
+
+    :param object1: the first string, list, or tuple to search.
+    :param object2: the seccond string, list, or tuple to search.
+    :param sequence: if set to `shortest`, `longest`, `substring` or
+                     `subsequence` the corresponding sequence is returned
+    """
+    if isinstance(object1, ("".__class__, u"".__class__)):
+        object1 = object1.split()
+    if isinstance(object2, ("".__class__, u"".__class__)):
+        object2 = object2.split()
+
+    if sequence in ("substring", "subsequence"):
+        object1, object2 = list(object1), list(object2)
+        if sequence == "substring":
+            result = _longest_common_substring(object1, object2)
+        else:
+            result = _longest_common_subsequence(object1, object2)
+        return result if result else None
+    elif sequence in ("shortest", "longest"):
+        contains = _membership(object2)
+        result = None
+        result_length = None
+        for item in object1:
+            if not contains(item):
+                continue
+            length = len(str(item))
+            if result_length is None or \
+                    (length < result_length if sequence == "shortest"
+                     else length > result_length):
+                result, result_length = item, length
+        return result
+    else:
+        try:
+            return dict(set(object1.items()) & set(object2.items()))
+        except:
+            try:
+                object1 = object1.split()
+                object2 = object2.split()
+            except:
+                pass
+
+    contains = _membership(object2)
+    common_subsequences = [item for item in object1 if contains(item)]
+
+    return common_subsequences if common_subsequences else None
+
+
+def _corpus_tokens(object):
+    """Return the items of `object` as tokenized by `common_sub()`, that is
+    the words of a string, and the items of anything else."""
+    if isinstance(object, (str, bytes)):
+        return object.split()
+    return object
+
+
+class CorpusIndex(object):
+    """An inverted index of the tokens of many documents, to find the
+    documents sharing the most, or the longest, tokens with a text, like
+    `common_sub()` would, without comparing the text against every document.
+    Documents are tokenized the same way as by `common_sub()`, into the words
+    of strings and the items of lists and tuples, which need to be hashable.
+    More documents can be added at any time.
+
+    :param documents: iterable of documents to index, keyed by their
+                      position.
+    :param ngram: if set to a number `n`, the character n-grams of every
+                  string token are also indexed, for `containing()`
+                  searches.
+    """
+
+    _FORMAT = 2
+
+    def __init__(self, documents=(), ngram=None):
+        if ngram is not None and ngram < 1:
+            raise ValueError('ngram must be at least 1')
+        self.ngram = ngram
+        self._keys = []
+        self._postings = {}
+        self._ngrams = {}
+        for document in documents:
+            self.add(document)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def _index_ngrams(self, token):
+        n = self.ngram
+        for i in range(max(len(token) - n + 1, 1)):
+            self._ngrams.setdefault(token[i:i + n], set()).add(token)
+
+    def add(self, document, key=None):
+        """Add `document` to the index, and return its key.
+
+        :param document: string, list or tuple to add.
+        :param key: key to return `document` by in searches, by default its
+                    position in the index.
+        """
+        number = len(self._keys)
+        if key is None:
+            key = number
+        for token in set(_corpus_tokens(document)):
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = array.array('I')
+                if self.ngram and isinstance(token, str):
+                    self._index_ngrams(token)
+            postings.append(number)
+        self._keys.append(key)
+        return key
+
+    def most_common(self, object, top_k=None):
+        """Return a list of `(key, count)` tuples of the documents sharing
+        the most items with `object`, most first, where `count` is the
+        number of items `common_sub(object, document)` would return.
+
+        :param object: string, list or tuple to search for.
+        :param top_k: number of documents to return, by default all sharing
+                      at least one item.
+        """
+        scores = collections.Counter()
+        for token, times in collections.Counter(
+                _corpus_tokens(object)).items():
+            postings = self._postings.get(token)
+            if postings is not None:
+                if times == 1:
+                    scores.update(postings)
+                else:
+                    for number in postings:
+                        scores[number] += times
+        keys = self._keys
+        return [(keys[number], score)
+                for number, score in scores.most_common(top_k)]
+
+    def longest_shared(self, object, top_k=None):
+        """Return a list of `(key, token)` tuples of the documents sharing
+        the longest tokens with `object`, longest first, where `token` is
+        the one `common_sub(object, document, sequence="longest")` would
+        return. Only the postings of the longest tokens are read, until
+        `top_k` documents are found.
+
+        :param object: string, list or tuple to search for.
+        :param top_k: number of documents to return, by default all sharing
+                      at least one item.
+        """
+        tokens = {}
+        for token in _corpus_tokens(object):
+            if token in self._postings and token not in tokens:
+                tokens[token] = len(str(token))
+        found = {}
+        keys = self._keys
+        result = []
+        # Sorting is stable, so tokens of the same length are in order of
+        # appearance, like in `common_sub()`.
+        for token in sorted(tokens, key=tokens.get, reverse=True):
+            for number in self._postings[token]:
+                if number not in found:
+                    found[number] = token
+                    result.append((number, token))
+            if top_k is not None and len(result) >= top_k:
+                break
+        result = result[:top_k] if top_k is not None else result
+        return [(keys[number], token) for number, token in result]
+
+    def containing(self, fragment, top_k=None):
+        """Return a list of `(key, count)` tuples of the documents with the
+        most distinct tokens containing the string `fragment`, most first.
+        Needs the index to be created with `ngram` set, and `fragment` to be
+        at least that long.
+
+        :param fragment: string to search for inside the tokens.
+        :param top_k: number of documents to return, by default all with at
+                      least one such token.
+        """
+        n = self.ngram
+        if not n:
+            raise ValueError('the index has no n-grams')
+        if len(fragment) < n:
+            raise ValueError('fragment must be at least %d characters' % n)
+        candidates = None
+        for i in range(len(fragment) - n + 1):
+            tokens = self._ngrams.get(fragment[i:i + n], ())
+            candidates = set(tokens) if candidates is None \
+                else candidates & tokens
+            if not candidates:
+                return []
+        scores = collections.Counter()
+        for token in candidates:
+            if fragment in token:
+                scores.update(self._postings[token])
+        keys = self._keys
+        return [(keys[number], score)
+                for number, score in scores.most_common(top_k)]
+
+    def save(self, path):
+        """Write the index to the file at `path`, as a gzip compressed line
+        of JSON with the n-gram length, the keys and the tokens, followed by
+        the postings of every token in order, stored as the gaps between its
+        document numbers in little endian 32 bit integers. The n-grams are
+        not stored, but rebuilt by `load()`. The keys and tokens need to be
+        strings, numbers, booleans or `None`.
+
+        :param path: path of the file to write.
+        """
+        tokens = list(self._postings)
+        for value in itertools.chain(self._keys, tokens):
+            if value is not None and \
+                    not isinstance(value, (str, int, float, bool)):
+                raise TypeError('%r can not be saved' % (value,))
+        gaps = array.array('I')
+        lengths = []
+        for numbers in self._postings.values():
+            gaps.extend(map(operator.sub, numbers,
+                            itertools.chain((0,), numbers)))
+            lengths.append(len(numbers))
+        if sys.byteorder != 'little':
+            gaps.byteswap()
+        header = {'format': self._FORMAT, 'ngram': self.ngram,
+                  'keys': self._keys, 'tokens': tokens, 'lengths': lengths}
+        with gzip.open(path, 'wb', compresslevel=6) as file:
+            file.write(json.dumps(header).encode('utf-8') + b'\n')
+            file.write(gaps.tobytes())
+
+    @classmethod
+    def load(cls, path):
+        """Return the index saved with `save()` to the file at `path`.
+
+        :param path: path of the file to read.
+        """
+        with gzip.open(path, 'rb') as file:
+            try:
+                header = json.loads(file.readline().decode('utf-8'))
+                format = header['format']
+            except (ValueError, TypeError, KeyError):
+                raise ValueError('%r is not a saved index' % (path,))
+            if format != cls._FORMAT:
+                raise ValueError('unsupported index format %r' % (format,))
+            gaps = array.array('I')
+            try:
+                gaps.frombytes(file.read())
+            except ValueError:
+                raise ValueError('%r is truncated' % (path,))
+        if sys.byteorder != 'little':
+            gaps.byteswap()
+        ngram, keys, tokens, lengths = _corpus_header(header, path)
+        if len(gaps) != sum(lengths):
+            raise ValueError('%r is truncated' % (path,))
+        index = cls(ngram=ngram)
+        index._keys = keys
+        start = 0
+        for token, length in zip(tokens, lengths):
+            numbers = gaps[start:start + length]
+            start += length
+            # Every document is in the postings of a token at most once.
+            if not length or 0 in numbers[1:]:
+                raise ValueError('%r has invalid postings' % (path,))
+            try:
+                numbers = array.array('I', itertools.accumulate(numbers))
+            except OverflowError:
+                numbers = None
+            if numbers is None or numbers[-1] >= len(keys):
+                raise ValueError('%r has postings of unknown documents'
+                                 % (path,))
+            index._postings[token] = numbers
+            if ngram and isinstance(token, str):
+                index._index_ngrams(token)
+        return index
+
+
+def _corpus_header(header, path):
+    """Return a tuple of the n-gram length, keys, tokens and posting lengths
+    in the `header` of the index saved to `path`, raising `ValueError` for any
+    that are not valid."""
+    try:
+        ngram, keys, tokens, lengths = (
+            header['ngram'], header['keys'], header['tokens'],
+            header['lengths'])
+    except KeyError as error:
+        raise ValueError('%r is missing %s' % (path, error))
+    if ngram is not None and \
+            (type(ngram) is not int or ngram < 1):
+        raise ValueError('%r has an invalid ngram %r' % (path, ngram))
+    scalars = (str, int, float, bool, type(None))
+    for name, values in (('keys', keys), ('tokens', tokens)):
+        if not isinstance(values, list) or \
+                not all(isinstance(value, scalars) for value in values):
+            raise ValueError('%r has invalid %s' % (path, name))
+    if len(set(tokens)) != len(tokens):
+        raise ValueError('%r has duplicate tokens' % (path,))
+    if not isinstance(lengths, list) or len(lengths) != len(tokens) or \
+            not all(type(length) is int and length >= 0
+                    for length in lengths):
+        raise ValueError('%r has invalid posting lengths' % (path,))
+    return ngram, keys, tokens, lengths
+
+
+def is_iterable(object):
+    """Return `True` or `False` whether or not the given `object` is capable
+    of being iterated or not.
+
+    :param: object: obejct to determine whether is iterable or not.
+    """
+    try:
+        iter(object)
+    except TypeError:
+        return False
+    return True
+
+
+def substr(object, start, end=None, view=False):
+    """Return the sub string from given `object`, which is found between the
+    positions defined in the `start` and `end` parameters.
+    If only `start` is given, the sub string will start at the beginning of
+    the `object`, and stop at the position which then is specified in `start`,
+    where both `0` and `1` then would be the first item/character.
+    If `object` is a list or tuple, `0` would return the first item of that
+    object as a string, whilst `1` then would return the item as a asscoiated
+    item of the object.
+    If the type of `object` is of a `int`, None is returned.
+
+    :param object: object to get the substring of.
+    :param start: the position to start the substring from.
+    :param end: the position to stop the substring extraction.
+    :param view: set to `True` to return a `SliceView` of `object` instead of
+                 a copy of the sub string.
+    """
+    try:
+        if not end:
+            if start == 0:
+                return object[start]
+            else:
+                stop = start
+                start = 0
+        else:
+            stop = end + len(object) + 1
+        if view:
+            return SliceView(object, start, stop)
+        return object[start:stop]
+    except TypeError:
+        return None
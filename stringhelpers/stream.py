@@ -0,0 +1,132 @@
+"""
+    stringhelpers.stream
+    ~~~~~~~~~~~~~~~~~~~~
+
+    Versions of some of the string helpers working on text files, or any
+    other file-like objects, which are read in chunks. Only about one chunk
+    at the time is kept in memory, no matter the size of the file, while
+    anything found across the chunk boundaries is still found.
+
+    :copyright: (c) 2013 by Thomas Skaflem.
+    :license: MIT, see LICENSE for more details.
+"""
+
+from ._tokens import WordCounter
+from .search import IReplacer
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+
+def _chunks(file, chunk_size):
+    read = file.read
+    while True:
+        chunk = read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+class _Counter(object):
+    """Counts the occurrences of `item` in text which is fed to it in chunks,
+    keeping only the end of the last chunk which could be the start of an
+    occurrence.
+
+    :param item: item to count the occurrences of.
+    :param case_sensitive: if set to `True`, the search after `item` is
+                           case-sensetive.
+    """
+
+    def __init__(self, item, case_sensitive=False):
+        item = str(item)
+        if not case_sensitive:
+            item = item.lower()
+        self.item = item
+        self.case_sensitive = case_sensitive
+        # Unless a start of `item` is also an end of it, its occurrences never
+        # overlap, and the last one found is the last one counted.
+        self.overlapping = any(item.startswith(item[i:])
+                               for i in range(1, len(item)))
+        self.result = 0 if item else 1
+        self.buffer = ''
+
+    def feed(self, chunk):
+        item = self.item
+        if not item:
+            self.result += len(chunk)
+            return
+        buffer = self.buffer + (chunk if self.case_sensitive
+                                else chunk.lower())
+        end = 0
+        if self.overlapping:
+            index = buffer.find(item)
+            while index != -1:
+                self.result += 1
+                end = index + len(item)
+                index = buffer.find(item, end)
+        else:
+            found = buffer.count(item)
+            if found:
+                self.result += found
+                end = buffer.rfind(item) + len(item)
+        # Keep the end of the chunk which could be the start of an occurrence.
+        self.buffer = buffer[max(end, len(buffer) - len(item) + 1):]
+
+
+def count(item, file, case_sensitive=False, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Return the exact number of how many times `item` is found in `file`.
+    `item` is searched after as plain text, as a regular expression could
+    match across any number of chunks.
+
+    :param item: item to count the occurrences of in `file`.
+    :param file: text file to count occurrences of `item` in.
+    :param case_sensitive: if set to `True`, the search after `item` is
+                           case-sensetive.
+    :param chunk_size: number of characters to read from `file` at the time.
+    """
+    counter = _Counter(item, case_sensitive)
+    for chunk in _chunks(file, chunk_size):
+        counter.feed(chunk)
+    return counter.result
+
+
+def count_items(file, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Return the number of items in `file`.
+
+    :param file: text file to count for items.
+    :param chunk_size: number of characters to read from `file` at the time.
+    """
+    counter = WordCounter()
+    for chunk in _chunks(file, chunk_size):
+        counter.feed(chunk)
+    return counter.result
+
+
+def ireplace_many(replacements, file, output, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Write a copy of `file` to `output`, where all the occurrences of a
+    case-insensitive search after each key in `replacements` is replaced with
+    its value.
+
+    :param replacements: dictionary mapping the items to search after to their
+                         replacements, or an already built `IReplacer`.
+    :param file: text file to search-and-replace in.
+    :param output: text file to write the result to.
+    :param chunk_size: number of characters to read from `file` at the time.
+    """
+    if not isinstance(replacements, IReplacer):
+        replacements = IReplacer(replacements)
+    write = output.write
+    for piece in replacements.replace_chunks(_chunks(file, chunk_size)):
+        write(piece)
+
+
+def ireplace(old, new, file, output, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Write a copy of `file` to `output`, where all the occurrences of a
+    case-insensitive search after `old` is replaced with `new`.
+
+    :param old: the item in `file` to do a case-insensitive search after.
+    :param new: new item to replace `old` with.
+    :param file: text file to search-and-replace in.
+    :param output: text file to write the result to.
+    :param chunk_size: number of characters to read from `file` at the time.
+    """
+    ireplace_many(((old, new),), file, output, chunk_size)
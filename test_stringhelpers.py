@@ -1,6 +1,26 @@
 from stringhelpers import *
+from stringhelpers import aio, batch, cached, instrument, parallel, stream
+import stringhelpers
+import array
+import asyncio
+import decimal
+import gc
+import gzip
+import io
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import threading
 import unittest
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 class Test(unittest.TestCase):
     def setUp(self):
@@ -16,15 +36,93 @@ class Test(unittest.TestCase):
 
     def test_upcase_first_letter(self):
         self.assertEqual(upcase_first_letter("lorem iPsum"), "Lorem iPsum")
+        self.assertEqual(upcase_first_letter("1 lorem l"), "1 Lorem l")
+        self.assertEqual(upcase_first_letter("123"), "123")
+
+    def test_case_conversion(self):
+        strings = ["getHTTPResponse_code", "HTTPServer2Go", "Straße der ÉCOLE",
+                   "  hello world-foo.bar ", "", "_"]
+        self.assertEqual([to_snake(string) for string in strings],
+                         ["get_http_response_code", "http_server2_go",
+                          "straße_der_école", "hello_world_foo_bar", "", ""])
+        self.assertEqual([to_kebab(string) for string in strings],
+                         ["get-http-response-code", "http-server2-go",
+                          "straße-der-école", "hello-world-foo-bar", "", ""])
+        self.assertEqual([to_camel(string) for string in strings],
+                         ["getHttpResponseCode", "httpServer2Go",
+                          "straßeDerÉcole", "helloWorldFooBar", "", ""])
+        self.assertEqual(to_camel("get_http", upper_first=True), "GetHttp")
+        self.assertEqual([to_title(string) for string in strings],
+                         ["Get Http Response Code", "Http Server2 Go",
+                          "Straße Der École", "Hello World Foo Bar", "", ""])
+        for name in ("to_snake", "to_kebab", "to_camel", "to_title"):
+            expected = [globals()[name](string) for string in strings]
+            self.assertEqual(getattr(batch, name)(strings), expected)
+            if numpy is not None:
+                self.assertEqual(
+                    getattr(batch, name)(numpy.array(strings)).tolist(),
+                    expected)
+        self.assertEqual(batch.to_camel(["a b"], upper_first=True), ["AB"])
 
     def test_reverse(self):
         self.assertEqual(reverse(u'esrever'), "reverse")
 
     def test_reverse_order(self):
         self.assertEqual(reverse_order("one two three"), "three two one")
+        self.assertEqual(reverse_order(["one", "two"]), ["two", "one"])
+        self.assertEqual(reverse_order(("one", "two")), ("two", "one"))
+        items = ["one", "two", "three"]
+        view = reverse_order(items, view=True)
+        self.assertTrue(isinstance(view, ReversedView))
+        self.assertEqual(view, ["three", "two", "one"])
+        items[0] = "zero"
+        self.assertEqual(view[-1], "zero")
+
+    def test_views(self):
+        items = list(range(10))
+        view = SliceView(items, 2, 9, 2)
+        self.assertEqual(len(view), 4)
+        self.assertEqual(list(view), [2, 4, 6, 8])
+        self.assertEqual((view[0], view[-1]), (2, 8))
+        self.assertEqual(list(view[1:]), [4, 6, 8])
+        self.assertEqual(list(view[::-1]), [8, 6, 4, 2])
+        self.assertEqual(list(reversed(view)), [8, 6, 4, 2])
+        self.assertTrue(6 in view and 3 not in view)
+        self.assertEqual(view.index(6), 2)
+        self.assertRaises(IndexError, view.__getitem__, 4)
+
+        view = reverse("esrever", view=True)
+        self.assertEqual("".join(view), "reverse")
+        self.assertEqual(view[1:4], "eve")
+        self.assertEqual(list(ReversedView(range(3))), [2, 1, 0])
+        self.assertEqual(substr(["One", "To", "Three"], 1, 2, view=True),
+                         ["To", "Three"])
+        self.assertEqual(substr("asdf", 2, view=True), "as")
+        self.assertEqual(substr("asdf", 1.1, view=True), None)
 
     def test_count_items(self):
         self.assertEqual(count_items('Now or never'), 3)
+        self.assertEqual(count_items(' Now  or\nnever \t'), 3)
+        self.assertEqual(count_items(''), 0)
+        text = "word " * 30000 + "x" * 70000 + " last"
+        self.assertEqual(count_items(text), len(text.split()))
+
+    def test_word_spans(self):
+        text = " Now  or\nnever"
+        self.assertEqual(list(word_spans(text)), [(1, 4), (6, 8), (9, 14)])
+        self.assertEqual([text[start:end] for start, end in word_spans(text)],
+                         text.split())
+
+    def test_word_frequencies(self):
+        text = "the cat and The dog and the bird"
+        self.assertEqual(word_frequencies(text),
+                         [("the", 3), ("and", 2), ("cat", 1), ("dog", 1),
+                          ("bird", 1)])
+        self.assertEqual(word_frequencies(text, top_k=2),
+                         [("the", 3), ("and", 2)])
+        self.assertEqual(word_frequencies(text, 3, case_sensitive=True),
+                         [("the", 2), ("and", 2), ("cat", 1)])
+        self.assertEqual(word_frequencies(""), [])
 
     def test_camelize(self):
         self.assertEqual(camelize("a lizard that slithers"),
@@ -48,13 +146,153 @@ class Test(unittest.TestCase):
         self.assertTrue(match, "%s is not password safe" %
                         self.random_string_password_safe)
 
+    def test_random_strings(self):
+        strings = random_strings(100, length=8,
+                                 alphabet=PASSWORD_SAFE_CHOICES)
+        self.assertEqual(len(strings), 100)
+        for string in strings:
+            self.assertTrue(re.match("^[%s]{8}$" % PASSWORD_SAFE_CHOICES,
+                                     string))
+        self.assertEqual(sorted(random_strings(4, 2, "ab", unique=True)),
+                         ["aa", "ab", "ba", "bb"])
+        self.assertRaises(ValueError, random_strings, 5, 2, "ab", unique=True)
+        strings = random_strings(3, secure=False, lazy=True)
+        self.assertEqual([len(string) for string in strings], [6, 6, 6])
+
     def test_dasherize(self):
         self.assertEqual(dasherize("singing_in_the rain"),
                          "singing-in-the-rain")
 
+    def test_batch(self):
+        strings = ["/singing_in_the rain/", "UP here", "", "Straße"]
+        helpers = [upcase, downcase, dasherize, strip_slashes, truncate]
+        for helper in helpers:
+            expected = [helper(string) for string in strings]
+            batch_helper = getattr(batch, helper.__name__)
+            self.assertEqual(batch_helper(strings), expected)
+            if numpy is not None:
+                self.assertEqual(batch_helper(numpy.array(strings)).tolist(),
+                                 expected)
+        if numpy is not None:
+            for strings in (["\u00df", "\ufb03"], ["\u0130", "a"]):
+                for helper in (upcase, downcase):
+                    self.assertEqual(
+                        getattr(batch, helper.__name__)(
+                            numpy.array(strings)).tolist(),
+                        [helper(string) for string in strings])
+        self.assertEqual(batch.truncate(("A Lizard That Slithers", "Lizard"),
+                                        length=6, suffix="!"),
+                         ["A Liza!", "Lizard"])
+
+    def test_bytes(self):
+        data = b"/Summer_08 pictures/"
+        for string in (data, bytearray(data), memoryview(data)):
+            self.assertEqual(bytes(upcase(string)), b"/SUMMER_08 PICTURES/")
+            self.assertEqual(bytes(downcase(string)), b"/summer_08 pictures/")
+            self.assertEqual(bytes(dasherize(string)), b"/Summer-08-pictures/")
+            self.assertEqual(bytes(strip_slashes(string)),
+                             b"Summer_08 pictures")
+            self.assertEqual(bytes(reverse(string)), data[::-1])
+            self.assertEqual(count("s", string), 2)
+            self.assertEqual(count(b"S", string, case_sensitive=True), 1)
+            self.assertEqual(count(".", string, literal=True), 0)
+            self.assertEqual(count("[0-9]", string), 2)
+        self.assertTrue(isinstance(upcase(bytearray(data)), bytearray))
+        self.assertEqual(strip_slashes(memoryview(b"///")).tobytes(), b"")
+
+        buffer = bytearray(data)
+        self.assertTrue(upcase(buffer, out=buffer) is buffer)
+        self.assertEqual(buffer, b"/SUMMER_08 PICTURES/")
+        out = bytearray(b"something longer than the result")
+        self.assertEqual(dasherize(memoryview(data), out=out),
+                         b"/Summer-08-pictures/")
+        self.assertRaises(TypeError, upcase, "string", out=out)
+        self.assertRaisesRegex(TypeError, "^out is only", downcase, "string",
+                               out=out)
+        self.assertRaisesRegex(TypeError, "not int$", dasherize, 123)
+        self.assertRaisesRegex(TypeError, "not int$", upcase, 123, out=out)
+
     def test_humanize(self):
         self.assertEqual(humanize("summer_08-pictures.tar.gz"),
                          "summer 08 pictures")
+        for i in range(3):
+            humanize("summer.tar.gz")
+        self.assertEqual(humanize.__defaults__, (True, None))
+        self.assertEqual(humanize("summer_08.tar.xz"), "summer 08.tar")
+        self.assertEqual(humanize("summer_08.tar.xz",
+                                  double_extensions=["tar.xz"]), "summer 08")
+        self.assertEqual(humanize("summer_08.tar.xz",
+                                  double_extensions="tar.xz"), "summer 08")
+        self.assertEqual(humanize("summer_08.tar.z",
+                                  double_extensions="tar.xz"), "summer 08.tar")
+        self.assertIsInstance(DOUBLE_EXTENSIONS, frozenset)
+
+    def test_extension_registry(self):
+        registry = ExtensionRegistry(["tar.gz", "ar.gz", "tar.xz"])
+        self.assertTrue(registry.matches("summer.tar.xz"))
+        registry.remove("tar.gz")
+        self.assertFalse("tar.gz" in registry)
+        self.assertTrue("ar.gz" in registry)
+        self.assertTrue(registry.matches("summer.tar.gz"))
+        registry.remove("ar.gz")
+        self.assertFalse(registry.matches("summer.tar.gz"))
+        self.assertRaises(ValueError, registry.remove, "ar.gz")
+        registry.add("tar.bz2")
+        self.assertEqual(humanize("summer_08.tar.xz",
+                                  double_extensions=registry), "summer 08")
+
+    def test_pipeline(self):
+        pipeline = Pipeline(humanize, downcase, dasherize,
+                            (truncate, {"length": 12}))
+        self.assertEqual(pipeline("Summer_08-Pictures of 2017.tar.gz"),
+                         "summer-08-pi...")
+        self.assertEqual(list(pipeline.map(["A_b", "C d.txt"])),
+                         ["a-b", "c-d"])
+        pipeline = Pipeline(upcase, dasherize,
+                            (humanize, {"remove_file_extension": False}),
+                            downcase)
+        self.assertEqual(pipeline("Straße_of-the sea"), "strasse of the sea")
+        self.assertEqual(Pipeline(dasherize, camelize)("a_b c"), "A-b-c")
+        pipeline = Pipeline((humanize, {"double_extensions": ["tar.xz"]}),
+                            downcase)
+        self.assertEqual(pipeline("Summer_08.tar.xz"), "summer 08")
+
+    def test_cached(self):
+        cached.clear_caches()
+        for i in range(3):
+            self.assertEqual(cached.humanize("summer_08-pictures.tar.gz"),
+                             "summer 08 pictures")
+            self.assertEqual(cached.truncate("A Lizard That Slithers",
+                                             length=8), "A Lizard...")
+        info = cached.humanize.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (2, 1, 1))
+        self.assertEqual(cached.truncate.cache_info().hits, 2)
+        self.assertEqual(cached.humanize("a_b.tar.xz",
+                                         double_extensions=["tar.xz"]), "a b")
+        self.assertEqual(cached.humanize.cache_info().currsize, 1)
+        self.assertEqual(cached.camelize.__name__, "camelize")
+
+        lru = cached.memoize(upcase, maxsize=2)
+        for string in ["a", "b", "a", "c"]:
+            lru(string)
+        info = lru.cache_info()
+        self.assertEqual((info.hits, info.misses, info.evictions), (1, 3, 1))
+        self.assertEqual(list(lru._cache.entries), [("a",), ("c",)])
+
+        limited = cached.memoize(max_bytes=200)(downcase)
+        for string in ["A" * 50, "B" * 50, "C" * 200]:
+            limited(string)
+        info = limited.cache_info()
+        self.assertTrue(info.currbytes <= 200)
+        self.assertEqual((info.currsize, info.evictions), (1, 1))
+
+        tinylfu = cached.memoize(upcase, maxsize=2, policy="tinylfu")
+        for string in ["a", "a", "b", "b", "c", "d", "e"]:
+            tinylfu(string)
+        self.assertEqual(sorted(tinylfu._cache.entries), [("a",), ("b",)])
+        tinylfu.cache_clear()
+        self.assertEqual(tinylfu.cache_info().currsize, 0)
+        self.assertRaises(ValueError, cached.memoize, upcase, policy="lfu")
 
     def test_flatten(self):
         def checkEqual(L1, L2):
@@ -66,18 +304,201 @@ class Test(unittest.TestCase):
         self.assertTrue(checkEqual(
             flatten(["one", ["one", ["two", "three"]], "three"],
                     remove_duplicates=True), ['one', 'two', 'three']))
+        self.assertEqual(flatten(["b", ["a", ["b", "c"]], "a"],
+                                 remove_duplicates=True), ["b", "a", "c"])
+
+        nested = ["leaf"]
+        for i in range(10000):
+            nested = [nested, i]
+        self.assertEqual(len(flatten(nested)), 10001)
+
+    def test_iflatten(self):
+        nested = [1, [2, [3, [4]]], (2, 1)]
+        self.assertEqual(list(iflatten(nested)), [1, 2, 3, 4, 2, 1])
+        self.assertEqual(list(iflatten(nested, max_depth=1)),
+                         [1, 2, [3, [4]], 2, 1])
+        self.assertEqual(list(iflatten(nested, unique=True)), [1, 2, 3, 4])
+        self.assertEqual(next(iflatten(iter([[["a"]], "b"]))), "a")
+        shared = [1]
+        self.assertEqual(list(iflatten([shared, [shared]])), [1, 1])
+        nested = [1]
+        nested.append([nested])
+        self.assertRaises(ValueError, list, iflatten(nested))
+        self.assertRaises(ValueError, flatten, nested)
 
     def test_in_list(self):
         self.assertEqual(in_list("one", ["one", "two"]), "one")
 
+    def test_list_index(self):
+        index = ListIndex(["one", ["One", [1, "two"]], "1"])
+        self.assertEqual(index.find("ONE"), ["one", "One"])
+        self.assertEqual(index.find(1), [1, "1"])
+        self.assertEqual(index.find("three"), False)
+        self.assertEqual(in_list("two", index), "two")
+        self.assertEqual(in_list("one", index, frequency_count=True), 2)
+        index.remove("One")
+        index.add(["ONE", "three"])
+        self.assertEqual(index.find("one"), ["one", "ONE"])
+        self.assertEqual(index.frequency_count("three"), 1)
+        self.assertTrue("Three" in index)
+        self.assertEqual(len(index), 6)
+        self.assertRaises(ValueError, index.remove, "four")
+        self.assertRaises(ValueError, index.remove, 4)
+        index.remove("three")
+        index.remove("two")
+        self.assertEqual(sorted(index._strings), ["1", "one"])
+        self.assertEqual(sorted(index._numbers), [1])
+
     def test_ireplace(self):
         self.assertEqual(ireplace('w3scHoolS', 'Apple', "Visit W3Schools"),
                          "Visit Apple")
+        self.assertEqual(ireplace('a', 'aa', "Aa"), "aaaa")
+        self.assertEqual(ireplace('', 'x', "abc"), "abc")
+
+    def test_ireplace_many(self):
+        self.assertEqual(ireplace_many({'he': '1', 'she': '2', 'hers': '3'},
+                                       "uSHErs hers"), "u2rs 3")
+        replacer = IReplacer({'ab': 'X', 'abc': 'Y', 'bcd': 'Z'})
+        self.assertEqual(ireplace_many(replacer, "ABCD abd xbcdx"),
+                         "YD Xd xZx")
+        self.assertEqual(replacer("no match"), "no match")
+
+    def test_ireplace_many_pending_at_end(self):
+        replacements = {'ab': 'X', 'abcd': 'Y'}
+        self.assertEqual(ireplace_many(replacements, "zabc"), "zXc")
+        self.assertEqual(ireplace_many(replacements, "zABc abcd"), "zXc Y")
+        replacer = IReplacer(replacements)
+        for size in (1, 2, 3):
+            chunks = ["zabcabc"[i:i + size] for i in range(0, 7, size)]
+            self.assertEqual(''.join(replacer.replace_chunks(chunks)),
+                             "zXcXc")
 
     def test_count(self):
         self.assertEqual(count("but", "But what about the BUT ?"), 2)
         self.assertEqual(count("But", "But what about the BUT ?",
                                case_sensitive=True), 1)
+        self.assertEqual(count("a.b", "A.b axb"), 2)
+        self.assertEqual(count("a.b", "A.b axb", literal=True), 1)
+        self.assertEqual(count("a.b", "A.b axb", True, literal=True), 0)
+
+    def test_count_many(self):
+        self.assertEqual(count_many(["but", "a.b", 1, "aa"],
+                                    "But a.b axb 1 11 BUT aaa"),
+                         {"but": 2, "a.b": 1, 1: 3, "aa": 1})
+        self.assertEqual(count_many(["But", "BUT"], "But what about the BUT ?",
+                                    case_sensitive=True),
+                         {"But": 1, "BUT": 1})
+
+    def test_pattern_cache(self):
+        clear_pattern_cache()
+        count("but", "But what about the BUT ?")
+        count("but", "But what about the BUT ?")
+        info = pattern_cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 1, 1))
+
+    def test_stream(self):
+        text = u"But what about the BUT ?\nbutbut abut"
+        for chunk_size in (1, 2, 5, 100):
+            self.assertEqual(stream.count("but", io.StringIO(text),
+                                          chunk_size=chunk_size), 5)
+            self.assertEqual(stream.count("aa", io.StringIO(u"aaaaa"),
+                                          chunk_size=chunk_size), 2)
+            self.assertEqual(stream.count_items(io.StringIO(text),
+                                                chunk_size=chunk_size), 8)
+            output = io.StringIO()
+            stream.ireplace("but", "and", io.StringIO(text), output,
+                            chunk_size=chunk_size)
+            self.assertEqual(output.getvalue(), ireplace("but", "and", text))
+
+    def test_aio(self):
+        text = u"But what about the BUT ?\nbutbut abut"
+
+        async def source(chunk_size):
+            for i in range(0, len(text), chunk_size):
+                await asyncio.sleep(0)
+                yield text[i:i + chunk_size]
+
+        async def replace(chunks, **kwargs):
+            return "".join([piece async for piece in
+                            aio.ireplace("but", "and", chunks, **kwargs)])
+
+        async def run():
+            for chunk_size in (1, 5, 100):
+                for threshold in (None, 3):
+                    self.assertEqual(await aio.count(
+                        "but", source(chunk_size), threshold=threshold), 5)
+                    self.assertEqual(await aio.count_items(
+                        source(chunk_size), threshold=threshold,
+                        max_pending=1), 8)
+                    self.assertEqual(await replace(source(chunk_size),
+                                                   threshold=threshold),
+                                     ireplace("but", "and", text))
+            self.assertEqual(await aio.flatten([["a", ["b"]], "a"], True,
+                                               threshold=2), ["a", "b"])
+            self.assertEqual(await aio.apply(truncate, "A Lizard", length=1,
+                                             threshold=1), "A...")
+
+            queue = asyncio.Queue()
+            for chunk in ("abut", "but", None):
+                queue.put_nowait(chunk)
+            self.assertEqual(await aio.count("but", aio.from_queue(queue)), 2)
+
+        asyncio.run(run())
+
+    def test_parallel(self):
+        strings = ["a lizard %d" % i for i in range(1000)]
+        expected = [camelize(string) for string in strings]
+        self.assertEqual(list(parallel.pmap(camelize, strings, workers=2)),
+                         expected)
+        self.assertEqual(list(parallel.pmap(camelize, strings, workers=1)),
+                         expected)
+        self.assertEqual(list(parallel.pmap(camelize, iter(strings),
+                                            workers=2, chunksize=7)),
+                         expected)
+        results = parallel.pmap(upcase, ("%d" % i for i in range(10 ** 9)),
+                                workers=2)
+        self.assertEqual([next(results) for i in range(3)], ["0", "1", "2"])
+        results.close()
+
+    def test_instrument(self):
+        original = stringhelpers.upcase
+        instrument.reset()
+        instrument.enable(["upcase", "count"])
+        self.assertTrue(instrument.is_enabled())
+        try:
+            for string in ("a", "down here", "down here"):
+                stringhelpers.upcase(string)
+            stringhelpers.count("but", "But what about the BUT ?")
+        finally:
+            instrument.disable()
+        self.assertTrue(stringhelpers.upcase is original)
+        self.assertFalse(instrument.is_enabled())
+        stats = instrument.snapshot()
+        self.assertEqual(stats["upcase"]["calls"], 3)
+        self.assertEqual(stats["upcase"]["input_length"], {2: 1, 16: 2})
+        self.assertEqual(sum(stats["count"]["latency_ns"].values()), 1)
+        output = io.StringIO()
+        instrument.export(output)
+        self.assertTrue('"upcase"' in output.getvalue())
+
+    def test_instrument_threads(self):
+        instrument.reset()
+        instrument.enable(["upcase"])
+        try:
+            for _ in range(20):
+                thread = threading.Thread(target=stringhelpers.upcase,
+                                          args=("abc",))
+                thread.start()
+                thread.join()
+            del thread
+            gc.collect()
+            stringhelpers.upcase("abc")
+        finally:
+            instrument.disable()
+        self.assertLessEqual(len(instrument._thread_stats), 3)
+        stats = instrument.snapshot()
+        self.assertEqual(stats["upcase"]["calls"], 21)
+        self.assertEqual(stats["upcase"]["input_length"], {4: 21})
 
     def test_odd(self):
         self.assertEqual(odd(11), True)
@@ -96,6 +517,40 @@ class Test(unittest.TestCase):
         self.assertEqual(even("x"), False)
         self.assertEqual(even(None), False)
 
+    def test_parity_masks(self):
+        numbers = [1, 2, "x", 3.7, None, -3, 2 ** 70 + 1]
+        self.assertEqual(odd(numbers),
+                         [True, False, False, True, False, True, True])
+        self.assertEqual(even(numbers),
+                         [False, True, False, False, False, False, False])
+        self.assertEqual(odd(iter(numbers), filtered=True),
+                         [1, 3.7, -3, 2 ** 70 + 1])
+        self.assertEqual(even((n for n in range(5)), filtered=True),
+                         [0, 2, 4])
+        numbers = array.array('h', [1, -2, 3, -5, 8])
+        self.assertEqual(odd(numbers), [True, False, True, True, False])
+        self.assertEqual(even(numbers, filtered=True),
+                         array.array('h', [-2, 8]))
+        if numpy is not None:
+            numbers = numpy.array([1, 2, 3, -4])
+            self.assertEqual(odd(numbers).tolist(), [True, False, True, False])
+            self.assertEqual(even(numbers, filtered=True).tolist(), [2, -4])
+            numbers = numpy.array([1.5, 2.2, numpy.nan, numpy.inf, -3.9])
+            self.assertEqual(odd(numbers).tolist(),
+                             [True, False, False, False, True])
+            self.assertEqual(even(numbers).tolist(),
+                             [False, True, False, False, False])
+
+    def test_partition_parity(self):
+        self.assertEqual(partition_parity(range(7)), ([1, 3, 5], [0, 2, 4, 6]))
+        self.assertEqual(partition_parity(["1", "a", 2.5, None]), (["1"], [2.5]))
+        self.assertEqual(partition_parity(array.array('Q', [4, 7])),
+                         (array.array('Q', [7]), array.array('Q', [4])))
+        if numpy is not None:
+            odds, evens = partition_parity(numpy.arange(6))
+            self.assertEqual((odds.tolist(), evens.tolist()),
+                             ([1, 3, 5], [0, 2, 4]))
+
     def test_strip_slashes(self):
         self.assertEqual(strip_slashes('/foo/and/bar//'), "foo/and/bar")
 
@@ -121,6 +576,60 @@ class Test(unittest.TestCase):
         self.assertEqual(sort("abc,bca"), ",aabbcc")
         self.assertEqual(sort("4213"), "1234")
 
+    def test_sort_keys(self):
+        files = ["file10.txt", "file2.txt", "File1.txt", "file2b.txt"]
+        self.assertEqual(sort(files, key="natural"),
+                         ["File1.txt", "file2.txt", "file2b.txt",
+                          "file10.txt"])
+        self.assertEqual(sort(files, key="natural", order="descending"),
+                         ["file10.txt", "file2b.txt", "file2.txt",
+                          "File1.txt"])
+        self.assertEqual(sort(["b", "A", "a", "B"], key="casefold"),
+                         ["A", "a", "b", "B"])
+        self.assertEqual(sort(["b", "a", "c"], key="locale"), ["a", "b", "c"])
+        self.assertEqual(sort([10, "v9", 9.5, "v10"], key="natural"),
+                         [9.5, 10, "v9", "v10"])
+        self.assertEqual(sort({"x10": 1, "x9": 2}, key="natural"),
+                         [("x9", 2), ("x10", 1)])
+        self.assertEqual(sort("v10 v9 v1", key="natural"), "v1 v9 v10")
+        self.assertEqual(list(sort(iter(files * 20), key="natural",
+                                   max_memory=256)),
+                         sort(files * 20, key="natural"))
+        self.assertRaises(ValueError, sort, files, key="nothing")
+        self.assertEqual(sort([3, "b", 1.5, "a", 10]),
+                         [1.5, 10, 3, "a", "b"])
+        self.assertEqual(sort([decimal.Decimal(5), 10, 2.5]),
+                         [2.5, decimal.Decimal(5), 10])
+        self.assertEqual(sort([(1, "a"), (1, 2), (0,)]),
+                         [(0,), (1, "a"), (1, 2)])
+        if numpy is not None:
+            self.assertEqual(sort([numpy.int64(10), 9]), [9, 10])
+
+    def test_sort_max_memory(self):
+        words = ["word%d" % (i * 7919 % 1000) for i in range(1000)]
+        self.assertEqual(list(sort(iter(words), max_memory=1024)),
+                         sorted(words))
+        self.assertEqual(list(sort(words, order="descending",
+                                   max_memory=1024)),
+                         sorted(words, reverse=True))
+        mixed = [3, "b", 1.5, "a", 10] * 50
+        self.assertEqual(list(sort(mixed, max_memory=256)), sort(mixed))
+        late = ["word%d" % i for i in range(2000)] + [1]
+        self.assertEqual(list(sort(iter(late), max_memory=128)), sort(late))
+        numbers = [1, decimal.Decimal(5), 2.5, 10] * 30
+        self.assertEqual(list(sort(iter(numbers), max_memory=256)),
+                         sorted(numbers))
+        if numpy is not None:
+            numbers = [1, numpy.int64(10), 2] * 30
+            self.assertEqual(list(sort(iter(numbers), max_memory=256)),
+                             sorted(numbers))
+            self.assertEqual(list(sort([1, numpy.int64(10), 2],
+                                       max_memory=10 ** 6)), [1, 2, 10])
+        tuples = [(1, "a"), (1, 2), (0,)]
+        self.assertEqual(list(sort(iter(tuples), max_memory=1)), sort(tuples))
+        self.assertEqual(list(sort(iter(tuples * 40), max_memory=1)),
+                         sort(tuples * 40))
+
     sequences = [
             {"sequence1": "foo !!!!!  bar",
              "sequence2": "bar !!!!! foo",
@@ -221,6 +730,88 @@ class Test(unittest.TestCase):
             self.assertEqual(shortest_sub,
                              sequence["shortest_result"])
 
+    def test_common_sub_substring_and_subsequence(self):
+        sentence1 = "the quick brown fox jumps over the dog"
+        sentence2 = "a quick brown dog jumps over a fox"
+        self.assertEqual(common_sub(sentence1, sentence2, "substring"),
+                         ["quick", "brown"])
+        self.assertEqual(common_sub(sentence1, sentence2, "subsequence"),
+                         ["quick", "brown", "jumps", "over"])
+        self.assertEqual(common_sub("abcbdab", "bdcaba", "substring"), None)
+        self.assertEqual(len(common_sub(list("abcbdab"), list("bdcaba"),
+                                        "subsequence")), 4)
+        self.assertEqual(common_sub(["a"], ["b"], "subsequence"), None)
+
+    def test_common_sub_subsequence_split(self):
+        sequences = stringhelpers.sequences
+        table_bits = sequences._LCS_TABLE_BITS
+        sequences._LCS_TABLE_BITS = 16
+        try:
+            words1 = ["w%d" % (i * 7 % 13) for i in range(300)]
+            words2 = ["w%d" % (i * 5 % 11) for i in range(200)]
+            result = common_sub(words1, words2, "subsequence")
+        finally:
+            sequences._LCS_TABLE_BITS = table_bits
+        whole = common_sub(words1, words2, "subsequence")
+        self.assertEqual(len(result), len(whole))
+        for words in (words1, words2):
+            remaining = iter(words)
+            self.assertTrue(all(word in remaining for word in result))
+
+    def test_corpus_index(self):
+        documents = ["the quick brown fox", "a lazy brown dog",
+                     ["quick", "dog", "jumps"], "nothing in common"]
+        index = CorpusIndex(documents[:2], ngram=3)
+        self.assertEqual(index.add(documents[2], key="list"), "list")
+        index.add(documents[3])
+        self.assertEqual(len(index), 4)
+        text = "a quick brown dog"
+        self.assertEqual(index.most_common(text),
+                         [(1, 3), (0, 2), ("list", 2)])
+        self.assertEqual(index.most_common(text, top_k=1), [(1, 3)])
+        for key, count in index.most_common(text):
+            document = documents[key if key != "list" else 2]
+            self.assertEqual(len(common_sub(text, document)), count)
+        self.assertEqual(index.longest_shared(text),
+                         [(0, "quick"), ("list", "quick"), (1, "brown")])
+        self.assertEqual(index.longest_shared(text, top_k=1), [(0, "quick")])
+        self.assertEqual(index.most_common("zebra"), [])
+        self.assertEqual(index.most_common("brown brown dog"),
+                         [(1, 3), (0, 2), ("list", 1)])
+        self.assertEqual(index.containing("row"), [(0, 1), (1, 1)])
+        self.assertEqual(index.containing("umps"), [("list", 1)])
+        self.assertRaises(ValueError, index.containing, "ro")
+        self.assertRaises(ValueError, CorpusIndex().containing, "row")
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "corpus.idx")
+            index.save(path)
+            loaded = CorpusIndex.load(path)
+            with gzip.open(path) as file:
+                header = json.loads(file.readline().decode("utf-8"))
+            self.assertEqual(header["keys"], [0, 1, "list", 3])
+            with gzip.open(path, "wb") as file:
+                file.write(b"not an index")
+            self.assertRaises(ValueError, CorpusIndex.load, path)
+            valid = {"format": 2, "ngram": None, "keys": [0, 1],
+                     "tokens": ["a", "b"], "lengths": [1, 2]}
+            corrupted = [(dict(valid), [0, 0, 1]), (dict(valid), [0, 0, 2]),
+                         (dict(valid), [0, 1]), (dict(valid), [1, 1, 1])]
+            del corrupted[0][0]["lengths"]
+            corrupted[1][0]["ngram"] = "x"
+            for header, gaps in corrupted:
+                with gzip.open(path, "wb") as file:
+                    file.write(json.dumps(header).encode("utf-8") + b"\n")
+                    file.write(array.array("I", gaps).tobytes())
+                self.assertRaises(ValueError, CorpusIndex.load, path)
+            self.assertRaises(TypeError, CorpusIndex([["a", ("b",)]]).save,
+                              path)
+        self.assertEqual(loaded.most_common(text), index.most_common(text))
+        self.assertEqual(loaded.containing("umps"), [("list", 1)])
+        loaded.add("brown bear")
+        self.assertEqual(loaded.most_common("brown"),
+                         [(0, 1), (1, 1), (4, 1)])
+
     def test_is_iterable(self):
         class Test:
             def __iter__(self): return ["foo", "bar"]
@@ -253,6 +844,65 @@ class Test(unittest.TestCase):
         self.assertEqual(substr("asdf", 1.1), None)
         self.assertEqual(substr("asdf", 1, 2.1), None)
 
+    def test_lazy_import(self):
+        code = ("import sys, stringhelpers\n"
+                "print('stringhelpers.case' in sys.modules)\n"
+                "stringhelpers.upcase\n"
+                "print('stringhelpers.case' in sys.modules)\n"
+                "print('stringhelpers.search' in sys.modules)\n")
+        output = subprocess.check_output([sys.executable, "-c", code])
+        self.assertEqual(output.decode().split(), ["False", "True", "False"])
+
+        for name in stringhelpers.__all__:
+            self.assertTrue(hasattr(stringhelpers, name))
+        self.assertTrue(stringhelpers.batch is batch)
+        self.assertRaises(AttributeError, getattr, stringhelpers, "nothing")
+
+    def test_command_line(self):
+        def run(*args, **kwargs):
+            process = subprocess.run(
+                [sys.executable, "-m", "stringhelpers"] + list(args),
+                input=kwargs.get("input", b""), stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                cwd=os.path.dirname(os.path.abspath(__file__)))
+            return process.returncode, process.stdout, process.stderr
+
+        lines = b"Summer_08 Pictures.tar.gz\nno error here ERROR\nlast"
+        self.assertEqual(
+            run("-e", "humanize", "-e", "dasherize", "-e", "truncate:12",
+                input=lines)[1],
+            b"Summer-08-Pi...\nno-error-her...\nlast")
+        self.assertEqual(run("-e", "downcase", "-e", "dasherize",
+                             input=lines + b"\n")[1],
+                         b"summer-08-pictures.tar.gz\nno-error-here-error\n"
+                         b"last\n")
+        self.assertEqual(run("-e", "count:error", input=lines)[1],
+                         b"0\n2\n0")
+        self.assertEqual(run("-e", "count:item=error,case_sensitive=True",
+                             "--total", input=lines)[1], b"1\n")
+        status, output, errors = run("-e", "reverse", "-j", "2",
+                                     "--batch-size", "8", "--stats",
+                                     input=lines)
+        self.assertEqual(output, b"zg.rat.serutciP 80_remmuS\n"
+                                 b"RORRE ereh rorre on\ntsal")
+        self.assertIn(b"3 records", errors)
+        self.assertEqual(run("-z", "-e", "upcase", input=b"a b\0c")[1],
+                         b"A B\0C")
+        self.assertEqual(run("-e", "nothing", input=lines)[0], 2)
+        with tempfile.TemporaryDirectory() as directory:
+            paths = []
+            for i, data in enumerate([b"one\ntwo", b"three\nfour\n", b"x"]):
+                paths.append(os.path.join(directory, "%d.txt" % i))
+                with open(paths[-1], "wb") as file:
+                    file.write(data)
+            self.assertEqual(run("-e", "upcase", *paths)[1],
+                             b"ONE\nTWO\nTHREE\nFOUR\nX")
+            self.assertEqual(run("-e", "count_items", "--total", *paths)[1],
+                             b"5\n")
+        status, output, errors = run("-e", "upcase", "--total", input=lines)
+        self.assertEqual(status, 2)
+        self.assertIn(b"--total needs helpers returning numbers", errors)
+
 
 if __name__ == "__main__":
     unittest.main()